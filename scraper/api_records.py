@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tender records from the zakup.sk.kz search API JSON
+Maps the portal's own JSON payloads onto the same record shape that
+TenderScraper.extract_tenders_from_page builds from the DOM, plus the fields the DOM does not show
+"""
+
+import re
+import logging
+from datetime import datetime, date
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TENDER_URL_TEMPLATE = "https://zakup.sk.kz/#/ext(popup:item/{tender_id}/advert)?tabs=advert&adst=PUBLISHED&lst=PUBLISHED&page={page}"
+
+# Candidate keys per record field, most specific first. Dotted keys walk nested objects.
+FIELD_KEYS: Dict[str, List[str]] = {
+    "id": ["advertNumber", "number", "tenderNumber", "advertId", "id"],
+    "title": ["nameRu", "advertNameRu", "name", "title", "advertName"],
+    "status": ["tenderTypeNameRu", "purchaseMethodNameRu", "purchaseMethod.nameRu", "tenderType.nameRu",
+               "typeNameRu", "statusNameRu", "status"],
+    "value": ["sumTruNoNds", "sumNoNds", "totalSum", "sum", "amount", "price"],
+    "buyer_name": ["customerNameRu", "customer.nameRu", "customerName", "organizerNameRu", "organizer.nameRu",
+                   "buyerName"],
+    "publication_date": ["publishDate", "publicationDate", "acceptanceBeginDateTime", "startDate", "createdDate"],
+    "deadline_date": ["acceptanceEndDateTime", "endDate", "deadlineDate", "deadline"],
+    "location": ["deliveryPlaceRu", "deliveryPlace", "regionNameRu", "region.nameRu", "katoNameRu", "addressRu",
+                 "region"],
+    "category": ["categoryNameRu", "category.nameRu", "subjectTypeNameRu", "truTypeNameRu", "category"],
+    "description": ["descriptionRu", "description", "shortCharacteristicRu", "characteristicRu",
+                    "additionalCharacteristicRu"],
+    "requirements": ["qualificationRequirementsRu", "requirementsRu", "requirements", "conditionsRu"],
+}
+
+# Keys under which the detail API may wrap the tender object
+DETAIL_KEYS = ["advert", "tender", "data", "item"]
+
+# Keys under which paginated API responses usually carry their rows
+LIST_KEYS = ["content", "items", "data", "results", "adverts", "tenders", "list"]
+TOTAL_KEYS = ["totalElements", "total", "totalCount", "count", "totalItems"]
+
+
+def _lookup(item: Dict[str, Any], key: str) -> Any:
+    value: Any = item
+    for part in key.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _first(item: Dict[str, Any], field: str) -> Any:
+    for key in FIELD_KEYS[field]:
+        value = _lookup(item, key)
+        if value not in (None, "", []):
+            return value
+    return None
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        # Epoch milliseconds
+        return datetime.fromtimestamp(value / 1000 if value > 1e11 else value)
+    text = str(value).strip()
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S",
+                "%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%d.%m.%Y %H:%M", "%d.%m.%Y"):
+        try:
+            return datetime.strptime(text.replace("Z", "+0000"), fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def days_phrase(days: int) -> str:
+    """Russian day count as shown on the portal, e.g. '1 день', '3 дня', '6 дней'"""
+    if days % 10 == 1 and days % 100 != 11:
+        return f"{days} день"
+    if days % 10 in (2, 3, 4) and days % 100 not in (12, 13, 14):
+        return f"{days} дня"
+    return f"{days} дней"
+
+
+def format_value(value: Any) -> str:
+    """Format an amount like the portal does, e.g. '5 000 000,00 ₸'"""
+    try:
+        amount = float(str(value).replace(" ", "").replace("\xa0", "").replace(",", "."))
+    except (TypeError, ValueError):
+        return "0 ₸"
+    return f"{amount:,.2f}".replace(",", " ").replace(".", ",") + " ₸"
+
+
+def tender_from_api_item(item: Dict[str, Any], page: int, today: Optional[date] = None) -> Optional[Dict[str, Any]]:
+    """Build a tender record from one search API row; None when the row has no usable ID"""
+    raw_id = _first(item, "id")
+    if raw_id is None:
+        return None
+    tender_id = str(raw_id).replace("№", "").strip()
+
+    publication = _parse_date(_first(item, "publication_date"))
+    deadline = _parse_date(_first(item, "deadline_date"))
+    days_left = "N/A"
+    if deadline:
+        today = today or date.today()
+        days_left = days_phrase(max((deadline.date() - today).days, 0))
+
+    status = _first(item, "status")
+    if isinstance(status, dict):
+        status = status.get("nameRu") or status.get("name")
+
+    record = {
+        "id": tender_id,
+        "title": str(_first(item, "title") or "").strip(),
+        "status": str(status or "").strip(),
+        "days_left": days_left,
+        "value": format_value(_first(item, "value")),
+        "url": TENDER_URL_TEMPLATE.format(tender_id=tender_id, page=page),
+        "buyer_name": _text(_first(item, "buyer_name")),
+        "publication_date": publication.isoformat() if publication else None,
+        "deadline_date": deadline.isoformat() if deadline else None,
+        "location": _text(_first(item, "location")),
+        "category": _text(_first(item, "category")),
+    }
+    return record
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        value = value.get("nameRu") or value.get("name")
+    return re.sub(r"\s+", " ", str(value)).strip() or None
+
+
+def detail_fields(payload: Any) -> Dict[str, Any]:
+    """TenderData fields from a detail API response (the ones the search listing does not show)"""
+    item = payload if isinstance(payload, dict) else {}
+    for key in DETAIL_KEYS:
+        if isinstance(item.get(key), dict):
+            item = item[key]
+            break
+
+    publication = _parse_date(_first(item, "publication_date"))
+    deadline = _parse_date(_first(item, "deadline_date"))
+    return {
+        "buyer_name": _text(_first(item, "buyer_name")),
+        "location": _text(_first(item, "location")),
+        "category": _text(_first(item, "category")),
+        "description": _text(_first(item, "description")),
+        "requirements": _text(_first(item, "requirements")),
+        "publication_date": publication.isoformat() if publication else None,
+        "deadline_date": deadline.isoformat() if deadline else None,
+    }
+
+
+def find_tender_items(payload: Any) -> Optional[List[Dict[str, Any]]]:
+    """Locate the list of tender rows in a search response, or None if it isn't one"""
+    if isinstance(payload, list):
+        return [row for row in payload if isinstance(row, dict)]
+    if isinstance(payload, dict):
+        for key in LIST_KEYS:
+            rows = payload.get(key)
+            if isinstance(rows, list):
+                return [row for row in rows if isinstance(row, dict)]
+            if isinstance(rows, dict):
+                nested = find_tender_items(rows)
+                if nested is not None:
+                    return nested
+    return None
+
+
+def find_total_items(payload: Any, headers: Optional[Dict[str, str]] = None) -> Optional[int]:
+    """Total result count from the body, or from JHipster's X-Total-Count header"""
+    for name, value in (headers or {}).items():
+        if name.lower() == "x-total-count":
+            try:
+                return int(value)
+            except ValueError:
+                break
+    if isinstance(payload, dict):
+        for key in TOTAL_KEYS:
+            if isinstance(payload.get(key), int):
+                return payload[key]
+    return None
+
+
+def tenders_from_payload(payload: Any, page: int) -> Optional[List[Dict[str, Any]]]:
+    """All tender records in a search response; None when the payload has no tender list"""
+    rows = find_tender_items(payload)
+    if rows is None:
+        return None
+    records: Iterable[Optional[Dict[str, Any]]] = (tender_from_api_item(row, page) for row in rows)
+    return [record for record in records if record is not None]
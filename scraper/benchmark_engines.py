@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark the two worker engines (--engine processes / threads) on the live portal
+Each engine scrapes the same pages in a fresh interpreter while a sampler records peak RSS of the
+whole process tree, split into the Python side (interpreters) and the browsers, so the saving from
+sharing one interpreter shows up next to any throughput difference
+
+Usage: python benchmark_engines.py --pages 20 --workers 4 [--headless] [--extraction script]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import tempfile
+import threading
+import subprocess
+from multiprocessing import Manager
+import psutil
+from config import SCRAPING_CONFIG, EXTRACTION_MODES
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("processes", "threads")
+PYTHON_NAMES = ("python",)
+
+
+def tree_rss_mb() -> dict:
+    """RSS of this process and all descendants, split into Python processes and everything else (Chrome)"""
+    root = psutil.Process()
+    python, browser = 0, 0
+    for process in [root] + root.children(recursive=True):
+        try:
+            rss = process.memory_info().rss
+            if process.name().startswith(PYTHON_NAMES):
+                python += rss
+            else:
+                browser += rss
+        except psutil.Error:
+            continue
+    return {"python": python / 1024 / 1024, "browser": browser / 1024 / 1024}
+
+
+class RssSampler:
+    """Background sampler of the process tree's peak RSS"""
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self.peak = {"python": 0.0, "browser": 0.0, "total": 0.0}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def start(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def sample(self) -> None:
+        usage = tree_rss_mb()
+        usage["total"] = usage["python"] + usage["browser"]
+        for key, value in usage.items():
+            self.peak[key] = max(self.peak[key], value)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> dict:
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+        return {f"peak_{key}_mb": round(value, 1) for key, value in self.peak.items()}
+
+
+def run_engine(engine: str, pages: int, workers: int, headless: bool, extraction: str) -> dict:
+    """Scrape pages 1..pages with the given engine in this interpreter; returns timings and peak RSS"""
+    from main import create_worker_pool, run_page_queue
+    from scraper import probe_pagination_worker
+    from result_writer import start_writer, stop_writer
+    from session_pool import get_session_pool
+
+    args = argparse.Namespace(workers=workers, headless=headless, extraction=extraction, min_value=0,
+                              days_left=None, tabs=1)
+    sampler = RssSampler().start()
+    manager = Manager()
+    started = time.monotonic()
+    pool = create_worker_pool(engine, workers, headless, extraction)
+    try:
+        # Probing waits for the pool's prewarmed browsers, so the cold start is part of startup
+        pagination_info = pool.apply(probe_pagination_worker, ((headless, extraction),))
+        startup_seconds = time.monotonic() - started
+        page_list = list(range(1, min(pages, pagination_info['total_pages']) + 1))
+        with tempfile.TemporaryDirectory() as directory:
+            channel, writer_stats, writer = start_writer(
+                manager, os.path.join(directory, "benchmark.csv"), extraction_mode=extraction, headless=headless)
+            scrape_started = time.monotonic()
+            try:
+                reports = run_page_queue(pool, manager, args, page_list, channel, pagination_info, None, None)
+            finally:
+                stop_writer(channel, writer)
+            scrape_seconds = time.monotonic() - scrape_started
+            tenders = writer_stats.get('tenders', 0)
+    finally:
+        pool.close()
+        pool.join()
+        if engine == "threads":
+            get_session_pool(headless, extraction).close_all()
+        memory = sampler.stop()
+        manager.shutdown()
+
+    scraped = sum(report.get('pages', 0) for report in reports)
+    return dict(memory, engine=engine, workers=workers, pages=scraped, tenders=tenders,
+                startup_seconds=round(startup_seconds, 1), scrape_seconds=round(scrape_seconds, 1),
+                pages_per_minute=round(scraped / scrape_seconds * 60, 1) if scrape_seconds else 0.0)
+
+
+def benchmark(engines, pages: int, workers: int, headless: bool, extraction: str) -> list:
+    """Run each engine in its own interpreter, so neither inherits the other's memory or browsers"""
+    results = []
+    for engine in engines:
+        logger.info(f"⏱️ Benchmarking the {engine} engine: {workers} workers, {pages} pages")
+        command = [sys.executable, os.path.abspath(__file__), "--run-engine", engine, "--pages", str(pages),
+                   "--workers", str(workers), "--extraction", extraction]
+        if headless:
+            command.append("--headless")
+        completed = subprocess.run(command, stdout=subprocess.PIPE, text=True)
+        if completed.returncode != 0:
+            logger.error(f"❌ The {engine} engine run failed (exit code {completed.returncode})")
+            continue
+        # The child's result is the last line it printed
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def print_comparison(results: list) -> None:
+    print("\n========== WORKER ENGINE BENCHMARK ==========")
+    print(f"{'engine':<10} {'pages':>6} {'pages/min':>10} {'startup s':>10} "
+          f"{'python MB':>10} {'browser MB':>11} {'total MB':>9}")
+    for result in results:
+        print(f"{result['engine']:<10} {result['pages']:>6} {result['pages_per_minute']:>10} "
+              f"{result['startup_seconds']:>10} {result['peak_python_mb']:>10} "
+              f"{result['peak_browser_mb']:>11} {result['peak_total_mb']:>9}")
+    by_engine = {result['engine']: result for result in results}
+    if set(ENGINES) <= set(by_engine):
+        processes, threads = by_engine["processes"], by_engine["threads"]
+        print(f"✅ Threads saved {processes['peak_python_mb'] - threads['peak_python_mb']:.0f} MB of interpreter "
+              f"memory at {threads['pages_per_minute'] / max(processes['pages_per_minute'], 0.1):.2f}x "
+              f"the process engine's throughput")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the process and thread worker engines")
+    parser.add_argument('--pages', type=int, default=20, help="Pages scraped per engine")
+    parser.add_argument('--workers', type=int, default=4, help="Browser workers per engine")
+    parser.add_argument('--headless', action='store_true', help="Run Chrome in headless mode")
+    parser.add_argument('--extraction', choices=EXTRACTION_MODES, default=SCRAPING_CONFIG.extraction_mode,
+                        help="Extraction mode used by the workers")
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=list(ENGINES))
+    parser.add_argument('--run-engine', choices=ENGINES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_engine:
+        # Child run: logs go to stderr, the result to stdout
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr,
+                            format='%(asctime)s - %(levelname)s - %(message)s')
+        result = run_engine(args.run_engine, args.pages, args.workers, args.headless, args.extraction)
+        print(json.dumps(result))
+        return
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    print_comparison(benchmark(args.engines, args.pages, args.workers, args.headless, args.extraction))
+
+
+if __name__ == "__main__":
+    main()
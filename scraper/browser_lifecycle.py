@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Chrome process-tree lifecycle for the zakup.sk.kz scraper
+Every chromedriver is started in its own process group and registered on disk with the PID of the
+Python process that owns it. Closing a browser kills the whole group when quit() hangs or leaves
+renderers behind, and browsers whose owner died (a hard-killed pool worker) are reaped at the next
+startup. A sampler records peak /dev/shm use and Chrome's shared memory per run
+"""
+
+import os
+import json
+import time
+import shutil
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import psutil
+from config import SCRAPING_CONFIG, BROWSER_REGISTRY_DIR
+
+logger = logging.getLogger(__name__)
+
+SHM_PATH = "/dev/shm"
+CHROME_SHM_PREFIXES = (".org.chromium.", ".com.google.Chrome.")
+# Process names of chromedriver, Chrome and its helpers (chrome_crashpad_handler, chrome-headless-shell, ...)
+BROWSER_PROCESS_NAMES = ("chrome", "chromium")
+
+
+def _process_matches(pid: int, create_time: Optional[float]) -> bool:
+    """The PID is alive and is still the process we recorded (PIDs get reused)"""
+    try:
+        process = psutil.Process(pid)
+        return create_time is None or abs(process.create_time() - create_time) < 1.0
+    except psutil.Error:
+        return False
+
+
+def _is_browser_process(process: psutil.Process, since: Optional[float]) -> bool:
+    """
+    A Chrome or chromedriver process started no earlier than `since`
+    Process group ids are reused like PIDs, so a stored pgid alone never proves a process is ours
+    """
+    try:
+        if since is not None and process.create_time() < since - 1.0:
+            return False
+        name = process.name().lower()
+    except psutil.Error:
+        return False
+    return any(browser_name in name for browser_name in BROWSER_PROCESS_NAMES)
+
+
+def _browser_group_members(pgid: int, since: Optional[float], exclude=()) -> List[psutil.Process]:
+    members = []
+    for process in psutil.process_iter():
+        try:
+            if process.pid not in exclude and os.getpgid(process.pid) == pgid \
+                    and _is_browser_process(process, since):
+                members.append(process)
+        except (psutil.Error, OSError):
+            continue
+    return members
+
+
+def kill_process_tree(pid: int, pgid: Optional[int] = None, timeout: Optional[float] = None,
+                      since: Optional[float] = None) -> int:
+    """
+    SIGTERM a process, its descendants and (if given) its process group, then SIGKILL survivors
+    Renderers re-parented to init after chromedriver died are only reachable through the group; only
+    group members that are browser processes started at or after `since` are included
+    Returns how many processes were signalled
+    """
+    timeout = SCRAPING_CONFIG.browser_kill_timeout if timeout is None else timeout
+    processes: List[psutil.Process] = []
+    try:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        pass
+    if pgid is not None:
+        processes += _browser_group_members(pgid, since, exclude={process.pid for process in processes})
+
+    for process in processes:
+        try:
+            process.terminate()
+        except psutil.Error:
+            continue
+    _, alive = psutil.wait_procs(processes, timeout=timeout)
+    for process in alive:
+        try:
+            process.kill()
+        except psutil.Error:
+            continue
+    if alive:
+        psutil.wait_procs(alive, timeout=timeout)
+        logger.warning(f"Force-killed {len(alive)} browser processes that ignored SIGTERM")
+    return len(processes)
+
+
+class BrowserRegistry:
+    """One JSON file per running chromedriver, shared by every scraper process on the host"""
+
+    def __init__(self, directory: Path = BROWSER_REGISTRY_DIR):
+        self.directory = Path(directory)
+
+    def register(self, pid: int, pgid: Optional[int] = None) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            entry = {"pid": pid, "pgid": pgid, "create_time": psutil.Process(pid).create_time(),
+                     "owner_pid": os.getpid(), "owner_create_time": psutil.Process().create_time(),
+                     "started_at": time.time()}
+            (self.directory / f"{pid}.json").write_text(json.dumps(entry), encoding="utf-8")
+        except (OSError, psutil.Error) as e:
+            logger.debug(f"Could not register browser {pid}: {e}")
+
+    def unregister(self, pid: int) -> None:
+        try:
+            (self.directory / f"{pid}.json").unlink()
+        except OSError:
+            pass
+
+    def entries(self) -> List[Dict[str, Any]]:
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                entries.append(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+        return entries
+
+    def reap_orphans(self) -> int:
+        """Kill registered browsers whose owning Python process is gone; returns how many were reaped"""
+        reaped = 0
+        for entry in self.entries():
+            if _process_matches(entry["owner_pid"], entry.get("owner_create_time")):
+                continue  # Still owned by a live scraper process (possibly another run)
+            # Nothing older than the recorded chromedriver can belong to its tree
+            since = entry.get("create_time") or entry.get("started_at")
+            if _process_matches(entry["pid"], entry.get("create_time")):
+                killed = kill_process_tree(entry["pid"], entry["pgid"], since=since)
+            elif entry["pgid"] is not None:
+                killed = kill_process_group(entry["pgid"], since=since)
+            else:
+                killed = 0
+            if killed:
+                logger.warning(f"🧹 Reaped orphaned browser tree of chromedriver {entry['pid']} "
+                               f"({killed} processes, owner {entry['owner_pid']} is gone)")
+                reaped += 1
+            self.unregister(entry["pid"])
+        return reaped
+
+
+def kill_process_group(pgid: int, timeout: Optional[float] = None, since: Optional[float] = None) -> int:
+    """
+    Kill what is left of a browser's process group whose leader already exited
+    Only browser processes started at or after `since` are touched: the group id may have been reused
+    """
+    members = _browser_group_members(pgid, since)
+    return kill_process_tree(members[0].pid, pgid, timeout, since) if members else 0
+
+
+class BrowserProcessTree:
+    """The chromedriver process tree behind one WebDriver session"""
+
+    def __init__(self, driver, registry: Optional[BrowserRegistry] = None):
+        process = getattr(getattr(driver, "service", None), "process", None)
+        self.driver = driver
+        self.pid: Optional[int] = process.pid if process is not None else None
+        self.pgid: Optional[int] = None
+        self.create_time: Optional[float] = None
+        self.registry = registry or BrowserRegistry()
+        if self.pid is not None:
+            try:
+                self.create_time = psutil.Process(self.pid).create_time()
+                pgid = os.getpgid(self.pid)
+                # Only a group of its own may be killed as a whole, never the scraper's
+                self.pgid = pgid if pgid != os.getpgrp() else None
+            except (OSError, psutil.Error):
+                pass
+            self.registry.register(self.pid, self.pgid)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """driver.quit() with a deadline, then kill whatever is left of the tree; False if quit() hung"""
+        timeout = SCRAPING_CONFIG.browser_quit_timeout if timeout is None else timeout
+        quitter = threading.Thread(target=self._quit, name="driver-quit", daemon=True)
+        quitter.start()
+        quitter.join(timeout)
+        if quitter.is_alive():
+            logger.warning(f"driver.quit() still running after {timeout:.0f}s, killing the browser tree")
+        if self.pid is not None:
+            if _process_matches(self.pid, self.create_time):
+                leftovers = kill_process_tree(self.pid, self.pgid, since=self.create_time)
+            elif self.pgid is not None:
+                leftovers = kill_process_group(self.pgid, since=self.create_time)
+            else:
+                leftovers = 0
+            if leftovers:
+                logger.debug(f"Killed {leftovers} leftover processes of chromedriver {self.pid}")
+            self.registry.unregister(self.pid)
+        return not quitter.is_alive()
+
+    def _quit(self) -> None:
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting browser: {e}")
+
+
+def chrome_shm_dir() -> str:
+    """Where Chrome keeps its shared-memory files: /dev/shm, or the temp directory under --disable-dev-shm-usage"""
+    return SHM_PATH if SCRAPING_CONFIG.browser_dev_shm else tempfile.gettempdir()
+
+
+def shm_usage(chrome_dir: Optional[str] = None) -> Dict[str, int]:
+    """Bytes used on /dev/shm overall, and by Chrome's shared-memory files wherever Chrome puts them"""
+    try:
+        used = shutil.disk_usage(SHM_PATH).used
+    except OSError:
+        used = 0
+    chrome = 0
+    try:
+        with os.scandir(chrome_dir or chrome_shm_dir()) as entries:
+            for entry in entries:
+                if entry.name.startswith(CHROME_SHM_PREFIXES):
+                    try:
+                        chrome += entry.stat().st_blocks * 512
+                    except OSError:
+                        continue
+    except OSError:
+        pass
+    return {"used": used, "chrome": chrome}
+
+
+class ShmMonitor:
+    """Background sampler of /dev/shm use; start() at the beginning of a run, stop() for the peaks"""
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = SCRAPING_CONFIG.shm_sample_interval if interval is None else interval
+        self.chrome_dir = chrome_shm_dir()
+        self.baseline = shm_usage(self.chrome_dir)
+        self.peak = dict(self.baseline)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="shm-monitor", daemon=True)
+
+    def start(self) -> "ShmMonitor":
+        self._thread.start()
+        return self
+
+    def sample(self) -> None:
+        usage = shm_usage(self.chrome_dir)
+        for key, value in usage.items():
+            self.peak[key] = max(self.peak[key], value)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> Dict[str, Any]:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.sample()
+        return {
+            "peak_used_mb": round(self.peak["used"] / 1024 / 1024, 1),
+            "peak_chrome_mb": round(self.peak["chrome"] / 1024 / 1024, 1),
+            "baseline_used_mb": round(self.baseline["used"] / 1024 / 1024, 1),
+            "chrome_dir": self.chrome_dir,
+        }
+
+
+def reap_orphaned_browsers() -> int:
+    """Reap browser trees left behind by scraper processes that died without closing them"""
+    try:
+        return BrowserRegistry().reap_orphans()
+    except OSError as e:
+        logger.warning(f"Could not reap orphaned browsers: {e}")
+        return 0
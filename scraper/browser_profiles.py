@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Persistent Chrome profiles for scraper browsers
+Each browser takes a numbered profile slot (locked for as long as it runs) whose user data and
+disk cache survive between sessions and runs, so the portal's Angular bundle is served from the HTTP
+and code caches instead of being downloaded and compiled again. New slots start as a copy of a
+template profile, which is taken from the first slot a browser closed cleanly
+"""
+
+import os
+import fcntl
+import shutil
+import logging
+from pathlib import Path
+from typing import Optional
+from config import SCRAPING_CONFIG, PROFILE_DIR
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_NAME = "template"
+# Chrome's per-instance lock files, stale once the slot lock is ours
+SINGLETON_FILES = ("SingletonLock", "SingletonCookie", "SingletonSocket")
+
+
+def directory_size_mb(path: Path) -> float:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total / 1024 / 1024
+
+
+def _ignore_volatile(directory, names):
+    """Skip lock files and crash dumps when copying a profile"""
+    return [name for name in names if name in SINGLETON_FILES or name in ("Crashpad", "BrowserMetrics")]
+
+
+class ProfileSlot:
+    """An exclusively locked profile directory; the lock is a flock, so a killed browser's slot frees itself"""
+
+    def __init__(self, root: Path, index: int, lock_file):
+        self.root = Path(root)
+        self.index = index
+        self.path = self.root / f"slot-{index}"
+        self.cache_path = self.path / "cache"
+        self._lock_file = lock_file
+        self.state = "warm"  # warm (reused), cloned (from the template) or new
+
+    @classmethod
+    def acquire(cls, root: Path = PROFILE_DIR, max_slots: Optional[int] = None) -> Optional["ProfileSlot"]:
+        """Lock the first free slot and prepare its directory; None when every slot is taken"""
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        for index in range(max_slots or SCRAPING_CONFIG.profile_max_slots):
+            lock_file = open(root / f"slot-{index}.lock", "w")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                continue
+            slot = cls(root, index, lock_file)
+            slot._prepare()
+            return slot
+        logger.warning(f"All {max_slots or SCRAPING_CONFIG.profile_max_slots} profile slots are in use, "
+                       f"starting with a throwaway profile")
+        return None
+
+    def _prepare(self) -> None:
+        limit = SCRAPING_CONFIG.profile_max_mb
+        reset = False
+        if self.path.exists() and limit and directory_size_mb(self.path) > limit:
+            logger.info(f"Profile slot {self.index} is over {limit} MB, resetting it")
+            shutil.rmtree(self.path, ignore_errors=True)
+            reset = True
+        if not self.path.exists():
+            template = self.root / TEMPLATE_NAME
+            if template.exists():
+                shutil.copytree(template, self.path, ignore=_ignore_volatile, symlinks=True)
+                self.state = "cloned"
+            else:
+                self.path.mkdir(parents=True)
+                self.state = "new"
+            if reset:
+                self.state = f"reset, {self.state}"
+        for name in SINGLETON_FILES:
+            try:
+                os.unlink(self.path / name)
+            except OSError:
+                pass
+        logger.info(f"🗂️ Browser profile slot {self.index} ({self.state}): {self.path}")
+
+    def chrome_arguments(self) -> list:
+        """Chrome flags for this slot; the disk cache gets its own directory and size cap"""
+        arguments = [f"--user-data-dir={self.path}", f"--disk-cache-dir={self.cache_path}"]
+        if SCRAPING_CONFIG.profile_disk_cache_mb:
+            arguments.append(f"--disk-cache-size={SCRAPING_CONFIG.profile_disk_cache_mb * 1024 * 1024}")
+        return arguments
+
+    def release(self, clean: bool = True) -> None:
+        """
+        Unlock the slot once its browser is gone
+        After a clean shutdown the first slot to close also becomes the template for new slots
+        """
+        if self._lock_file is None:
+            return
+        if clean:
+            self._save_template()
+        fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        self._lock_file.close()
+        self._lock_file = None
+
+    def _save_template(self) -> None:
+        template = self.root / TEMPLATE_NAME
+        if template.exists():
+            return
+        with open(self.root / "template.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            if template.exists():
+                return
+            staging = self.root / f"{TEMPLATE_NAME}.{os.getpid()}"
+            try:
+                shutil.copytree(self.path, staging, ignore=_ignore_volatile, symlinks=True)
+                os.replace(staging, template)
+                logger.info(f"🗂️ Saved profile slot {self.index} as the template for new slots")
+            except OSError as e:
+                logger.warning(f"Could not save profile template: {e}")
+                shutil.rmtree(staging, ignore_errors=True)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Crash-safe checkpoint journal for browser scraping runs
+Every completed page is appended with its records as soon as it finishes, so a run that dies
+can be resumed with --resume <run-id>: only the missing pages are scraped and the journal is
+merged into the final output
+"""
+
+import os
+import json
+import shutil
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from config import CHECKPOINT_DIR
+
+logger = logging.getLogger(__name__)
+
+RUN_FILE = "run.json"
+
+
+def new_run_id() -> str:
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+class CheckpointJournal:
+    """
+    A run's journal directory: run.json with the run settings, plus one append-only JSONL file per
+    writing process, so pool workers never interleave writes in the same file
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.run_id = self.directory.name
+        self._file = None
+        self._file_pid = None
+
+    @classmethod
+    def create(cls, total_pages: int, settings: Optional[Dict[str, Any]] = None,
+               run_id: Optional[str] = None, root: Path = CHECKPOINT_DIR,
+               pagination: Optional[Dict[str, Any]] = None) -> "CheckpointJournal":
+        journal = cls(Path(root) / (run_id or new_run_id()))
+        journal.directory.mkdir(parents=True, exist_ok=True)
+        run_info = {"run_id": journal.run_id, "total_pages": total_pages, "settings": settings or {},
+                    "pagination": pagination, "started_at": datetime.now().isoformat()}
+        (journal.directory / RUN_FILE).write_text(json.dumps(run_info), encoding="utf-8")
+        return journal
+
+    @classmethod
+    def open(cls, run_id: str, root: Path = CHECKPOINT_DIR) -> "CheckpointJournal":
+        journal = cls(Path(root) / run_id)
+        if not (journal.directory / RUN_FILE).exists():
+            raise FileNotFoundError(f"No checkpoint journal for run {run_id} in {root}")
+        return journal
+
+    @property
+    def run_info(self) -> Dict[str, Any]:
+        return json.loads((self.directory / RUN_FILE).read_text(encoding="utf-8"))
+
+    def record_page(self, page: int, records: List[Dict[str, Any]], refetch: bool = False) -> None:
+        """
+        Append one completed page and flush it to disk before returning
+        A refetch entry adds the tenders a boundary re-fetch found to the page instead of replacing it
+        """
+        if self._file is None or self._file_pid != os.getpid():
+            self._file = open(self.directory / f"pages-{os.getpid()}.jsonl", "a", encoding="utf-8")
+            self._file_pid = os.getpid()
+        entry = {"page": page, "records": records}
+        if refetch:
+            entry["refetch"] = True
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _entries(self) -> Iterable[Dict[str, Any]]:
+        for path in sorted(self.directory.glob("pages-*.jsonl")):
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # A process killed mid-write leaves a truncated last line; that page is simply redone
+                        logger.warning(f"Skipping truncated checkpoint entry in {path.name}")
+
+    def pages(self) -> Dict[int, List[Dict[str, Any]]]:
+        """Completed pages and their records (a page journaled twice keeps its latest entry plus refetch entries)"""
+        pages: Dict[int, List[Dict[str, Any]]] = {}
+        extra: Dict[int, List[Dict[str, Any]]] = {}
+        for entry in self._entries():
+            if entry.get("refetch"):
+                extra.setdefault(entry["page"], []).extend(entry["records"])
+            else:
+                pages[entry["page"]] = entry["records"]
+        for page, records in extra.items():
+            pages.setdefault(page, []).extend(records)
+        return pages
+
+    def iter_pages(self) -> Iterable[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Stream (page, records) without loading the whole journal
+        A page journaled twice is yielded once, with its latest entry as in pages(); refetch entries are
+        yielded as they come. The first pass only notes where each page's latest entry is
+        """
+        latest: Dict[int, int] = {}
+        for position, entry in enumerate(self._entries()):
+            if not entry.get("refetch"):
+                latest[entry["page"]] = position
+        for position, entry in enumerate(self._entries()):
+            if entry.get("refetch") or latest.get(entry["page"]) == position:
+                yield entry["page"], entry["records"]
+
+    def completed_pages(self) -> Set[int]:
+        return {entry["page"] for entry in self._entries()}
+
+    def missing_pages(self) -> List[int]:
+        done = self.completed_pages()
+        return [page for page in range(1, self.run_info["total_pages"] + 1) if page not in done]
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Every journaled record, in page order"""
+        pages = self.pages()
+        return [record for page in sorted(pages) for record in pages[page]]
+
+    def __getstate__(self):
+        # Passed to pool workers: each process opens its own journal file
+        return {"directory": self.directory}
+
+    def __setstate__(self, state):
+        self.__init__(state["directory"])
+
+    def close(self) -> None:
+        if self._file is not None and self._file_pid == os.getpid():
+            self._file.close()
+        self._file = None
+
+    def discard(self) -> None:
+        """Remove the journal once its run has been saved in full"""
+        self.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
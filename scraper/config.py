@@ -24,6 +24,19 @@ TENDER_PAGE_URL: str = "https://zakup.sk.kz/#/ext(popup:search)?tabs=tenders&ads
 TENDER_DETAIL_API: str = "https://zakup.sk.kz/api/tenders/{tender_id}"
 TENDER_SEARCH_API: str = "https://zakup.sk.kz/api/search"
 
+# Query parameters sent to TENDER_SEARCH_API (page and size are added per request)
+SEARCH_API_PARAMS: Dict[str, Any] = {"adst": "PUBLISHED", "lst": "PUBLISHED"}
+
+# Index of the first page in the search API (Spring/JHipster pages start at 0)
+SEARCH_API_FIRST_PAGE: int = 0
+
+# Sort that lists the newest tenders first (incremental scrapes stop once pages contain nothing new)
+NEWEST_FIRST_PARAMS: Dict[str, str] = {"sort": "publishDate,desc"}
+TENDER_NEWEST_URL: str = TENDER_URL + "".join(f"&{key}={value}" for key, value in NEWEST_FIRST_PARAMS.items())
+
+# Regex matched against XHR URLs to recognise the SPA's own search responses (network extraction mode)
+SEARCH_XHR_PATTERN: str = r"/api/.*(search|adverts)"
+
 # =============================================================================
 # PAGINATION SETTINGS
 # =============================================================================
@@ -31,6 +44,9 @@ TENDER_SEARCH_API: str = "https://zakup.sk.kz/api/search"
 # Number of tenders displayed per page on zakup.sk.kz
 TENDERS_PER_PAGE: int = 20
 
+# Page sizes tried for the search route's "size" parameter, largest first (the portal shows 10 by default)
+PAGE_SIZE_CANDIDATES: List[int] = [100, 50, 25, 20]
+
 # Maximum number of pages to scrape (0 = unlimited)
 MAX_PAGES: int = 0
 
@@ -51,6 +67,26 @@ CSV_FIELDS: List[str] = [
     "url"           # Direct URL to tender details
 ]
 
+# Fields filled in from tender detail views by the enrichment stage
+ENRICHED_FIELDS: List[str] = [
+    "buyer_name",
+    "location",
+    "category",
+    "description",
+    "publication_date",
+    "deadline_date",
+    "requirements"
+]
+
+# Fields the search API returns beyond the list columns (network extraction and the HTTP backend)
+API_FIELDS: List[str] = [
+    "buyer_name",
+    "publication_date",
+    "deadline_date",
+    "location",
+    "category"
+]
+
 # Extended fields for JSON export (includes additional metadata)
 JSON_FIELDS: List[str] = CSV_FIELDS + [
     "scraped_at",       # Timestamp when data was scraped
@@ -86,16 +122,73 @@ class ScrapingConfig:
     element_wait_timeout: int = 10
     retry_delay: float = 2.0
     max_retry_delay: float = 16.0
+    readiness_poll_interval: float = 0.25  # How often readiness signals are polled
+    readiness_settle_time: float = 0.5  # Tender item count must hold this long to count as settled
     
     # Worker settings
     max_workers: int = 4
     default_workers: Optional[int] = None  # Uses CPU count if None
+    session_pool_max_idle: int = 1  # Warm browser sessions kept per process between page ranges
+    page_batch_size: int = 1  # Pages a worker takes from the shared queue at a time
+    page_max_attempts: int = 3  # Attempts per page (across workers) before it is given up
+    result_queue_size: int = 32  # Pages waiting for the result writer before workers block
+    tabs_per_browser: int = 1  # Result pages each worker's browser loads concurrently in separate tabs
+    worker_max_restarts: int = 5  # Browsers a worker may respawn after its session died, per task
+    recycle_after_pages: int = 150  # Restart a worker's browser after this many pages (0 = never)
+    recycle_max_rss_mb: float = 1500.0  # ...or once Chrome's process tree uses this much memory (0 = never)
+    recycle_rss_check_every: int = 5  # Pages between RSS checks
     
     # Browser settings
     headless_mode: bool = True
     disable_images: bool = True
     disable_javascript: bool = False
+    
+    # Request blocking (DevTools Network.setBlockedURLs); "Image" is added when disable_images is set.
+    # Images are blocked only there (no imagesEnabled=false switch), so blocked images show up in the page stats
+    blocked_resource_types: List[str] = field(default_factory=lambda: ["Font", "Media"])
+    blocked_domains: List[str] = field(default_factory=lambda: [
+        "google-analytics.com", "googletagmanager.com", "mc.yandex.ru", "connect.facebook.net", "facebook.com"
+    ])
+    allowed_domains: List[str] = field(default_factory=lambda: ["zakup.sk.kz"])  # Never blocked by domain
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    browser_process_groups: bool = True  # Start each chromedriver in its own process group
+    browser_quit_timeout: float = 10.0  # Seconds driver.quit() may take before the tree is killed
+    browser_kill_timeout: float = 3.0  # Seconds between SIGTERM and SIGKILL for leftover processes
+    shm_sample_interval: float = 2.0  # Seconds between /dev/shm samples during a run
+    # Chrome shared memory on /dev/shm (size it to ~1 GB per browser, e.g. docker --shm-size); when off,
+    # Chrome gets --disable-dev-shm-usage and keeps its segments in the temp directory instead
+    browser_dev_shm: bool = os.getenv("SCRAPER_BROWSER_DEV_SHM", "0") == "1"
+    persistent_profiles: bool = os.getenv("SCRAPER_PERSISTENT_PROFILES", "0") == "1"  # Reuse profile slots
+    profile_max_slots: int = 16  # Profile slots per host (one per concurrently running browser)
+    profile_disk_cache_mb: int = 200  # Chrome --disk-cache-size per slot (0 = Chrome's default)
+    profile_max_mb: int = 500  # A slot larger than this is reset (re-cloned) when it is next used
+    # Fall back to downloading chromedriver when none is found locally (set to 0 for offline hosts)
+    allow_driver_download: bool = os.getenv("SCRAPER_ALLOW_DRIVER_DOWNLOAD", "1") == "1"
+    # "local" starts chromedriver on this host, "remote" opens sessions on Selenium Grid / standalone servers
+    driver_backend: str = os.getenv("SCRAPER_DRIVER_BACKEND", "local")
+    remote_webdriver_urls: List[str] = field(default_factory=lambda: [
+        url.strip() for url in os.getenv("SCRAPER_WEBDRIVER_URLS", "").split(",") if url.strip()
+    ])  # Grid hubs or standalone servers, e.g. http://grid:4444
+    remote_status_timeout: float = 5.0  # Seconds an endpoint's /status may take to answer
+    remote_capacity_wait: float = 120.0  # Seconds to wait for a free Chrome slot on any endpoint
+    
+    # Extraction settings
+    # "script" reads the whole page in one execute_script call,
+    # "elements" walks div.m-found-item with per-element WebDriver calls,
+    # "network" builds records from the search XHR JSON captured via the DevTools log,
+    # "snapshot" hands page_source to a pool of lxml parser processes
+    extraction_mode: str = "script"
+    parser_processes: int = 2  # Parser processes used by snapshot extraction
+    # "spa" pages inside the running Angular app (click / router), "url" reloads the page URL
+    navigation_strategy: str = "spa"
+    pagination_cache_ttl: float = 300.0  # Seconds a probed page count is reused before probing again
+    track_page_boundaries: bool = True  # Record page IDs/totals and re-fetch boundaries that shifted
+    boundary_refetch_rounds: int = 2  # Re-fetch passes before unsettled boundaries are reported
+    probe_page_size: bool = True  # Look for the largest page size the search route accepts
+    page_size_probe_timeout: float = 8.0  # Readiness ceiling per page size candidate
+    
+    # Incremental scraping: stop after this many consecutive pages with no new or changed tenders
+    incremental_stop_after: int = 2
     
     # Error handling
     max_retries: int = 5
@@ -104,10 +197,24 @@ class ScrapingConfig:
     # Rate limiting
     request_delay_min: float = 0.5
     request_delay_max: float = 2.0
-    requests_per_minute: int = 30
+    requests_per_minute: int = 30  # Page loads per minute across all workers (0 = no budget)
+    # Adaptive concurrency (AIMD): start with this many workers loading pages at once, add one per
+    # healthy window up to --workers, multiply by the decrease factor on failed or slow pages
+    throttle_initial_concurrency: int = 2
+    throttle_slow_page_seconds: float = 10.0
+    throttle_decrease_factor: float = 0.5
+    throttle_cooldown_seconds: float = 10.0  # At most one back-off per this many seconds
+    
+    # HTTP backend settings
+    http_concurrency: int = 8  # Concurrent search API requests (and pooled connections)
+    
+    # Detail enrichment settings
+    enrichment_concurrency: int = 4  # Detail views fetched at once (API requests or in-browser fetches)
+    enrichment_max_age_hours: float = 24.0  # Re-check cached details this old even if the listing is unchanged
 
 # Default scraping configuration
 SCRAPING_CONFIG = ScrapingConfig()
+EXTRACTION_MODES = ("script", "elements", "network", "snapshot")
 
 # =============================================================================
 # DATABASE CONNECTION SETTINGS
@@ -223,6 +330,30 @@ CSV_FILENAME_PATTERN: str = "tender_data_{timestamp}.csv"
 JSON_FILENAME_PATTERN: str = "tender_data_{timestamp}.json"
 LOG_FILENAME_PATTERN: str = "scraper_{timestamp}.log"
 
+# Per-host cache of resolved Chrome/chromedriver locations
+DRIVER_CACHE_FILE: Path = Path(os.getenv(
+    "TENDERFLOW_DRIVER_CACHE", Path.home() / ".cache" / "tenderflow" / "chrome_binaries.json"
+))
+
+# Running chromedriver process trees and their owning scraper process, reaped once the owner is gone
+BROWSER_REGISTRY_DIR: Path = Path(os.getenv(
+    "TENDERFLOW_BROWSER_REGISTRY", Path.home() / ".cache" / "tenderflow" / "browsers"
+))
+
+# Persistent Chrome profile slots (user data and disk cache) and the template new slots are cloned from
+PROFILE_DIR: Path = Path(os.getenv(
+    "TENDERFLOW_PROFILE_DIR", Path.home() / ".cache" / "tenderflow" / "profiles"
+))
+
+# Cache of enriched tender details (detail hash, ETag and extracted fields per tender)
+DETAIL_CACHE_FILE: Path = OUTPUT_DIR / "detail_cache.json"
+
+# Local index of tenders already scraped, used by incremental runs when the database is not used
+KNOWN_TENDERS_FILE: Path = OUTPUT_DIR / "known_tenders.json"
+
+# Per-run checkpoint journals (completed pages and their records), used by --resume
+CHECKPOINT_DIR: Path = OUTPUT_DIR / "checkpoints"
+
 # Archive settings
 ARCHIVE_DIR: Path = OUTPUT_DIR / "archive"
 ARCHIVE_DIR.mkdir(exist_ok=True)
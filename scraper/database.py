@@ -322,6 +322,24 @@ class DatabaseManager:
             logger.error(f"❌ Failed to get tender {tender_id}: {e}")
             return None
     
+    def get_known_tenders(self) -> List[Dict[str, Any]]:
+        """Get the fields of every stored tender that incremental scraping compares against."""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+                cursor.execute("""
+                    SELECT id, title, status, value FROM tenders
+                    WHERE archived = FALSE
+                """)
+                results = cursor.fetchall()
+                cursor.close()
+
+                return [dict(row) for row in results]
+
+        except Exception as e:
+            logger.error(f"❌ Failed to get known tenders: {e}")
+            return []
+
     def get_tenders_for_notification(self, urgency_levels: List[str] = None) -> List[Dict[str, Any]]:
         """Get tenders that need notification."""
         if not urgency_levels:
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Chrome DevTools performance-log helpers for the zakup.sk.kz scraper
+Drains chromedriver's performance log once and hands Network events to every interested consumer
+"""
+
+import json
+import base64
+import logging
+from typing import Any, Callable, Dict, List, Optional
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+DevToolsEvent = Dict[str, Any]
+
+
+def enable_performance_log(options: webdriver.ChromeOptions) -> None:
+    """Ask chromedriver to record DevTools Network events in the performance log"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+class DevToolsEventLog:
+    """
+    Reads the performance log for a driver
+    get_log('performance') empties chromedriver's buffer, so all consumers must go through poll()
+    """
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self._listeners: List[Callable[[DevToolsEvent], None]] = []
+
+    def add_listener(self, listener: Callable[[DevToolsEvent], None]) -> None:
+        self._listeners.append(listener)
+
+    def poll(self) -> List[DevToolsEvent]:
+        """Drain new events, notify listeners and return the events as {'method', 'params'} dicts"""
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException as e:
+            logger.debug(f"Could not read performance log: {e}")
+            return []
+
+        events = []
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            event = {"method": message.get("method"), "params": message.get("params", {})}
+            events.append(event)
+            for listener in self._listeners:
+                try:
+                    listener(event)
+                except Exception as e:
+                    logger.debug(f"DevTools listener failed on {event['method']}: {e}")
+        return events
+
+    def get_response_body(self, request_id: str) -> Optional[str]:
+        """Fetch a captured response body; Chrome only keeps bodies for recent requests"""
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except WebDriverException as e:
+            logger.debug(f"Response body for {request_id} no longer available: {e}")
+            return None
+        body = result.get("body")
+        if body is not None and result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8", errors="replace")
+        return body
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Chrome/chromedriver bootstrap for the zakup.sk.kz scraper
+Resolves the browser binaries once per host (honoring CHROME_BIN / CHROMEDRIVER_PATH),
+works without network access and records a cold-start timing breakdown
+"""
+
+import os
+import json
+import time
+import fcntl
+import shutil
+import socket
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple, TypeVar
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from config import SCRAPING_CONFIG, DRIVER_CACHE_FILE
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CHROME_CANDIDATES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+
+@dataclass
+class ChromeBinaries:
+    """Resolved browser and driver locations"""
+    chromedriver_path: str
+    chrome_binary: Optional[str] = None
+    source: str = "path"  # env, cache, path or webdriver-manager
+
+
+@dataclass
+class ColdStartTimings:
+    """Where the time goes between asking for a browser and seeing the first page"""
+    resolve_seconds: float = 0.0
+    spawn_seconds: float = 0.0
+    first_page_seconds: Optional[float] = None
+    profile: Optional[str] = None  # Persistent profile slot state, if one is used
+    endpoint: Optional[str] = None  # WebDriver URL the session runs on (remote backend)
+
+    def summary(self) -> str:
+        first_page = f"{self.first_page_seconds:.2f}s" if self.first_page_seconds is not None else "n/a"
+        profile = f", {self.profile} profile" if self.profile else ""
+        endpoint = f", on {self.endpoint}" if self.endpoint else ""
+        return (f"resolve {self.resolve_seconds:.2f}s, spawn {self.spawn_seconds:.2f}s, "
+                f"first page {first_page}{profile}{endpoint}")
+
+
+def _is_executable(path: Optional[str]) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _from_env() -> Optional[ChromeBinaries]:
+    driver_path = os.getenv("CHROMEDRIVER_PATH")
+    chrome_binary = os.getenv("CHROME_BIN")
+    if _is_executable(driver_path):
+        return ChromeBinaries(driver_path, chrome_binary if _is_executable(chrome_binary) else None, "env")
+    if driver_path:
+        logger.warning(f"CHROMEDRIVER_PATH={driver_path} is not an executable file, ignoring it")
+    return None
+
+
+def _from_host_cache() -> Optional[ChromeBinaries]:
+    try:
+        with open(DRIVER_CACHE_FILE, encoding="utf-8") as f:
+            entry = json.load(f).get(socket.gethostname())
+    except (OSError, ValueError):
+        return None
+    if not entry or not _is_executable(entry.get("chromedriver_path")):
+        return None
+    if entry.get("chrome_binary") and not _is_executable(entry["chrome_binary"]):
+        return None
+    return ChromeBinaries(entry["chromedriver_path"], entry.get("chrome_binary"), "cache")
+
+
+def _from_path() -> Optional[ChromeBinaries]:
+    driver_path = shutil.which("chromedriver")
+    if not driver_path:
+        return None
+    chrome_binary = next((shutil.which(name) for name in CHROME_CANDIDATES if shutil.which(name)), None)
+    return ChromeBinaries(driver_path, chrome_binary, "path")
+
+
+def _from_webdriver_manager() -> Optional[ChromeBinaries]:
+    # Last resort: this is the only step that needs network access
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeBinaries(ChromeDriverManager().install(), None, "webdriver-manager")
+
+
+def _write_host_cache(binaries: ChromeBinaries) -> None:
+    try:
+        DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(DRIVER_CACHE_FILE, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        entry = asdict(binaries)
+        entry.pop("source")
+        cache[socket.gethostname()] = entry
+        tmp_path = DRIVER_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, DRIVER_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write driver cache {DRIVER_CACHE_FILE}: {e}")
+
+
+@lru_cache(maxsize=1)
+def resolve_chrome_binaries() -> ChromeBinaries:
+    """
+    Resolve chromedriver (and Chrome) once per process, backed by a per-host cache file
+    Order: CHROME_BIN/CHROMEDRIVER_PATH, host cache, PATH, then webdriver-manager if downloads are allowed
+    """
+    binaries = _from_env()
+    if binaries:
+        return binaries
+
+    DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # Serialize resolution so parallel workers on one host don't all hit webdriver-manager
+    with open(DRIVER_CACHE_FILE.with_suffix(".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        binaries = _from_host_cache() or _from_path()
+        if binaries is None:
+            if not SCRAPING_CONFIG.allow_driver_download:
+                raise RuntimeError(
+                    "No chromedriver found (set CHROMEDRIVER_PATH or put chromedriver on PATH); "
+                    "driver downloads are disabled"
+                )
+            binaries = _from_webdriver_manager()
+        if binaries.source != "cache":
+            _write_host_cache(binaries)
+
+    logger.info(f"Resolved chromedriver from {binaries.source}: {binaries.chromedriver_path}")
+    return binaries
+
+
+def create_chrome_driver(options: webdriver.ChromeOptions) -> Tuple[webdriver.Chrome, ColdStartTimings]:
+    """Start a local Chrome with resolved binaries and return it with its cold-start timings"""
+    timings = ColdStartTimings()
+
+    started = time.monotonic()
+    binaries = resolve_chrome_binaries()
+    timings.resolve_seconds = time.monotonic() - started
+
+    if binaries.chrome_binary:
+        options.binary_location = binaries.chrome_binary
+
+    # A process group of its own lets the lifecycle manager kill Chrome's whole tree, renderers included
+    popen_kw = {"start_new_session": True} if SCRAPING_CONFIG.browser_process_groups else {}
+    started = time.monotonic()
+    driver = webdriver.Chrome(service=Service(binaries.chromedriver_path, popen_kw=popen_kw), options=options)
+    timings.spawn_seconds = time.monotonic() - started
+    return driver, timings
+
+
+def create_driver(options: webdriver.ChromeOptions) -> Tuple[webdriver.Remote, ColdStartTimings]:
+    """Start a browser on the configured backend: local chromedriver or a remote WebDriver endpoint"""
+    backend = SCRAPING_CONFIG.driver_backend
+    if backend == "remote":
+        from remote_driver import create_remote_driver
+        return create_remote_driver(options)
+    if backend != "local":
+        raise ValueError(f"Unknown driver backend: {backend}")
+    return create_chrome_driver(options)
+
+
+def launch_in_parallel(factory: Callable[[], T], count: int) -> List[T]:
+    """Run `count` browser launches concurrently; failed launches are logged and skipped"""
+    if count <= 0:
+        return []
+    launched = []
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(factory) for _ in range(count)]
+        for future in as_completed(futures):
+            try:
+                launched.append(future.result())
+            except Exception as e:
+                logger.error(f"❌ Browser launch failed: {e}")
+    return launched
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Detail-page enrichment stage for the zakup.sk.kz scraper
+Fetches detail views for tenders found by the list pass, with its own concurrency limit, and fills
+the TenderData fields the listing does not show. Tenders whose details have not changed are served
+from a local cache, so the cost follows churn rather than catalogue size
+"""
+
+import json
+import time
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from config import DETAIL_CACHE_FILE, TENDER_DETAIL_API, ENRICHED_FIELDS, SCRAPING_CONFIG
+from api_records import detail_fields
+from known_tenders import tender_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# (tender_id, cached ETag) -> (detail JSON or None when not modified, ETag)
+DetailRequest = Tuple[str, Optional[str]]
+DetailResponse = Tuple[Optional[Dict[str, Any]], Optional[str]]
+
+# Fetches a batch of detail URLs from inside the page, so requests carry the portal session
+FETCH_DETAILS_JS = """
+const [requests, done] = [arguments[0], arguments[arguments.length - 1]];
+Promise.all(requests.map(([url, etag]) =>
+    fetch(url, {credentials: 'include', headers: etag ? {'If-None-Match': etag} : {}})
+        .then(r => r.status === 304 ? {status: 304, etag: etag}
+              : r.text().then(body => ({status: r.status, etag: r.headers.get('ETag'), body: body})))
+        .catch(e => ({status: 0, error: String(e)}))
+)).then(done);
+"""
+
+
+def detail_hash(payload: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class DetailCache:
+    """Tender ID -> listing fingerprint, ETag, detail hash and extracted fields, kept in a JSON file"""
+
+    def __init__(self, path: Path = DETAIL_CACHE_FILE):
+        self.path = Path(path)
+        try:
+            self.entries: Dict[str, Dict[str, Any]] = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self.entries = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read detail cache {self.path}: {e}")
+            self.entries = {}
+
+    def get(self, tender_id: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(tender_id)
+
+    def put(self, tender_id: str, entry: Dict[str, Any]) -> None:
+        self.entries[tender_id] = entry
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.entries, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+class ApiDetailFetcher:
+    """Detail views from TENDER_DETAIL_API over a pooled HTTP session"""
+
+    def __init__(self, concurrency: Optional[int] = None, detail_url: str = TENDER_DETAIL_API):
+        from http_client import TenderApiClient
+        self.concurrency = concurrency or SCRAPING_CONFIG.enrichment_concurrency
+        self.client = TenderApiClient(detail_url=detail_url, concurrency=self.concurrency)
+
+    def fetch_many(self, requests: List[DetailRequest]) -> List[Any]:
+        """One DetailResponse (or the exception raised) per request, in order"""
+        def fetch(request: DetailRequest) -> Any:
+            try:
+                return self.client.fetch_detail_if_changed(*request)
+            except Exception as e:
+                return e
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(executor.map(fetch, requests))
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class BrowserDetailFetcher:
+    """Detail views fetched by the page itself in a running scraper session, a batch per script call"""
+
+    def __init__(self, driver, concurrency: Optional[int] = None, detail_url: str = TENDER_DETAIL_API):
+        self.driver = driver
+        self.concurrency = concurrency or SCRAPING_CONFIG.enrichment_concurrency
+        self.detail_url = detail_url
+        self.driver.set_script_timeout(SCRAPING_CONFIG.page_load_timeout)
+
+    def fetch_many(self, requests: List[DetailRequest]) -> List[Any]:
+        results: List[Any] = []
+        for i in range(0, len(requests), self.concurrency):
+            batch = requests[i:i + self.concurrency]
+            try:
+                responses = self.driver.execute_async_script(
+                    FETCH_DETAILS_JS, [[self.detail_url.format(tender_id=tid), etag] for tid, etag in batch])
+            except Exception as e:
+                results.extend([e] * len(batch))
+                continue
+            results.extend(self._to_result(response) for response in responses)
+        return results
+
+    @staticmethod
+    def _to_result(response: Dict[str, Any]) -> Any:
+        if response.get("status") == 304:
+            return None, response.get("etag")
+        if response.get("status") != 200:
+            return IOError(response.get("error") or f"HTTP {response.get('status')}")
+        try:
+            return json.loads(response["body"]), response.get("etag")
+        except ValueError as e:
+            return e
+
+    def close(self) -> None:
+        pass
+
+
+class DetailEnricher:
+    """Fills ENRICHED_FIELDS on list-pass records, fetching only tenders that may have changed"""
+
+    def __init__(self, fetcher, cache: Optional[DetailCache] = None, max_age_hours: Optional[float] = None):
+        self.fetcher = fetcher
+        self.cache = cache if cache is not None else DetailCache()
+        self.max_age = (max_age_hours if max_age_hours is not None
+                        else SCRAPING_CONFIG.enrichment_max_age_hours) * 3600
+        self.stats = {'cached': 0, 'not_modified': 0, 'unchanged': 0, 'updated': 0, 'failed': 0}
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]], tender: Dict[str, Any]) -> bool:
+        return (entry is not None
+                and entry.get("list_fingerprint") == tender_fingerprint(tender)
+                and time.time() - entry.get("checked_at", 0) < self.max_age)
+
+    def enrich(self, tenders: List[Dict[str, Any]], save_cache: bool = True) -> List[Dict[str, Any]]:
+        """Fill detail fields in place and return the tenders (callers enriching page by page save the cache once)"""
+        pending = []
+        for tender in tenders:
+            entry = self.cache.get(str(tender.get("id")))
+            if self._is_fresh(entry, tender):
+                self._apply(tender, entry)
+                self.stats['cached'] += 1
+            else:
+                pending.append(tender)
+
+        if pending:
+            logger.info(f"🔍 Fetching details for {len(pending)} of {len(tenders)} tenders")
+            requests = [(str(t["id"]), (self.cache.get(str(t["id"])) or {}).get("etag")) for t in pending]
+            for tender, result in zip(pending, self.fetcher.fetch_many(requests)):
+                self._store(tender, result)
+            if save_cache:
+                self.cache.save()
+
+        logger.info(f"✅ Enrichment: {self.stats['cached']} cached, {self.stats['not_modified']} not modified, "
+                    f"{self.stats['unchanged']} unchanged, {self.stats['updated']} updated, "
+                    f"{self.stats['failed']} failed")
+        return tenders
+
+    def _store(self, tender: Dict[str, Any], result: Any) -> None:
+        tender_id = str(tender["id"])
+        entry = self.cache.get(tender_id)
+        if isinstance(result, Exception):
+            logger.error(f"❌ Failed to fetch details for tender {tender_id}: {result}")
+            self.stats['failed'] += 1
+            if entry:
+                self._apply(tender, entry)
+            return
+
+        payload, etag = result
+        if payload is None and entry:
+            self.stats['not_modified'] += 1
+        elif payload is not None and entry and entry.get("detail_hash") == detail_hash(payload):
+            self.stats['unchanged'] += 1
+        elif payload is not None:
+            entry = {"detail_hash": detail_hash(payload), "fields": detail_fields(payload)}
+            self.stats['updated'] += 1
+        else:
+            # 304 for a tender with no cache entry: nothing to fill in
+            self.stats['failed'] += 1
+            return
+
+        entry.update(list_fingerprint=tender_fingerprint(tender), etag=etag, checked_at=time.time())
+        self.cache.put(tender_id, entry)
+        self._apply(tender, entry)
+
+    @staticmethod
+    def _apply(tender: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        for field in ENRICHED_FIELDS:
+            value = entry.get("fields", {}).get(field)
+            if value is not None:
+                tender[field] = value
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Browserless HTTP backend for the zakup.sk.kz scraper
+Pages through TENDER_SEARCH_API with a pooled requests session and returns the same
+records as TenderScraper.extract_tenders_from_page
+"""
+
+import math
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import (
+    TENDER_SEARCH_API, TENDER_DETAIL_API, SEARCH_API_PARAMS, SEARCH_API_FIRST_PAGE,
+    TENDERS_PER_PAGE, PAGE_SIZE_CANDIDATES, SCRAPING_CONFIG
+)
+from api_records import tenders_from_payload, find_total_items
+
+logger = logging.getLogger(__name__)
+
+
+class TenderApiClient:
+    """Pooled HTTP client for the portal's search and detail APIs"""
+
+    def __init__(self, search_url: str = TENDER_SEARCH_API, detail_url: str = TENDER_DETAIL_API,
+                 page_size: int = TENDERS_PER_PAGE, concurrency: Optional[int] = None,
+                 timeout: Optional[float] = None, extra_params: Optional[Dict[str, Any]] = None):
+        self.search_url = search_url
+        self.extra_params = dict(extra_params or {})  # e.g. NEWEST_FIRST_PARAMS for incremental runs
+        self.detail_url = detail_url
+        self.page_size = page_size
+        self.concurrency = concurrency or SCRAPING_CONFIG.http_concurrency
+        self.timeout = timeout or SCRAPING_CONFIG.page_load_timeout
+        self.session = self._create_session()
+        self.total_items: Optional[int] = None
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        retry = Retry(
+            total=SCRAPING_CONFIG.max_retries,
+            backoff_factor=SCRAPING_CONFIG.retry_delay / 2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+        )
+        # One connection per concurrent page fetch, all kept alive between pages
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "User-Agent": SCRAPING_CONFIG.user_agent,
+            "Accept": "application/json",
+        })
+        return session
+
+    def fetch_page(self, page: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one 1-based search page; returns (records, total items if reported)"""
+        params = dict(SEARCH_API_PARAMS, **self.extra_params)
+        params["page"] = page - 1 + SEARCH_API_FIRST_PAGE
+        params["size"] = self.page_size
+        response = self.session.get(self.search_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        payload = response.json()
+
+        tenders = tenders_from_payload(payload, page)
+        if tenders is None:
+            raise ValueError(f"Search API response for page {page} has no tender list")
+        return tenders, find_total_items(payload, response.headers)
+
+    def fetch_detail(self, tender_id: str) -> Dict[str, Any]:
+        """Fetch one tender's detail JSON from TENDER_DETAIL_API"""
+        response = self.session.get(self.detail_url.format(tender_id=tender_id), timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_detail_if_changed(self, tender_id: str,
+                                etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Conditional detail fetch; returns (None, etag) when the server answers 304 Not Modified"""
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self.session.get(self.detail_url.format(tender_id=tender_id), headers=headers,
+                                    timeout=self.timeout)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        return response.json(), response.headers.get("ETag")
+
+    def probe_page_size(self, candidates: Optional[List[int]] = None) -> int:
+        """
+        Switch to the largest page size the API honours, trying candidates largest first
+        A size counts as honoured when page 1 comes back full, or holds every item when there are fewer
+        """
+        default = self.page_size
+        for size in sorted(candidates or PAGE_SIZE_CANDIDATES, reverse=True):
+            if size <= default:
+                break
+            self.page_size = size
+            try:
+                tenders, total_items = self.fetch_page(1)
+            except (requests.RequestException, ValueError) as e:
+                logger.debug(f"Page size {size} probe failed: {e}")
+                continue
+            if len(tenders) == size or (total_items is not None and len(tenders) == total_items < size):
+                self.total_items = total_items
+                logger.info(f"📏 Search API accepts {size} tenders per page")
+                return size
+            logger.info(f"Search API ignored size={size} ({len(tenders)} items returned)")
+        self.page_size = default
+        return default
+
+    def get_total_pages(self) -> int:
+        """Total pages for the current page size, fetching page 1 if the total is not known yet"""
+        if self.total_items is None:
+            _, self.total_items = self.fetch_page(1)
+        return max(1, math.ceil((self.total_items or 0) / self.page_size))
+
+    def scrape_pages(self, start_page: int = 1, end_page: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch a page range concurrently; pages that keep failing are logged and skipped
+        Raises when the first page fails before any total is known: there is nothing to page through
+        """
+        if self.total_items is None:
+            tenders, total_items = self.fetch_page(start_page)
+        else:
+            tenders, total_items = self._safe_fetch(start_page)
+        if total_items is not None:
+            self.total_items = total_items
+        if end_page is None and self.total_items is None:
+            return tenders + self._scrape_until_short_page(start_page + 1, len(tenders))
+        if end_page is None:
+            end_page = self.get_total_pages()
+        logger.info(f"📊 Search API reports {self.total_items} items, fetching pages {start_page}-{end_page}")
+
+        remaining = range(start_page + 1, end_page + 1)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for page_tenders, _ in executor.map(self._safe_fetch, remaining):
+                tenders.extend(page_tenders)
+        return tenders
+
+    def _scrape_until_short_page(self, page: int, last_count: int) -> List[Dict[str, Any]]:
+        """Walk pages one by one when the API reports no total, stopping at the first short page"""
+        logger.warning("Search API reports no total item count, paging until a short page")
+        tenders = []
+        while last_count >= self.page_size:
+            page_tenders, _ = self._safe_fetch(page)
+            tenders.extend(page_tenders)
+            last_count = len(page_tenders)
+            page += 1
+        return tenders
+
+    def _safe_fetch(self, page: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        try:
+            tenders, total_items = self.fetch_page(page)
+            logger.debug(f"Fetched {len(tenders)} tenders from API page {page}")
+            return tenders, total_items
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"❌ Failed to fetch API page {page}: {e}")
+            return [], None
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Known-tender index for incremental scraping of zakup.sk.kz
+Pages are walked newest-first and checked against tenders seen before (the tenders table or a
+local JSON index); paging stops after a run of pages with nothing new or changed
+"""
+
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+from config import KNOWN_TENDERS_FILE, SCRAPING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Only fields every list path (DOM, snapshot, network, API) produces, so a DOM run can compare against an
+# index written by an API or enriched run, or built from the tenders table. days_left is left out: it
+# ticks down every day without the tender itself changing
+FINGERPRINT_FIELDS = ["title", "status", "value"]
+
+
+def tender_fingerprint(tender: Dict) -> str:
+    """Hash of the fields whose change makes a known tender worth re-scraping"""
+    # Whitespace differs between paths (innerText line breaks and &nbsp;, API strings), values do not
+    data = "\x1f".join(" ".join(str(tender.get(field) or "").split()) for field in FINGERPRINT_FIELDS)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class KnownTenderIndex:
+    """Tender ID -> fingerprint of every tender already scraped"""
+
+    def __init__(self, fingerprints: Optional[Dict[str, str]] = None, path: Optional[Path] = None):
+        self.fingerprints = dict(fingerprints or {})
+        self.path = path
+
+    @classmethod
+    def load(cls, path: Path = KNOWN_TENDERS_FILE) -> "KnownTenderIndex":
+        """Read the local index; a missing or unreadable file gives an empty index"""
+        path = Path(path)
+        try:
+            fingerprints = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            fingerprints = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read known-tender index {path}: {e}")
+            fingerprints = {}
+        return cls(fingerprints, path)
+
+    @classmethod
+    def from_database(cls, db_manager) -> "KnownTenderIndex":
+        """Build the index from the tenders table"""
+        index = cls()
+        index.update(db_manager.get_known_tenders())
+        return index
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def classify(self, tender: Dict) -> str:
+        """'new', 'changed' or 'unchanged' relative to the index"""
+        known = self.fingerprints.get(str(tender.get("id")))
+        if known is None:
+            return "new"
+        return "unchanged" if known == tender_fingerprint(tender) else "changed"
+
+    def update(self, tenders: Iterable[Dict]) -> None:
+        for tender in tenders:
+            if tender.get("id"):
+                self.fingerprints[str(tender["id"])] = tender_fingerprint(tender)
+
+    def save(self) -> None:
+        """Write the index back to its file (indexes built from the database have none)"""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.fingerprints), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+def scrape_incremental(fetch_page: Callable[[int], Optional[List[Dict]]], index: KnownTenderIndex,
+                       stop_after: Optional[int] = None, max_pages: Optional[int] = None) -> List[Dict]:
+    """
+    Walk newest-first pages from page 1 and return the new or changed tenders
+    fetch_page returns a page's tenders, or None when the page could not be scraped. Pages must be
+    unfiltered: a page the --min-value/--days-left filters empty is not the end of the listing, and new
+    tenders on it still mean the scan has not reached known ground, so callers filter the result.
+    Paging stops after stop_after consecutive pages with nothing new, at an empty page, at max_pages,
+    or after page_max_attempts consecutive pages that could not be scraped
+    """
+    stop_after = max(1, stop_after or SCRAPING_CONFIG.incremental_stop_after)
+    fresh: List[Dict] = []
+    quiet_pages = 0
+    failed_pages = 0
+    page = 0
+    while max_pages is None or page < max_pages:
+        page += 1
+        tenders = fetch_page(page)
+        if tenders is None:
+            # An unreadable page proves nothing either way, so it neither resets nor extends the run
+            failed_pages += 1
+            logger.warning(f"Page {page} could not be scraped, continuing incremental scan")
+            if failed_pages >= SCRAPING_CONFIG.page_max_attempts:
+                logger.error(f"❌ Stopping incremental scan after {failed_pages} consecutive failed pages")
+                break
+            continue
+        failed_pages = 0
+        if not tenders:
+            logger.info(f"Page {page} is empty, reached the end of the listing")
+            break
+
+        page_fresh = [t for t in tenders if index.classify(t) != "unchanged"]
+        fresh.extend(page_fresh)
+        quiet_pages = 0 if page_fresh else quiet_pages + 1
+        logger.info(f"🔎 Page {page}: {len(page_fresh)} new or changed of {len(tenders)} tenders")
+        if quiet_pages >= stop_after:
+            logger.info(f"⏹️ Stopping after {quiet_pages} consecutive pages with nothing new")
+            break
+
+    logger.info(f"Incremental scan covered {page} pages, {len(fresh)} new or changed tenders")
+    return fresh
@@ -4,10 +4,31 @@ import logging
 import subprocess
 import os
 import math
-from multiprocessing import Pool, cpu_count
+import time
+from multiprocessing import Pool, Manager, cpu_count
+from multiprocessing.pool import ThreadPool
 from tqdm import tqdm
-from scraper import get_scraper, save_results, scrape_page_range_worker
-from config import TENDER_URL
+from scraper import (
+    save_results, results_filename, scrape_page_range_worker, snapshot_page_range_worker, page_queue_worker,
+    probe_pagination_worker, filter_tenders, result_fields
+)
+from result_writer import start_writer, stop_writer
+from work_queue import PageWorkQueue, log_throughput
+from session_pool import get_session_pool, prewarm_session_pool
+from known_tenders import KnownTenderIndex, scrape_incremental
+from checkpoint import CheckpointJournal
+from throttle import AdaptiveThrottle
+from page_boundaries import PageBoundaryTracker, refetch_boundaries
+from supervisor import summarize_restarts
+from browser_lifecycle import ShmMonitor, reap_orphaned_browsers
+from multi_tab import multi_tab_queue_worker
+from pagination_handler import PaginationInfoCache
+from config import (
+    TENDER_NEWEST_URL, NEWEST_FIRST_PARAMS, SCRAPING_CONFIG, EXTRACTION_MODES
+)
+
+# Page count probed by the last run, reused by interval runs within its TTL
+PAGINATION_CACHE = PaginationInfoCache()
 
 def setup_logging():
     logging.basicConfig(
@@ -69,6 +90,253 @@ def prompt_next_action(csv_file):
         else:
             print("Invalid choice. Please enter 1 or 2.")
 
+def create_worker_pool(engine, workers, headless, extraction):
+    """
+    Browser workers as processes (one interpreter each) or as threads sharing this interpreter
+    Both pools have the same API and every shared object (queue, throttle, writer channel) is a
+    Manager proxy, so the rest of the run does not care which engine it got
+    """
+    if engine == 'threads':
+        # One session pool for all threads, so it must keep a warm session per worker
+        get_session_pool(headless, extraction).max_idle = max(workers, SCRAPING_CONFIG.session_pool_max_idle)
+        return ThreadPool(processes=workers, initializer=prewarm_session_pool, initargs=(headless, extraction))
+    return Pool(processes=workers, initializer=prewarm_session_pool, initargs=(headless, extraction))
+
+def run_scrape(args, pool, manager):
+    """Run one full scrape using the given worker pool; returns the CSV path or None on failure"""
+    logging.info("========== TENDER SCRAPING STARTED ==========")
+    shm_monitor = ShmMonitor().start()
+    try:
+        if args.resume:
+            journal = CheckpointJournal.open(args.resume)
+            # Page numbers only mean the same thing at the page size the run was started with
+            pagination_info = journal.run_info.get("pagination") or PAGINATION_CACHE.get()
+            total_pages = journal.run_info["total_pages"]
+            pages = journal.missing_pages()
+            logging.info(f"Resuming run {journal.run_id}: {total_pages - len(pages)} of {total_pages} pages "
+                         f"already journaled, {len(pages)} to scrape")
+            settings = journal.run_info["settings"]
+            if settings != journal_settings(args):
+                # Every page of one run must pass the same filters
+                logging.warning(f"⚠️ Using the filters run {journal.run_id} was started with: {settings}")
+                args.min_value, args.days_left = settings["min_value"], settings["days_left"]
+        else:
+            pagination_info = PAGINATION_CACHE.get()
+            if pagination_info is None:
+                # One probe in a worker whose browser is already warm, shared with every worker below
+                pagination_info = pool.apply(probe_pagination_worker, ((args.headless, args.extraction),))
+                if pagination_info.get('total_items'):
+                    PAGINATION_CACHE.put(pagination_info)
+            total_pages = pagination_info['total_pages']
+            logging.info(f"Total pages detected: {total_pages}")
+            journal = CheckpointJournal.create(total_pages, journal_settings(args), pagination=pagination_info)
+            pages = list(range(1, total_pages + 1))
+            logging.info(f"Checkpoint journal for run {journal.run_id}: {journal.directory} "
+                         f"(continue an interrupted run with --resume {journal.run_id})")
+
+        # One request budget and concurrency limit for all workers; the pool size is only the ceiling
+        throttle = AdaptiveThrottle(manager, max_concurrency=args.workers * args.tabs) if args.throttle == 'adaptive' else None
+
+        # Workers stream each finished page to one writer process, which journals and appends it to the CSV
+        # (snapshots are parsed in the writer's own parser pool, and --enrich runs on its own thread, first)
+        csv_file = results_filename()
+        channel, writer_stats, writer = start_writer(
+            manager, csv_file, journal=journal, min_value=args.min_value, max_days_left=args.days_left,
+            enrich=args.enrich, record_known=args.known_tenders == 'file',
+            headless=args.headless, extraction_mode=args.extraction)
+
+        # Page IDs and observed totals, compared afterwards to catch tenders shifted across page boundaries
+        boundaries = None
+        if SCRAPING_CONFIG.track_page_boundaries and pagination_info:
+            boundaries = PageBoundaryTracker(manager, pagination_info.get('page_size') or pagination_info['items_per_page'])
+
+        worker_reports = []
+        try:
+            if args.scheduler == 'queue' or args.resume or args.tabs > 1:
+                logging.info(f"Scraping with {args.workers} workers pulling pages from a shared queue.")
+                worker_reports += run_page_queue(pool, manager, args, pages, channel, pagination_info, throttle,
+                                                 boundaries)
+            else:
+                ranges = chunkify(total_pages, args.workers)
+                worker = snapshot_page_range_worker if args.extraction == 'snapshot' else scrape_page_range_worker
+                worker_args = [
+                    (start, end, args.headless, args.min_value, args.days_left, args.extraction, channel,
+                     pagination_info, throttle, boundaries)
+                    for (start, end) in ranges
+                ]
+                logging.info(f"Scraping with {args.workers} workers. Each worker will process a range of pages.")
+                for report in tqdm(pool.imap_unordered(worker, worker_args), total=len(worker_args), desc="Scraping page ranges"):
+                    worker_reports.append(report)
+
+            if boundaries is not None:
+                def run_boundary_pages(boundary_pages, last_page):
+                    # Pages past the original end are only reachable with the grown page count
+                    info = dict(pagination_info, total_pages=max(pagination_info['total_pages'], last_page))
+                    worker_reports.extend(
+                        run_page_queue(pool, manager, args, boundary_pages, channel, info, throttle, boundaries))
+                refetch_boundaries(run_boundary_pages, boundaries, total_pages)
+        finally:
+            stop_writer(channel, writer)
+        if throttle:
+            logging.info(f"🚦 Throttle: {throttle.summary()}")
+
+        print_summary(writer_stats.get('tenders', 0), csv_file, summarize_restarts(worker_reports),
+                      shm_monitor.stop())
+        missing = journal.missing_pages()
+        if missing:
+            logging.warning(f"⚠️ {len(missing)} pages missing from run {journal.run_id}; "
+                            f"scrape them with --resume {journal.run_id}")
+        else:
+            journal.discard()
+        return csv_file
+
+    except Exception as e:
+        logging.error(f"❌ Fatal error during scraping: {e}")
+        return None
+    finally:
+        shm_monitor.stop()
+
+def run_page_queue(pool, manager, args, pages, channel, pagination_info, throttle, boundaries):
+    """Scrape the given pages with every pool worker pulling from one shared PageWorkQueue; returns worker reports"""
+    work_queue = PageWorkQueue(manager, pages)
+    worker_args = [
+        (worker_id, work_queue, args.headless, args.min_value, args.days_left, args.extraction, channel,
+         pagination_info, throttle, boundaries)
+        for worker_id in range(args.workers)
+    ]
+    worker = page_queue_worker
+    if args.tabs > 1:
+        worker = multi_tab_queue_worker
+        worker_args = [task + (args.tabs,) for task in worker_args]
+    reports = []
+    with tqdm(total=len(worker_args), desc="Workers finished") as progress:
+        for report in pool.imap_unordered(worker, worker_args):
+            reports.append(report['throughput'])
+            progress.update(1)
+    log_throughput(reports)
+    if work_queue.remaining() > 0 or work_queue.failed_pages():
+        logging.warning(f"⚠️ Pages not scraped: {work_queue.failed_pages()} "
+                        f"({work_queue.remaining()} still queued when all workers stopped)")
+    return reports
+
+def journal_settings(args):
+    """Run settings that determine what a journaled page contains"""
+    return {"min_value": args.min_value, "days_left": args.days_left}
+
+def run_http_scrape(args):
+    """Run one full scrape against the search API without a browser; returns the CSV path or None"""
+    from http_client import TenderApiClient
+
+    logging.info("========== TENDER SCRAPING STARTED (HTTP backend) ==========")
+    client = TenderApiClient()
+    try:
+        if SCRAPING_CONFIG.probe_page_size:
+            client.probe_page_size()
+        tenders = client.scrape_pages()
+        return finish_run(filter_tenders(tenders, args.min_value, args.days_left), args)
+    except Exception as e:
+        logging.error(f"❌ Fatal error during scraping: {e}")
+        return None
+    finally:
+        client.close()
+
+def load_known_tenders(args):
+    """Index of tenders seen by earlier runs, from the tenders table or the local index file"""
+    if args.known_tenders == 'database':
+        from database import create_database_manager
+        db_manager = create_database_manager()
+        try:
+            return KnownTenderIndex.from_database(db_manager)
+        finally:
+            db_manager.close()
+    return KnownTenderIndex.load()
+
+def run_incremental_scrape(args):
+    """Walk the listing newest-first and save only new or changed tenders; returns the CSV path or None"""
+    logging.info("========== INCREMENTAL TENDER SCRAPING STARTED ==========")
+    index = load_known_tenders(args)
+    logging.info(f"Comparing against {len(index)} known tenders ({args.known_tenders})")
+    try:
+        if args.backend == 'http':
+            from http_client import TenderApiClient
+            client = TenderApiClient(extra_params=NEWEST_FIRST_PARAMS)
+            try:
+                def fetch_page(page):
+                    try:
+                        tenders, _ = client.fetch_page(page)
+                    except Exception as e:
+                        logging.error(f"❌ Failed to fetch API page {page}: {e}")
+                        return None
+                    return tenders
+                fresh = scrape_incremental(fetch_page, index)
+            finally:
+                client.close()
+        else:
+            # Sequential by nature: each page decides whether the next one is needed
+            session_pool = get_session_pool(headless=args.headless, extraction_mode=args.extraction,
+                                            search_url=TENDER_NEWEST_URL)
+            with session_pool.session() as scraper:
+                fresh = scrape_incremental(scraper.scrape_page, index, max_pages=scraper.get_total_pages())
+        # Filters apply to what is saved, not to the scan: a page they empty is not the end of the listing.
+        # Filtered-out tenders are still recorded as known, or they would look new on every run
+        return finish_run(filter_tenders(fresh, args.min_value, args.days_left), args, known=fresh)
+
+    except Exception as e:
+        logging.error(f"❌ Fatal error during scraping: {e}")
+        return None
+
+def enrich_tenders(all_tenders, args):
+    """Fill detail fields from the detail API, or from inside a warm browser session"""
+    from enrichment import DetailEnricher, ApiDetailFetcher, BrowserDetailFetcher
+
+    logging.info(f"========== DETAIL ENRICHMENT ({args.enrich}) ==========")
+    if args.enrich == 'browser':
+        session_pool = get_session_pool(headless=args.headless, extraction_mode=args.extraction)
+        with session_pool.session() as scraper:
+            DetailEnricher(BrowserDetailFetcher(scraper.driver)).enrich(all_tenders)
+    else:
+        fetcher = ApiDetailFetcher()
+        try:
+            DetailEnricher(fetcher).enrich(all_tenders)
+        finally:
+            fetcher.close()
+
+def finish_run(all_tenders, args, known=None):
+    """
+    Save a run's tenders, record them in the local known-tender index and print the summary
+    known: tenders to record in the index instead of all_tenders (incremental runs record unfiltered ones)
+    """
+    enriched = False
+    index = None
+    if args.known_tenders == 'file':
+        # Fingerprinted from the list records, as the next run will see them, before enrichment adds fields
+        index = KnownTenderIndex.load()
+        index.update(all_tenders if known is None else known)
+    if args.enrich:
+        try:
+            enrich_tenders(all_tenders, args)
+            enriched = True
+        except Exception as e:
+            logging.error(f"❌ Detail enrichment failed, saving list fields only: {e}")
+    csv_file = save_results(all_tenders, result_fields(args.extraction, args.backend, enriched))
+    if index is not None:
+        index.save()
+    print_summary(len(all_tenders), csv_file)
+    return csv_file
+
+def print_summary(tender_count, csv_file, restarts=None, shm=None):
+    logging.info(f"✅ Scraping complete. {tender_count} tenders saved to {csv_file}")
+
+    print("\n========== SCRAPING SUMMARY ==========")
+    print(f"Total tenders scraped: {tender_count}")
+    print(f"Results saved to: {csv_file}")
+    if restarts is not None:
+        print(f"Browser restarts after crashes: {restarts['restarts']} "
+              f"({restarts['restart_seconds']}s spent restarting)")
+    if shm is not None:
+        print(f"Peak /dev/shm use: {shm['peak_used_mb']} MB ({shm['baseline_used_mb']} MB before the run)")
+        print(f"Peak Chrome shared memory: {shm['peak_chrome_mb']} MB in {shm['chrome_dir']}")
+
 def main():
     setup_logging()
     parser = argparse.ArgumentParser(description="Tender Scraper CLI")
@@ -77,40 +345,104 @@ def main():
     parser.add_argument('--workers', type=int, default=cpu_count(), help="Number of parallel workers for scraping")
     parser.add_argument('--min-value', type=float, default=0, help="Minimum tender value (in KZT)")
     parser.add_argument('--days-left', type=int, default=None, help="Maximum days left before closing")
+    parser.add_argument('--extraction', choices=EXTRACTION_MODES, default=SCRAPING_CONFIG.extraction_mode,
+                        help="Tender extraction mode: one execute_script per page, per-element WebDriver calls, "
+                             "the portal's own search XHR JSON, or page_source snapshots parsed in a process pool")
+    parser.add_argument('--backend', choices=['browser', 'http'], default='browser',
+                        help="Scrape with Chrome workers, or directly from the search API over HTTP")
+    parser.add_argument('--scheduler', choices=['queue', 'ranges'], default='queue',
+                        help="Workers pull pages from a shared queue, or each owns a fixed contiguous range")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Walk the listing newest-first and stop once pages hold no new or changed tenders")
+    parser.add_argument('--known-tenders', choices=['file', 'database'], default='file',
+                        help="Where incremental runs look up already-scraped tenders")
+    parser.add_argument('--enrich', choices=['api', 'browser'], default=None,
+                        help="Fill buyer, location, category, description, dates and requirements from detail "
+                             "views, via the detail API or from inside a browser session")
+    parser.add_argument('--resume', metavar='RUN_ID', default=None,
+                        help="Finish an interrupted browser run from its checkpoint journal, scraping only missing pages")
+    parser.add_argument('--throttle', choices=['adaptive', 'off'], default='adaptive',
+                        help="Share a requests-per-minute budget across workers and adapt how many load pages "
+                             "at once (--workers is the ceiling), or let every worker run flat out")
+    parser.add_argument('--engine', choices=['processes', 'threads'], default='processes',
+                        help="Run browser workers in a process pool, or as threads in this interpreter "
+                             "(they mostly wait on chromedriver, so threads save an interpreter per worker)")
+    parser.add_argument('--tabs', type=int, default=SCRAPING_CONFIG.tabs_per_browser,
+                        help="Pages each worker's browser loads at once in separate tabs (uses the queue scheduler), "
+                             "trading Chrome processes for tabs to fit more concurrent pages in memory")
+    parser.add_argument('--persistent-profiles', action='store_true',
+                        default=SCRAPING_CONFIG.persistent_profiles,
+                        help="Give each browser a persistent profile slot so the portal's scripts come from "
+                             "Chrome's disk and code caches instead of being downloaded on every run")
+    parser.add_argument('--driver', choices=['local', 'remote'], default=SCRAPING_CONFIG.driver_backend,
+                        help="Start Chrome on this host, or open sessions on Selenium Grid / standalone servers "
+                             "(spread across --webdriver-url endpoints by free capacity)")
+    parser.add_argument('--webdriver-url', action='append', default=None, metavar='URL',
+                        help="Remote WebDriver endpoint, e.g. http://grid:4444 (repeat for several; "
+                             "defaults to SCRAPER_WEBDRIVER_URLS)")
+    parser.add_argument('--interval', type=float, default=None,
+                        help="Repeat the scrape every N minutes in this process, reusing warm browser sessions")
     args = parser.parse_args()
+    if args.resume and (args.backend != 'browser' or args.incremental):
+        parser.error("--resume only applies to full browser runs")
+    if args.tabs < 1:
+        parser.error("--tabs must be at least 1")
+    if args.tabs > 1 and args.extraction == 'network':
+        # Captured search responses cannot be told apart between tabs of one browser
+        parser.error("--tabs cannot be combined with --extraction network")
+    if args.driver == 'remote' and not (args.webdriver_url or SCRAPING_CONFIG.remote_webdriver_urls):
+        parser.error("--driver remote needs --webdriver-url or SCRAPER_WEBDRIVER_URLS")
+
+    # Read by every browser launch, including those in pool workers forked below
+    SCRAPING_CONFIG.persistent_profiles = args.persistent_profiles
+    SCRAPING_CONFIG.driver_backend = args.driver
+    if args.webdriver_url:
+        SCRAPING_CONFIG.remote_webdriver_urls = args.webdriver_url
 
     if args.mode == 'scrape':
-        logging.info("========== TENDER SCRAPING STARTED ==========")
+        # Worker processes outlive a single run so their warm browser sessions are reused.
+        # Each worker launches its browser at startup, in parallel with the page count below.
+        pool = None
+        manager = None
+        if args.backend == 'browser':
+            # Browser trees left by earlier runs whose workers were killed still hold memory and /dev/shm
+            reap_orphaned_browsers()
+        if args.backend == 'browser' and not args.incremental:
+            manager = Manager()
+            pool = create_worker_pool(args.engine, args.workers, args.headless, args.extraction)
         try:
-            with get_scraper(headless=args.headless) as scraper:
-                logging.info("Opening tender site...")
-                scraper.open_site(TENDER_URL)
-                total_pages = scraper.get_total_pages()
-            logging.info(f"Total pages detected: {total_pages}")
-
-            ranges = chunkify(total_pages, args.workers)
-            worker_args = [
-                (start, end, args.headless, args.min_value, args.days_left)
-                for (start, end) in ranges
-            ]
-
-            all_tenders = []
-            logging.info(f"Scraping with {args.workers} workers. Each worker will process a range of pages.")
-            with Pool(processes=args.workers) as pool:
-                for tenders in tqdm(pool.imap_unordered(scrape_page_range_worker, worker_args), total=len(worker_args), desc="Scraping page ranges"):
-                    all_tenders.extend(tenders)
-
-            csv_file = save_results(all_tenders)
-            logging.info(f"✅ Scraping complete. {len(all_tenders)} tenders saved to {csv_file}")
-
-            print("\n========== SCRAPING SUMMARY ==========")
-            print(f"Total tenders scraped: {len(all_tenders)}")
-            print(f"Results saved to: {csv_file}")
-
-            prompt_next_action(csv_file)
-
-        except Exception as e:
-            logging.error(f"❌ Fatal error during scraping: {e}")
+            while True:
+                if args.incremental:
+                    csv_file = run_incremental_scrape(args)
+                elif args.backend == 'http':
+                    csv_file = run_http_scrape(args)
+                else:
+                    csv_file = run_scrape(args, pool, manager)
+                    # Later interval runs start fresh
+                    args.resume = None
+                if not args.interval:
+                    break
+                logging.info(f"Next run in {args.interval} minutes")
+                time.sleep(args.interval * 60)
+            
+            if csv_file and not args.interval:
+                prompt_next_action(csv_file)
+        except KeyboardInterrupt:
+            logging.info("Interrupted, stopping workers...")
+            if pool:
+                pool.terminate()
+        finally:
+            # close/join (not terminate) lets workers shut their browsers down cleanly
+            if pool:
+                pool.close()
+                pool.join()
+                if args.engine == 'threads':
+                    # Thread workers share this process's session pool
+                    get_session_pool(args.headless, args.extraction).close_all()
+                # Terminated workers never closed their browsers
+                reap_orphaned_browsers()
+            if manager:
+                manager.shutdown()
     elif args.mode == 'translate':
         logging.info("========== TRANSLATION MODULE ==========")
         # Prompt for input/output/current_time if not provided
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Multi-tab mode: one Chrome drives several result pages at once
+Each tab keeps its own pagination state. A round starts in-app navigation in every tab first and
+only then waits for and extracts each one, so the portal's response times overlap inside a single
+browser process instead of costing one Chrome (300-500 MB) per concurrent page
+"""
+
+import time
+import logging
+from typing import Any, Callable, List, Optional, Tuple
+from selenium.common.exceptions import WebDriverException
+from pagination_handler import PaginationHandler
+from recycling import browser_rss_mb
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserTab:
+    """A window handle and the pagination state of the results page it shows"""
+
+    def __init__(self, handle: str, pagination: PaginationHandler):
+        self.handle = handle
+        self.pagination = pagination
+
+
+class MultiTabSession:
+    """Opens `tab_count` tabs on the search page in a TenderScraper's browser and scrapes pages in rounds"""
+
+    def __init__(self, scraper, tab_count: int, search_url: str):
+        self.scraper = scraper
+        self.tab_count = max(1, tab_count)
+        self.search_url = search_url
+        self.tabs: List[BrowserTab] = []
+        self._driver = None
+
+    def ensure_tabs(self) -> None:
+        """Open the tabs, again after the browser was recycled or respawned"""
+        if self._driver is self.scraper.driver and self.tabs:
+            return
+        driver = self.scraper.driver
+        main_pagination = self.scraper.pagination
+        self.tabs = [BrowserTab(driver.current_window_handle, main_pagination)]
+        known = set(driver.window_handles)
+        for _ in range(self.tab_count - 1):
+            driver.execute_script("window.open('about:blank', '_blank');")
+        new_handles = [handle for handle in driver.window_handles if handle not in known]
+        # The block list and the request tracker are per-tab CDP state: install both before the tab
+        # loads anything, and start every extra tab loading before waiting on any of them
+        for handle in new_handles:
+            driver.switch_to.window(handle)
+            self.scraper.resource_blocker.block_urls(driver)
+            self.scraper.readiness.install_request_tracker(new_tab=True)
+            driver.execute_script("window.location.href = arguments[0];", self.search_url)
+        for handle in new_handles:
+            driver.switch_to.window(handle)
+            self.scraper.readiness.wait_until_ready("Search page (new tab)")
+            pagination = PaginationHandler(driver, self.scraper.wait, self.scraper.readiness)
+            if main_pagination and main_pagination.total_pages:
+                pagination.apply_info({
+                    'total_pages': main_pagination.total_pages,
+                    'total_items': main_pagination.total_items,
+                    'current_page': 1,
+                    'items_per_page': main_pagination.items_per_page,
+                    'page_size': main_pagination.page_size,
+                })
+            self.tabs.append(BrowserTab(handle, pagination))
+        self._driver = driver
+        self._select(self.tabs[0])
+        logger.info(f"🗂️ Browser driving {len(self.tabs)} tabs")
+
+    def close_extra_tabs(self) -> None:
+        """
+        Close every tab but the first before the session goes back to the pool, so the next task
+        (a boundary re-fetch round, the next --interval run) does not open its tabs on top of these
+        """
+        if self._driver is self.scraper.driver and len(self.tabs) > 1:
+            try:
+                for tab in self.tabs[1:]:
+                    self.scraper.driver.switch_to.window(tab.handle)
+                    self.scraper.driver.close()
+                self._select(self.tabs[0])
+            except WebDriverException as e:
+                logger.debug(f"Could not close extra tabs: {e}")
+        if self.tabs:
+            self.scraper.pagination = self.tabs[0].pagination
+        self.tabs = []
+        self._driver = None
+
+    def _select(self, tab: BrowserTab) -> None:
+        """Make the tab current for WebDriver commands and for the scraper's page methods"""
+        self.scraper.driver.switch_to.window(tab.handle)
+        self.scraper.pagination = tab.pagination
+
+    def scrape_round(self, pages: List[int], capture: Callable[[int], Any],
+                     on_done: Optional[Callable[[int, Any, float], None]] = None) -> List[Tuple[int, Any]]:
+        """
+        Scrape up to one page per tab: start every navigation, then wait for and capture each page
+        capture is the scraper's page method (scrape_page or capture_page_source); on_done(page, result,
+        seconds) runs right after each capture. Returns (page, result) pairs, None for failed pages
+        """
+        self.ensure_tabs()
+        started = []
+        for tab, page in zip(self.tabs, pages):
+            self._select(tab)
+            pending = None
+            if tab.pagination and (tab.pagination.current_page != page or tab.pagination.needs_resize()):
+                pending = tab.pagination.begin_navigation(page)
+            started.append((tab, page, pending, time.monotonic()))
+
+        results = []
+        for tab, page, pending, page_started in started:
+            result = None
+            try:
+                self._select(tab)
+                if pending is None or tab.pagination.complete_navigation(page, pending):
+                    # Already on the page: scrape_page/capture_page_source skip navigation
+                    result = capture(page)
+            except WebDriverException as e:
+                logger.error(f"❌ Tab for page {page} failed: {e}")
+            if on_done:
+                on_done(page, result, time.monotonic() - page_started)
+            results.append((page, result))
+        self._select(self.tabs[0])
+        return results
+
+    def memory_summary(self) -> str:
+        rss = browser_rss_mb(self.scraper.driver)
+        if rss is None:
+            return f"{len(self.tabs)} tabs"
+        return f"{len(self.tabs)} tabs in {rss:.0f} MB ({rss / max(1, len(self.tabs)):.0f} MB per concurrent page)"
+
+
+def multi_tab_queue_worker(args):
+    """
+    page_queue_worker for multi-tab mode: pull up to one page per tab from the shared PageWorkQueue
+    and scrape them as one interleaved round
+    """
+    from session_pool import get_session_pool
+    from scraper import adopt_pagination_info, filter_tenders, record_boundary
+    from supervisor import SessionSupervisor
+    from work_queue import WorkerThroughput
+
+    (worker_id, work_queue, headless, min_value, max_days_left, extraction_mode, channel, pagination_info, throttle,
+     boundaries, tab_count) = args
+    pool = get_session_pool(headless=headless, extraction_mode=extraction_mode)
+    throughput = WorkerThroughput(worker_id)
+    held: List[int] = []  # Pages taken from the queue but not started yet
+    with pool.session() as scraper:
+        supervisor = SessionSupervisor(pool, scraper)
+        adopt_pagination_info(scraper, pagination_info)
+        tabs = MultiTabSession(scraper, tab_count, pool.search_url)
+        capture = scraper.capture_page_source if extraction_mode == "snapshot" else scraper.scrape_page
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(held) < tab_count:
+                    if held:
+                        # Top up without blocking, then scrape a partial round
+                        batch = work_queue.poll_batch()
+                        if batch is None:
+                            break
+                    else:
+                        batch = work_queue.get_batch()
+                        if batch is None:
+                            exhausted = True
+                            break
+                    held.extend(batch)
+                if not held:
+                    break
+
+                if pool.recycle_if_due(scraper):
+                    throughput.recycles += 1
+                # One throttle slot per tab; only the first may block, or workers could deadlock on each other
+                if throttle is None:
+                    slots = min(tab_count, len(held))
+                else:
+                    throttle.acquire()
+                    slots = 1
+                    while slots < min(tab_count, len(held)) and throttle.try_acquire():
+                        slots += 1
+                pages, held = held[:slots], held[slots:]
+                released = []
+
+                def on_done(page, result, seconds):
+                    if throttle is not None:
+                        throttle.release(seconds, result is not None)
+                        released.append(page)
+                    if result is not None:
+                        record_boundary(boundaries, scraper, page)
+
+                try:
+                    results = tabs.scrape_round(pages, capture, on_done)
+                except Exception as e:
+                    logger.error(f"❌ Worker {worker_id} lost its tabs on pages {pages}: {e}")
+                    if throttle is not None:
+                        for _ in range(len(pages) - len(released)):
+                            throttle.release(0.0, False)
+                    results = [(page, None) for page in pages]
+
+                for page, result in results:
+                    if result is None:
+                        throughput.failures += 1
+                        work_queue.retry(page)
+                        continue
+                    if extraction_mode == "snapshot":
+                        channel.put(("snapshot", page, result))
+                    else:
+                        throughput.tenders += len(result)
+                        channel.put(("records", page, filter_tenders(result, min_value, max_days_left)))
+                    throughput.pages += 1
+                    work_queue.complete(page)
+
+                if any(result is None for _, result in results) and not supervisor.session_alive():
+                    if supervisor.restarts >= supervisor.max_restarts or not supervisor.respawn(
+                            f"session died on pages {pages}"):
+                        logger.error(f"❌ Worker {worker_id} giving up its browser")
+                        break
+            logger.info(f"🗂️ Worker {worker_id}: {tabs.memory_summary()}")
+        finally:
+            tabs.close_extra_tabs()
+        throughput.restarts, throughput.restart_seconds = supervisor.restarts, supervisor.restart_seconds
+    for page in held:
+        work_queue.retry(page)
+    return {'throughput': throughput.as_dict()}
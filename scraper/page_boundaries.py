@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Shift detection for offset-based pagination
+Tenders published or withdrawn during a long run shift every later page. Workers record each page's
+tender IDs and the total the portal showed at that moment; comparing neighbouring pages afterwards
+tells which boundaries may have lost tenders, so only those pages are fetched again
+"""
+
+import math
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+from config import SCRAPING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class PageBoundaryTracker:
+    """
+    Per-page tender IDs and observed totals kept in a multiprocessing.Manager dict
+    Like PageWorkQueue it pickles cleanly, so pool tasks receive it as an argument
+    """
+
+    def __init__(self, manager, page_size: int):
+        self.page_size = max(1, page_size)
+        self._pages = manager.dict()
+
+    def record(self, page: int, ids: Iterable[str], total_items: Optional[int]) -> None:
+        """Remember what a page showed; a re-fetched page replaces its earlier observation"""
+        ids = [tender_id for tender_id in ids if tender_id]
+        self._pages[page] = {"ids": ids, "first": ids[0] if ids else None, "last": ids[-1] if ids else None,
+                             "total": total_items}
+
+    def observations(self) -> Dict[int, Dict[str, Any]]:
+        return dict(self._pages.copy())
+
+    def check(self, total_pages: int) -> Dict[str, Any]:
+        """
+        Compare neighbouring pages
+        Listing changes above a boundary between two fetches leave either an overlap (the same tenders on
+        both pages, harmless once the writer dedupes by ID) or a gap. Whichever way the change went, a gap
+        means the earlier page saw a larger total than the later one, so those boundaries are re-fetched.
+        Pages past the original last page are added when a larger total shows the listing grew
+        """
+        pages = self.observations()
+        overlaps, gaps = [], []
+        for page in sorted(pages):
+            following = pages.get(page + 1)
+            if following is None:
+                continue
+            current = pages[page]
+            if set(current["ids"]) & set(following["ids"]):
+                overlaps.append(page)
+            elif current["total"] is not None and following["total"] is not None \
+                    and current["total"] > following["total"]:
+                gaps.append(page)
+
+        totals = [observed["total"] for observed in pages.values() if observed["total"]]
+        last_page = max(total_pages, math.ceil(max(totals) / self.page_size)) if totals else total_pages
+        refetch = {boundary_page for page in gaps for boundary_page in (page, page + 1)}
+        refetch.update(range(total_pages + 1, last_page + 1))
+        return {
+            "overlaps": overlaps,
+            "gaps": gaps,
+            "refetch": sorted(refetch),
+            "last_page": last_page,
+            "total_drift": max(totals) - min(totals) if totals else 0,
+        }
+
+
+def refetch_boundaries(run_pages, tracker: PageBoundaryTracker, total_pages: int,
+                       rounds: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Re-fetch suspect boundary pages until neighbouring pages agree or the rounds run out
+    run_pages(pages, last_page) scrapes the given pages, streaming them to the writer as usual
+    """
+    rounds = SCRAPING_CONFIG.boundary_refetch_rounds if rounds is None else rounds
+    report = tracker.check(total_pages)
+    refetched: List[int] = []
+    for round_number in range(1, rounds + 1):
+        if not report["refetch"]:
+            break
+        logger.warning(f"🔀 Listing shifted during the run (total drift {report['total_drift']}): "
+                       f"re-fetching boundary pages {report['refetch']} (round {round_number}/{rounds})")
+        run_pages(report["refetch"], report["last_page"])
+        refetched.extend(report["refetch"])
+        report = tracker.check(report["last_page"])
+    if report["refetch"]:
+        logger.warning(f"⚠️ Boundaries still unsettled after {rounds} rounds: pages {report['refetch']}")
+    logger.info(f"🔀 Page boundaries: {len(report['overlaps'])} overlaps (deduplicated by ID), "
+                f"{len(refetched)} pages re-fetched")
+    return dict(report, refetched=refetched)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Offline page-source parser for zakup.sk.kz search results
+Turns driver.page_source snapshots into the same records as TenderScraper.extract_tenders_from_page,
+so browsers only navigate while CPU-bound parsing runs in its own process pool
+"""
+
+import re
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from lxml import html as lxml_html
+from config import SCRAPING_CONFIG
+from api_records import TENDER_URL_TEMPLATE
+
+logger = logging.getLogger(__name__)
+
+
+def _has_class(*names: str) -> str:
+    """XPath predicate matching elements that carry every given CSS class"""
+    return " and ".join(f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')" for name in names)
+
+
+# XPath equivalents of the CSS selectors used in TenderScraper
+ITEM_XPATH = f"//div[{_has_class('m-found-item')}]"
+NUM_XPATH = f".//div[{_has_class('m-found-item__num')}]"
+TITLE_XPATH = f".//h3[{_has_class('m-found-item__title')}]"
+LAYOUT_XPATH = f".//div[{_has_class('m-found-item__layout')}]"
+DAYS_XPATH = f".//span[({_has_class('m-span', 'm-span--danger')}) or ({_has_class('m-span', 'm-span--success')})]"
+VALUE_XPATH = f".//div[{_has_class('m-found-item__col--sum')}]//span[{_has_class('m-span--dark')}]"
+
+
+# Elements rendered as blocks: innerText (and WebElement.text) starts a new line around them
+BLOCK_TAGS = {"address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "footer", "form", "h1", "h2",
+              "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+              "tr", "ul"}
+# Never part of innerText
+HIDDEN_TAGS = {"script", "style", "template", "noscript"}
+# Source whitespace collapses to one space; &nbsp; is kept, as innerText keeps it
+COLLAPSIBLE_SPACE = re.compile(r"[ \t\n\r\f]+")
+
+
+def _collect_text(element, parts: List[str]) -> None:
+    block = element.tag in BLOCK_TAGS
+    if block:
+        parts.append("\n")
+    if element.text and element.tag not in HIDDEN_TAGS:
+        parts.append(COLLAPSIBLE_SPACE.sub(" ", element.text))
+    for child in element:
+        if child.tag == "br":
+            parts.append("\n")
+        elif isinstance(child.tag, str) and child.tag not in HIDDEN_TAGS:
+            _collect_text(child, parts)
+        if child.tail:  # Comments have no text of their own, but the text after them counts
+            parts.append(COLLAPSIBLE_SPACE.sub(" ", child.tail))
+    if block:
+        parts.append("\n")
+
+
+def _text(element) -> str:
+    """
+    Offline equivalent of innerText, as returned by EXTRACT_TENDERS_JS and WebElement.text: whitespace
+    inside a line collapses, while block elements and <br> keep their line breaks
+    """
+    parts: List[str] = []
+    _collect_text(element, parts)
+    lines = (COLLAPSIBLE_SPACE.sub(" ", line).strip(" ") for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _first_text(root, xpath: str, default: str = "") -> str:
+    matches = root.xpath(xpath)
+    if not matches:
+        return default
+    text = _text(matches[0])
+    return text if text else default
+
+
+def parse_tenders_html(page_source: str, page: int) -> List[Dict[str, str]]:
+    """Parse every div.m-found-item in a page snapshot into tender records"""
+    if not page_source or not page_source.strip():
+        return []
+    document = lxml_html.fromstring(page_source)
+
+    tenders = []
+    for item in document.xpath(ITEM_XPATH):
+        tender_id = _first_text(item, NUM_XPATH).replace("№", "").strip()
+
+        status = ""
+        for layout in item.xpath(LAYOUT_XPATH):
+            layout_text = _text(layout)
+            if layout_text and "Осталось" not in layout_text and "Стоимость" not in layout_text:
+                status = layout_text
+                break
+
+        value_elems = item.xpath(VALUE_XPATH)
+        tenders.append({
+            "id": tender_id,
+            "title": _first_text(item, TITLE_XPATH),
+            "status": status,
+            "days_left": _first_text(item, DAYS_XPATH, default="N/A"),
+            "value": _text(value_elems[0]) if value_elems else "0 ₸",
+            "url": TENDER_URL_TEMPLATE.format(tender_id=tender_id, page=page),
+        })
+    return tenders
+
+
+def _parse_snapshot(snapshot: Tuple[int, str]) -> Tuple[int, List[Dict[str, str]]]:
+    page, page_source = snapshot
+    return page, parse_tenders_html(page_source, page)
+
+
+class ParserPool:
+    """Pool of parser processes fed with (page, page_source) snapshots"""
+
+    def __init__(self, processes: Optional[int] = None):
+        self.processes = processes or SCRAPING_CONFIG.parser_processes
+        self._executor = ProcessPoolExecutor(max_workers=self.processes)
+
+    def submit(self, page: int, page_source: str) -> "Future[Tuple[int, List[Dict[str, str]]]]":
+        return self._executor.submit(_parse_snapshot, (page, page_source))
+
+    def parse_pages(self, snapshots: List[Tuple[int, str]]) -> List[Tuple[int, List[Dict[str, str]]]]:
+        """Parse a batch of snapshots in parallel and return (page, records) in page order"""
+        futures = [self.submit(page, page_source) for page, page_source in snapshots]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"❌ Failed to parse page snapshot: {e}")
+        results.sort(key=lambda result: result[0])
+        for page, page_tenders in results:
+            logger.info(f"✅ Parsed {len(page_tenders)} tenders from page {page} snapshot")
+        return results
+
+    def parse_all(self, snapshots: List[Tuple[int, str]]) -> List[Dict[str, str]]:
+        """Parse a batch of snapshots in parallel and return their records in page order"""
+        return [tender for _, page_tenders in self.parse_pages(snapshots) for tender in page_tenders]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -13,19 +13,157 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from readiness import PageReadiness
+from config import SCRAPING_CONFIG, PAGE_SIZE_CANDIDATES
+
+# Clicks the matching ngb-pagination link if it is visible, otherwise updates the page
+# parameter in the hash route so the Angular router navigates without a reload.
+# When a page size is given and the route does not carry it yet, the route is always rewritten.
+SPA_NAVIGATE_JS = """
+var target = String(arguments[0]);
+var size = arguments[1] ? String(arguments[1]) : null;
+var hash = window.location.hash;
+var setParam = function (route, name, value) {
+    var pattern = new RegExp('([?&]' + name + '=)[^&]*');
+    if (pattern.test(route)) {
+        return route.replace(pattern, '$1' + value);
+    }
+    return route + (route.indexOf('?') === -1 ? '?' : '&') + name + '=' + value;
+};
+if (!size || new RegExp('[?&]size=' + size + '(&|$)').test(hash)) {
+    var links = document.querySelectorAll('ngb-pagination li.page-item:not(.disabled):not(.active) a.page-link');
+    for (var i = 0; i < links.length; i++) {
+        if ((links[i].textContent || '').trim() === target) {
+            links[i].click();
+            return 'click';
+        }
+    }
+}
+if (size) {
+    hash = setParam(hash, 'size', size);
+}
+window.location.hash = setParam(hash, 'page', target);
+return 'router';
+"""
+
+# Reads everything detect_pagination_info needs in one round trip: the "Найдено" header,
+# the "Показано X - Y из Z элементов" footer, the items and the ngb-pagination state
+PAGINATION_PROBE_JS = """
+var header = '';
+var layouts = document.querySelectorAll('div.m-sidebar__layout');
+for (var i = 0; i < layouts.length; i++) {
+    var text = layouts[i].textContent || '';
+    if (text.toLowerCase().indexOf('найден') !== -1) { header = text; break; }
+}
+var footer = document.querySelector('div.jhi-item-count');
+var active = document.querySelector('ngb-pagination li.page-item.active a.page-link');
+var next = document.querySelector("ngb-pagination li.page-item a[aria-label='Next']");
+var prev = document.querySelector("ngb-pagination li.page-item a[aria-label='Previous']");
+var pages = [];
+var links = document.querySelectorAll('ngb-pagination li.page-item a.page-link');
+for (var j = 0; j < links.length; j++) {
+    var match = /^\\s*(\\d+)/.exec(links[j].textContent || '');
+    if (match) { pages.push(parseInt(match[1], 10)); }
+}
+var items = document.querySelectorAll('div.m-found-item');
+var ids = [];
+for (var k = 0; k < items.length; k++) {
+    var num = items[k].querySelector('div.m-found-item__num') || items[k];
+    ids.push((num.textContent || '').replace('№', '').trim());
+}
+return {
+    header: header,
+    footer: footer ? footer.textContent : '',
+    items: items.length,
+    ids: ids,
+    active_page: active ? parseInt(active.textContent, 10) || null : null,
+    visible_pages: pages,
+    has_next: !!next && !next.parentElement.classList.contains('disabled'),
+    has_previous: !!prev && !prev.parentElement.classList.contains('disabled')
+};
+"""
 
 logger = logging.getLogger(__name__)
 
+
+def with_route_params(url: str, **params) -> str:
+    """Set query parameters on a hash-routed portal URL (e.g. page and size), replacing existing ones"""
+    for name, value in params.items():
+        if value is None:
+            continue
+        if re.search(rf'[?&]{name}=', url):
+            url = re.sub(rf'([?&]{name}=)[^&]*', rf'\g<1>{value}', url)
+        else:
+            url = f"{url}{'&' if '?' in url else '?'}{name}={value}"
+    return url
+
+
+def route_page_size(url: str) -> Optional[int]:
+    match = re.search(r'[?&]size=(\d+)', url)
+    return int(match.group(1)) if match else None
+
+
+def parse_header_total(text: str) -> Optional[int]:
+    """Total from the "Найдено 1 815" header, ignoring implausibly small numbers"""
+    numbers = re.findall(r'\d+', text.replace(' ', '').replace('\xa0', ''))
+    if numbers:
+        total_items = int(''.join(numbers))
+        if total_items > 10:  # Sanity check
+            return total_items
+    return None
+
+
+def parse_footer_text(text: str) -> Optional[Dict[str, int]]:
+    """Pagination numbers from the "Показано 1 - 10 из 1815 элементов" footer"""
+    match = re.search(r'Показано\s+(\d+)\s*-\s*(\d+)\s+из\s+([\d\s]+)\s+элементов', text)
+    if not match:
+        return None
+    start_item = int(match.group(1))
+    end_item = int(match.group(2))
+    total_items = int(re.sub(r'\s', '', match.group(3)))
+
+    items_per_page = end_item - start_item + 1
+    return {
+        'total_items': total_items,
+        'total_pages': (total_items + items_per_page - 1) // items_per_page,
+        'current_page': (start_item - 1) // items_per_page + 1,
+        'items_per_page': items_per_page,
+        'start_item': start_item,
+        'end_item': end_item
+    }
+
+
+class PaginationInfoCache:
+    """Last detected pagination info, reused (and handed to workers) until it is older than the TTL"""
+    
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else SCRAPING_CONFIG.pagination_cache_ttl
+        self._info: Optional[Dict[str, any]] = None
+        self._detected_at = 0.0
+    
+    def get(self) -> Optional[Dict[str, any]]:
+        if self._info is not None and time.monotonic() - self._detected_at < self.ttl:
+            return self._info
+        return None
+    
+    def put(self, info: Dict[str, any]) -> None:
+        self._info = dict(info)
+        self._detected_at = time.monotonic()
+
+
 class PaginationHandler:
     """Enhanced pagination handler with robust error handling"""
     
-    def __init__(self, driver: webdriver.Chrome, wait: WebDriverWait):
+    def __init__(self, driver: webdriver.Chrome, wait: WebDriverWait, readiness: Optional[PageReadiness] = None):
         self.driver = driver
         self.wait = wait
+        self.readiness = readiness or PageReadiness(driver)
         self.current_page = 1
         self.total_pages = None
         self.total_items = None
         self.items_per_page = 10  # Default from zakup.sk.kz
+        self.page_size: Optional[int] = None  # Route "size" parameter used for navigation, once probed
+        self.navigation_timings: List[Dict[str, any]] = []
         
     def detect_pagination_info(self) -> Dict[str, any]:
         """
@@ -43,7 +181,16 @@ class PaginationHandler:
         
         try:
             # Wait for pagination elements to stabilize
-            time.sleep(2)
+            self.readiness.wait_until_ready("Pagination detection", require_items=False)
+            
+            # Everything in one script call; the per-element methods below are the fallback
+            probed = self.probe_pagination_info()
+            if probed:
+                info.update(probed)
+                info = self._validate_and_calculate(info)
+                self.apply_info(info)
+                logger.info(f"📊 Pagination probed: {info['total_items']} items across {info['total_pages']} pages")
+                return info
             
             # Method 1: Try to find total count in header
             info.update(self._extract_from_header())
@@ -69,10 +216,7 @@ class PaginationHandler:
             info = self._validate_and_calculate(info)
             
             # Cache the results
-            self.total_pages = info['total_pages']
-            self.total_items = info['total_items']
-            self.current_page = info['current_page']
-            self.items_per_page = info['items_per_page']
+            self.apply_info(info)
             
             logger.info(f"📊 Pagination detected: {info['total_items']} items across {info['total_pages']} pages")
             
@@ -82,6 +226,89 @@ class PaginationHandler:
             logger.error(f"Failed to detect pagination info: {e}")
             return info  # Return defaults
     
+    def probe_pagination_info(self) -> Optional[Dict[str, any]]:
+        """
+        Pagination info from a single execute_script call
+        Returns None when neither the header nor the footer shows a total
+        """
+        try:
+            probe = self.driver.execute_script(PAGINATION_PROBE_JS) or {}
+        except Exception as e:
+            logger.debug(f"Pagination probe failed: {e}")
+            return None
+        
+        info = parse_footer_text(probe.get('footer') or '')
+        if info is None:
+            total_items = parse_header_total(probe.get('header') or '')
+            if total_items is None:
+                return None
+            info = {'total_items': total_items, 'items_per_page': self.items_per_page}
+            if probe.get('items'):
+                info['items_per_page'] = probe['items']
+        
+        info['items_on_current_page'] = probe.get('items', 0)
+        info['has_next'] = bool(probe.get('has_next'))
+        info['has_previous'] = bool(probe.get('has_previous'))
+        if probe.get('active_page'):
+            info['current_page'] = probe['active_page']
+        if probe.get('visible_pages'):
+            info['visible_pages'] = probe['visible_pages']
+            info['max_visible_page'] = max(probe['visible_pages'])
+        return info
+    
+    def page_boundary(self) -> Tuple[List[str], Optional[int]]:
+        """Tender IDs on the current page and the total the portal reports right now (for PageBoundaryTracker)"""
+        try:
+            probe = self.driver.execute_script(PAGINATION_PROBE_JS) or {}
+        except Exception as e:
+            logger.debug(f"Page boundary probe failed: {e}")
+            return [], None
+        footer = parse_footer_text(probe.get('footer') or '')
+        total_items = footer['total_items'] if footer else parse_header_total(probe.get('header') or '')
+        return probe.get('ids') or [], total_items
+    
+    def apply_info(self, info: Dict[str, any]) -> None:
+        """Adopt pagination info detected elsewhere (e.g. by another worker) instead of detecting it again"""
+        self.total_pages = info['total_pages']
+        self.total_items = info['total_items']
+        self.current_page = info['current_page']
+        self.items_per_page = info['items_per_page']
+        if info.get('page_size'):
+            self.page_size = info['page_size']
+    
+    def needs_resize(self) -> bool:
+        """True when a page size was probed but the browser still shows another one (e.g. after a restart)"""
+        return self.page_size is not None and route_page_size(self.driver.current_url) != self.page_size
+    
+    def probe_page_size(self, candidates: Optional[List[int]] = None) -> Optional[int]:
+        """
+        Find the largest "size" route parameter the search page honours, trying candidates largest first
+        Leaves the browser on page 1 at that size; returns None when only the default size works
+        """
+        for size in sorted(candidates or PAGE_SIZE_CANDIDATES, reverse=True):
+            if size <= self.items_per_page:
+                break
+            try:
+                self.driver.execute_script(SPA_NAVIGATE_JS, 1, size)
+                self.readiness.wait_until_ready(f"Page size {size} probe",
+                                                timeout=SCRAPING_CONFIG.page_size_probe_timeout)
+                probed = self.probe_pagination_info() or {}
+            except Exception as e:
+                logger.debug(f"Page size {size} probe failed: {e}")
+                continue
+            
+            shown = probed.get('items_on_current_page', 0)
+            total_items = probed.get('total_items', 0)
+            if probed.get('items_per_page') == size or shown == size or (0 < total_items < size and shown == total_items):
+                self.page_size = size
+                self.current_page = 1
+                logger.info(f"📏 Search page accepts {size} tenders per page")
+                return size
+            logger.info(f"Search page ignored size={size} ({shown} items shown)")
+        
+        logger.info(f"📏 Keeping the portal's default page size ({self.items_per_page})")
+        return None
+    
     def _extract_from_header(self) -> Dict[str, any]:
         """Extract pagination info from header section"""
         info = {}
@@ -103,14 +330,12 @@ class PaginationHandler:
                             # Try to extract number after "Найдено"
                             # Handle formats like "Найдено 1 815" or "Найдено 1815"
                             parent_text = elem.find_element(By.XPATH, "..").text if elem.tag_name != 'div' else text
-                            numbers = re.findall(r'\d+', parent_text.replace(' ', '').replace('\xa0', ''))
-                            if numbers:
-                                total_items = int(''.join(numbers))
-                                if total_items > 10:  # Sanity check
-                                    info['total_items'] = total_items
-                                    info['total_pages'] = max(1, (total_items + self.items_per_page - 1) // self.items_per_page)
-                                    logger.debug(f"Found total from header: {total_items} items")
-                                    break
+                            total_items = parse_header_total(parent_text)
+                            if total_items:
+                                info['total_items'] = total_items
+                                info['total_pages'] = max(1, (total_items + self.items_per_page - 1) // self.items_per_page)
+                                logger.debug(f"Found total from header: {total_items} items")
+                                break
                 except Exception:
                     continue
                     
@@ -124,29 +349,11 @@ class PaginationHandler:
         try:
             # Look for "Показано X - Y из Z элементов"
             item_count_elem = self.driver.find_element(By.CSS_SELECTOR, "div.jhi-item-count")
-            text = item_count_elem.text
-            
-            # Pattern: "Показано 1 - 10 из 1815 элементов"
-            match = re.search(r'Показано\s+(\d+)\s*-\s*(\d+)\s+из\s+([\d\s]+)\s+элементов', text)
-            if match:
-                start_item = int(match.group(1))
-                end_item = int(match.group(2))
-                total_items = int(match.group(3).replace(' ', ''))
-                
-                items_per_page = end_item - start_item + 1
-                current_page = (start_item - 1) // items_per_page + 1
-                total_pages = (total_items + items_per_page - 1) // items_per_page
-                
-                logger.debug(f"Footer pagination: page {current_page}/{total_pages}, {total_items} items")
-                
-                return {
-                    'total_items': total_items,
-                    'total_pages': total_pages,
-                    'current_page': current_page,
-                    'items_per_page': items_per_page,
-                    'start_item': start_item,
-                    'end_item': end_item
-                }
+            info = parse_footer_text(item_count_elem.text)
+            if info:
+                logger.debug(f"Footer pagination: page {info['current_page']}/{info['total_pages']}, "
+                             f"{info['total_items']} items")
+                return info
                 
         except Exception as e:
             logger.debug(f"Could not extract from footer: {e}")
@@ -232,38 +439,114 @@ class PaginationHandler:
         
         return info
     
-    def navigate_to_page(self, page_number: int) -> bool:
+    def navigate_to_page(self, page_number: int, strategy: Optional[str] = None) -> bool:
         """
         Navigate to a specific page number with robust error handling
+        Tries in-app navigation first (strategy "spa"), falling back to a URL load
         Returns True if navigation was successful
         """
+        if not self._is_valid_page(page_number):
+            return False
+        
+        strategy = strategy or SCRAPING_CONFIG.navigation_strategy
+        started = time.monotonic()
+        if strategy == "spa" and self._navigate_in_app(page_number):
+            self._record_navigation(page_number, "spa", started)
+            return True
+        
+        if self._navigate_by_url(page_number):
+            self._record_navigation(page_number, "url", started)
+            return True
+        return False
+    
+    def begin_navigation(self, page_number: int) -> Optional[Dict[str, any]]:
+        """
+        Start in-app navigation without waiting for it, so several tabs can load at once
+        Returns the state complete_navigation needs, or None if in-app navigation could not start
+        """
+        if not self._is_valid_page(page_number) or SCRAPING_CONFIG.navigation_strategy != "spa":
+            return None
+        started = time.monotonic()
+        pending = self._start_in_app(page_number)
+        if pending is not None:
+            pending['started'] = started
+        return pending
+    
+    def complete_navigation(self, page_number: int, pending: Optional[Dict[str, any]]) -> bool:
+        """Wait for a navigation started by begin_navigation, falling back to a URL load"""
+        if pending is not None and self._finish_in_app(page_number, pending):
+            self._record_navigation(page_number, "spa", pending['started'])
+            return True
+        if not self._is_valid_page(page_number):
+            return False
+        started = time.monotonic()
+        if self._navigate_by_url(page_number):
+            self._record_navigation(page_number, "url", started)
+            return True
+        return False
+    
+    def _is_valid_page(self, page_number: int) -> bool:
         if page_number < 1:
             logger.error(f"Invalid page number: {page_number}")
             return False
-            
         if self.total_pages and page_number > self.total_pages:
             logger.warning(f"Page {page_number} exceeds total pages {self.total_pages}")
             return False
+        return True
+    
+    def _navigate_in_app(self, page_number: int) -> bool:
+        """Move the running Angular app to a page without reloading it"""
+        pending = self._start_in_app(page_number)
+        return pending is not None and self._finish_in_app(page_number, pending)
+    
+    def _start_in_app(self, page_number: int) -> Optional[Dict[str, any]]:
+        try:
+            resizing = self.needs_resize()
+            previous_first_item = self.readiness.current_first_item()
+            if resizing and page_number == 1:
+                # Page 1 at a larger size starts with the same tender, so only the usual signals apply
+                previous_first_item = None
+            elif previous_first_item is None:
+                # Without a first tender ID there is no way to tell that the page changed
+                return None
             
+            method = self.driver.execute_script(SPA_NAVIGATE_JS, page_number, self.page_size)
+            logger.info(f"Navigating in-app to page {page_number} via {method}")
+            return {'method': method, 'previous_first_item': previous_first_item}
+        except Exception as e:
+            logger.warning(f"In-app navigation to page {page_number} failed: {e}")
+            return None
+    
+    def _finish_in_app(self, page_number: int, pending: Dict[str, any]) -> bool:
         try:
-            # Build URL with page parameter
-            current_url = self.driver.current_url
-            base_url = current_url.split('&page=')[0].split('?page=')[0]
+            if self.readiness.wait_until_ready(f"Page {page_number} ({pending['method']})",
+                                               previous_first_item=pending['previous_first_item']):
+                self.current_page = page_number
+                logger.info(f"✅ Successfully navigated to page {page_number}")
+                return True
             
-            # Add page parameter
-            separator = '&' if '?' in base_url else '?'
-            if 'page=' in current_url:
-                # Replace existing page parameter
-                new_url = re.sub(r'[&?]page=\d+', f'{separator}page={page_number}', current_url)
-            else:
-                # Add new page parameter
-                new_url = f"{base_url}{separator}page={page_number}"
+            logger.warning(f"First tender did not change after in-app navigation to page {page_number}, "
+                           f"falling back to URL navigation")
+            return False
+            
+        except Exception as e:
+            logger.warning(f"In-app navigation to page {page_number} failed: {e}")
+            return False
+    
+    def _navigate_by_url(self, page_number: int) -> bool:
+        """Load the page URL with the page parameter set"""
+        try:
+            # Build URL with page (and page size) parameters
+            current_url = self.driver.current_url
+            resizing = self.needs_resize()
+            new_url = with_route_params(current_url, size=self.page_size, page=page_number)
             
             logger.info(f"Navigating to page {page_number}: {new_url}")
+            previous_first_item = None if resizing and page_number == 1 else self.readiness.current_first_item()
             self.driver.get(new_url)
             
-            # Wait for page to load
-            time.sleep(8)
+            # Wait for the new page of tenders to replace the old one
+            self.readiness.wait_until_ready(f"Page {page_number}", previous_first_item=previous_first_item)
             
             # Wait for tender items to appear
             try:
@@ -284,6 +567,20 @@ class PaginationHandler:
             logger.error(f"Failed to navigate to page {page_number}: {e}")
             return False
     
+    def _record_navigation(self, page_number: int, method: str, started: float) -> None:
+        elapsed = time.monotonic() - started
+        self.navigation_timings.append({'page': page_number, 'method': method, 'seconds': round(elapsed, 3)})
+        logger.info(f"🧭 Page {page_number} reached via {method} navigation in {elapsed:.2f}s")
+    
+    def get_navigation_summary(self) -> Dict[str, any]:
+        """Per-method navigation counts and average time"""
+        summary = {}
+        for method in ('spa', 'url'):
+            seconds = [t['seconds'] for t in self.navigation_timings if t['method'] == method]
+            if seconds:
+                summary[method] = {'pages': len(seconds), 'avg_seconds': round(sum(seconds) / len(seconds), 3)}
+        return summary
+    
     def get_page_range_for_workers(self, num_workers: int, max_pages: Optional[int] = None) -> List[Tuple[int, int]]:
         """
         Split pages optimally across workers
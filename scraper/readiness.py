@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Readiness engine for the zakup.sk.kz Angular SPA
+Waits for concrete page signals instead of fixed sleeps and records how long each wait took
+"""
+
+import time
+import logging
+from typing import Optional, List, Dict, Any
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from config import SCRAPING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Counts in-flight XHR/fetch requests in window.__tfPendingRequests.
+# Installed before any page script runs so the Angular bootstrap requests are tracked too.
+REQUEST_TRACKER_JS = """
+(function () {
+    if (window.__tfPendingRequests !== undefined) { return; }
+    window.__tfPendingRequests = 0;
+    var done = function () { window.__tfPendingRequests = Math.max(0, window.__tfPendingRequests - 1); };
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.__tfPendingRequests++;
+        this.addEventListener('loadend', done);
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            window.__tfPendingRequests++;
+            return fetch.apply(this, arguments).finally(done);
+        };
+    }
+})();
+"""
+
+# One round trip per poll: document state, Angular stability, pending requests and tender items
+READINESS_PROBE_JS = """
+var angularStable = null;
+if (window.getAllAngularTestabilities) {
+    try {
+        angularStable = window.getAllAngularTestabilities().every(function (t) { return t.isStable(); });
+    } catch (e) {
+        angularStable = null;
+    }
+}
+var items = document.querySelectorAll(arguments[0]);
+var first = null;
+if (items.length) {
+    var num = items[0].querySelector('div.m-found-item__num') || items[0];
+    first = (num.textContent || '').trim();
+}
+return {
+    readyState: document.readyState,
+    angularStable: angularStable,
+    pending: window.__tfPendingRequests === undefined ? null : window.__tfPendingRequests,
+    count: items.length,
+    first: first
+};
+"""
+
+ITEM_SELECTOR = "div.m-found-item"
+
+
+class PageReadiness:
+    """Polls the page until Angular is stable, XHRs are idle and the tender list has settled"""
+
+    def __init__(self, driver: webdriver.Chrome, timeout: Optional[float] = None,
+                 poll_interval: Optional[float] = None, settle_time: Optional[float] = None):
+        self.driver = driver
+        self.timeout = timeout if timeout is not None else SCRAPING_CONFIG.page_load_timeout
+        self.poll_interval = poll_interval if poll_interval is not None else SCRAPING_CONFIG.readiness_poll_interval
+        self.settle_time = settle_time if settle_time is not None else SCRAPING_CONFIG.readiness_settle_time
+        self.timings: List[Dict[str, Any]] = []
+        self._tracker_on_new_document = False
+
+    def install_request_tracker(self, new_tab: bool = False) -> None:
+        """
+        Register the XHR/fetch tracker for every new document, falling back to the current one
+        new_tab: the current window is a tab the earlier CDP registration does not cover
+        """
+        if new_tab or not self._tracker_on_new_document:
+            try:
+                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": REQUEST_TRACKER_JS})
+                self._tracker_on_new_document = True
+            except Exception as e:
+                logger.debug(f"Could not register request tracker via CDP: {e}")
+
+        try:
+            self.driver.execute_script(REQUEST_TRACKER_JS)
+        except WebDriverException as e:
+            logger.debug(f"Could not inject request tracker: {e}")
+
+    def current_first_item(self) -> Optional[str]:
+        """Text of the first tender number on the page, used to detect that the list changed"""
+        try:
+            return self._probe().get("first")
+        except WebDriverException:
+            return None
+
+    def wait_until_ready(self, label: str, require_items: bool = True,
+                         previous_first_item: Optional[str] = None,
+                         timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the page is ready, up to the configured ceiling
+        Returns True when all signals were met, False when the ceiling was hit
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        last_count = None
+        stable_since = None
+        state: Dict[str, Any] = {}
+        ready = False
+
+        while True:
+            now = time.monotonic()
+            try:
+                state = self._probe()
+            except WebDriverException as e:
+                # Navigation in progress can briefly reject scripts
+                logger.debug(f"Readiness probe failed during '{label}': {e}")
+                state = {}
+
+            if state.get("pending") is None and state.get("readyState") == "complete":
+                # A full reload dropped the tracker from the current document
+                self.install_request_tracker()
+
+            count = state.get("count")
+            if count != last_count:
+                last_count = count
+                stable_since = now
+
+            if self._signals_met(state, require_items, previous_first_item) and now - stable_since >= self.settle_time:
+                ready = True
+                break
+
+            if now >= deadline:
+                break
+            time.sleep(self.poll_interval)
+
+        elapsed = time.monotonic() - started
+        self.timings.append({"label": label, "seconds": round(elapsed, 3), "ready": ready})
+
+        if ready:
+            logger.info(f"⏱️ {label} ready in {elapsed:.2f}s ({state.get('count', 0)} items)")
+        else:
+            logger.warning(f"⚠️ {label} not ready after {elapsed:.2f}s ceiling, last state: {state}")
+        return ready
+
+    def _probe(self) -> Dict[str, Any]:
+        return self.driver.execute_script(READINESS_PROBE_JS, ITEM_SELECTOR) or {}
+
+    @staticmethod
+    def _signals_met(state: Dict[str, Any], require_items: bool, previous_first_item: Optional[str]) -> bool:
+        if state.get("readyState") != "complete":
+            return False
+        # None means the signal is unavailable on this page, not that it failed
+        if state.get("angularStable") is False:
+            return False
+        if state.get("pending") not in (None, 0):
+            return False
+        if require_items and not state.get("count"):
+            return False
+        if previous_first_item is not None and state.get("first") == previous_first_item:
+            return False
+        return True
+
+    def get_timing_summary(self) -> Dict[str, Any]:
+        """Aggregate wait timings for logging and run summaries"""
+        seconds = [t["seconds"] for t in self.timings]
+        return {
+            "waits": len(seconds),
+            "total_seconds": round(sum(seconds), 3),
+            "max_seconds": max(seconds) if seconds else 0.0,
+            "timeouts": sum(1 for t in self.timings if not t["ready"]),
+        }
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Browser recycling policy for long-running scraper sessions
+Chrome's memory grows across hundreds of SPA navigations; a session is restarted between pages
+after a page budget, or once the chromedriver/Chrome process tree passes an RSS threshold
+"""
+
+import logging
+from typing import Optional
+import psutil
+from config import SCRAPING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+def process_tree_rss_mb(pid: int) -> Optional[float]:
+    """Resident memory of a process and all its descendants, in MB; None if it cannot be read"""
+    try:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            continue  # Renderers come and go between listing and reading
+    return total / 1024 / 1024
+
+
+def browser_rss_mb(driver) -> Optional[float]:
+    """RSS of the chromedriver process tree (Chrome, its GPU and renderer processes)"""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None:
+        return None
+    return process_tree_rss_mb(process.pid)
+
+
+class RecyclePolicy:
+    """Decides when a TenderScraper's browser should be restarted"""
+
+    def __init__(self, max_pages: Optional[int] = None, max_rss_mb: Optional[float] = None,
+                 rss_check_every: Optional[int] = None):
+        self.max_pages = max_pages if max_pages is not None else SCRAPING_CONFIG.recycle_after_pages
+        self.max_rss_mb = max_rss_mb if max_rss_mb is not None else SCRAPING_CONFIG.recycle_max_rss_mb
+        self.rss_check_every = max(1, rss_check_every or SCRAPING_CONFIG.recycle_rss_check_every)
+
+    def reason_to_recycle(self, scraper) -> Optional[str]:
+        """Why the session should be restarted now, or None to keep it"""
+        pages = scraper.pages_visited
+        if self.max_pages and pages >= self.max_pages:
+            return f"{pages} pages"
+        # Walking the process tree costs a few syscalls per process, so only every few pages
+        if self.max_rss_mb and pages and pages % self.rss_check_every == 0:
+            rss = browser_rss_mb(scraper.driver)
+            if rss is not None and rss >= self.max_rss_mb:
+                return f"browser RSS {rss:.0f} MB"
+        return None
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Remote WebDriver backend: Chrome sessions on Selenium Grid hubs or standalone Selenium servers
+Each new session goes to the endpoint with the most free Chrome slots according to its /status, so a
+run spreads across grid nodes (or several standalone hosts) instead of being capped by this host's
+CPU and memory. Sessions speak chromedriver's vendor commands, so CDP calls and the performance log
+keep working through the grid
+"""
+
+import time
+import random
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import requests
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.command import Command
+from config import SCRAPING_CONFIG
+from driver_bootstrap import ColdStartTimings
+
+logger = logging.getLogger(__name__)
+
+CHROME_BROWSER_NAMES = ("chrome", "chromium")
+CAPACITY_POLL_INTERVAL = 2.0  # Seconds between /status rounds while every endpoint is full
+
+
+@dataclass
+class EndpointCapacity:
+    """What one WebDriver endpoint reported on /status"""
+    url: str
+    ready: bool
+    free_slots: int
+    max_sessions: int = 0  # 0 when the endpoint does not list its nodes
+    nodes: int = 0
+
+
+def _is_chrome_slot(slot: Dict[str, Any]) -> bool:
+    browser_name = (slot.get("stereotype") or {}).get("browserName", "chrome")
+    return browser_name.lower() in CHROME_BROWSER_NAMES
+
+
+def parse_status(url: str, status: Dict[str, Any]) -> EndpointCapacity:
+    """
+    Free Chrome slots from a WebDriver /status body
+    Grid 4 hubs and standalone Selenium 4 servers list their nodes and slots; a bare chromedriver or an
+    older server only says whether it is ready, which counts as one free slot
+    """
+    value = status.get("value", status)
+    ready = bool(value.get("ready"))
+    nodes = value.get("nodes")
+    if nodes is None:
+        return EndpointCapacity(url, ready, 1 if ready else 0)
+
+    free, max_sessions, up = 0, 0, 0
+    for node in nodes:
+        if node.get("availability", "UP") != "UP":
+            continue
+        up += 1
+        slots = node.get("slots") or []
+        node_max = node.get("maxSessions") or len(slots)
+        busy = sum(1 for slot in slots if slot.get("session"))
+        idle_chrome = sum(1 for slot in slots if _is_chrome_slot(slot) and not slot.get("session"))
+        max_sessions += node_max
+        # A node with more slots than maxSessions (one per browser type) is full once maxSessions are busy
+        free += max(0, min(idle_chrome, node_max - busy))
+    return EndpointCapacity(url, ready, free if ready else 0, max_sessions, up)
+
+
+def query_capacity(url: str, timeout: Optional[float] = None) -> Optional[EndpointCapacity]:
+    """GET {url}/status; None when the endpoint cannot be reached or does not answer like WebDriver"""
+    timeout = SCRAPING_CONFIG.remote_status_timeout if timeout is None else timeout
+    try:
+        response = requests.get(f"{url.rstrip('/')}/status", timeout=timeout)
+        response.raise_for_status()
+        return parse_status(url, response.json())
+    except (requests.RequestException, ValueError, AttributeError) as e:
+        logger.warning(f"WebDriver endpoint {url} unavailable: {e}")
+        return None
+
+
+class RemoteEndpointPool:
+    """The configured WebDriver endpoints; picks the one with the most free Chrome slots for each new session"""
+
+    def __init__(self, urls: Optional[Iterable[str]] = None, capacity_wait: Optional[float] = None):
+        self.urls = list(urls if urls is not None else SCRAPING_CONFIG.remote_webdriver_urls)
+        if not self.urls:
+            raise ValueError("The remote driver backend needs at least one WebDriver URL "
+                             "(--webdriver-url or SCRAPER_WEBDRIVER_URLS)")
+        self.capacity_wait = SCRAPING_CONFIG.remote_capacity_wait if capacity_wait is None else capacity_wait
+
+    def capacities(self) -> List[EndpointCapacity]:
+        """Query every endpoint at once, so one slow endpoint costs one timeout rather than one each"""
+        with ThreadPoolExecutor(max_workers=len(self.urls)) as executor:
+            return [capacity for capacity in executor.map(query_capacity, self.urls) if capacity is not None]
+
+    def choose(self, exclude: Iterable[str] = ()) -> EndpointCapacity:
+        """
+        The endpoint with the most free slots, waiting up to capacity_wait while all are full
+        Ties are broken at random: workers starting together would otherwise all pick the same endpoint
+        """
+        exclude = set(exclude)
+        deadline = time.monotonic() + self.capacity_wait
+        while True:
+            available = [capacity for capacity in self.capacities()
+                         if capacity.free_slots > 0 and capacity.url not in exclude]
+            if available:
+                most = max(capacity.free_slots for capacity in available)
+                return random.choice([capacity for capacity in available if capacity.free_slots == most])
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"No WebDriver endpoint had a free Chrome slot within "
+                                   f"{self.capacity_wait:.0f}s: {', '.join(self.urls)}")
+            time.sleep(CAPACITY_POLL_INTERVAL)
+
+
+class RemoteChromeDriver(webdriver.Remote):
+    """webdriver.Remote that also sends chromedriver's vendor commands (CDP, performance log) through the grid"""
+
+    def __init__(self, url: str, options: webdriver.ChromeOptions):
+        connection = ChromiumRemoteConnection(url, vendor_prefix="goog", browser_name="chrome")
+        super().__init__(command_executor=connection, options=options)
+
+    def get_log(self, log_type: str):
+        return self.execute(Command.GET_LOG, {"type": log_type})["value"]
+
+
+def create_remote_driver(options: webdriver.ChromeOptions,
+                         endpoints: Optional[RemoteEndpointPool] = None) -> Tuple[RemoteChromeDriver, ColdStartTimings]:
+    """
+    Open a Chrome session on the endpoint with the most free capacity
+    An endpoint that refuses the session is skipped for the next attempt; resolve_seconds is the time
+    spent choosing endpoints and spawn_seconds the session start on the one that took it
+    """
+    endpoints = endpoints or RemoteEndpointPool()
+    timings = ColdStartTimings()
+    refused: List[str] = []
+    while True:
+        started = time.monotonic()
+        endpoint = endpoints.choose(exclude=refused)
+        timings.resolve_seconds += time.monotonic() - started
+
+        started = time.monotonic()
+        try:
+            driver = RemoteChromeDriver(endpoint.url, options)
+        except WebDriverException as e:
+            logger.warning(f"WebDriver endpoint {endpoint.url} refused a session: {e}")
+            refused.append(endpoint.url)
+            if len(refused) >= len(endpoints.urls):
+                raise
+            continue
+        timings.spawn_seconds = time.monotonic() - started
+        timings.endpoint = endpoint.url
+        logger.info(f"🌐 Remote browser on {endpoint.url} ({endpoint.free_slots} free Chrome slots "
+                    f"across {endpoint.nodes or 1} nodes before this session)")
+        return driver, timings
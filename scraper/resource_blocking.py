@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+DevTools request blocking for the zakup.sk.kz scraper
+Blocks images, fonts, media and third-party analytics with Network.setBlockedURLs and
+reports per-page bytes transferred and (estimated) bytes saved
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from config import SCRAPING_CONFIG
+from devtools import DevToolsEvent, DevToolsEventLog
+
+logger = logging.getLogger(__name__)
+
+# URL patterns per DevTools resource type. setBlockedURLs matches URLs, not types,
+# so types are approximated by file extension.
+RESOURCE_TYPE_PATTERNS: Dict[str, List[str]] = {
+    "Image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.bmp*"],
+    "Font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+    "Media": ["*.mp4*", "*.webm*", "*.mp3*", "*.ogg*", "*.wav*"],
+    "Stylesheet": ["*.css*"],
+}
+
+# Typical transfer sizes used to estimate what a blocked request would have cost
+ESTIMATED_BYTES: Dict[str, int] = {
+    "Image": 25_000,
+    "Font": 40_000,
+    "Media": 500_000,
+    "Stylesheet": 30_000,
+    "Script": 60_000,
+}
+DEFAULT_ESTIMATED_BYTES = 10_000
+
+
+def format_bytes(count: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(count) < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+
+class ResourceBlocker:
+    """Applies the block list to a driver and accounts for bandwidth per page"""
+
+    def __init__(self, blocked_types: Optional[Iterable[str]] = None,
+                 blocked_domains: Optional[Iterable[str]] = None,
+                 allowed_domains: Optional[Iterable[str]] = None):
+        if blocked_types is None:
+            blocked_types = list(SCRAPING_CONFIG.blocked_resource_types)
+            if SCRAPING_CONFIG.disable_images:
+                blocked_types.append("Image")
+        self.blocked_types = sorted(set(blocked_types))
+        allowed = set(allowed_domains if allowed_domains is not None else SCRAPING_CONFIG.allowed_domains)
+        domains = blocked_domains if blocked_domains is not None else SCRAPING_CONFIG.blocked_domains
+        self.blocked_domains = sorted(d for d in set(domains) if d not in allowed)
+        self._reset_page()
+        self.totals = {"bytes_transferred": 0, "requests_blocked": 0, "estimated_bytes_saved": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.blocked_types or self.blocked_domains)
+
+    def url_patterns(self) -> List[str]:
+        patterns = []
+        for resource_type in self.blocked_types:
+            patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+        for domain in self.blocked_domains:
+            patterns.append(f"*://{domain}/*")
+            patterns.append(f"*://*.{domain}/*")
+        return patterns
+
+    def apply(self, driver: webdriver.Chrome, devtools: DevToolsEventLog) -> None:
+        """Install the block list on the driver and start listening for network events"""
+        devtools.add_listener(self.on_event)
+        self.block_urls(driver)
+
+    def block_urls(self, driver: webdriver.Chrome) -> None:
+        """Install the block list on the current tab (CDP state is per tab, so new tabs need it too)"""
+        if not self.enabled:
+            return
+        patterns = self.url_patterns()
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            logger.info(f"🚫 Blocking {', '.join(self.blocked_types) or 'no types'} and "
+                        f"{len(self.blocked_domains)} domains ({len(patterns)} URL patterns)")
+        except WebDriverException as e:
+            logger.warning(f"Could not apply resource blocking: {e}")
+
+    def _reset_page(self) -> None:
+        self._bytes_transferred = 0
+        self._blocked_by_type: Dict[str, int] = defaultdict(int)
+
+    def on_event(self, event: DevToolsEvent) -> None:
+        params = event["params"]
+        if event["method"] == "Network.loadingFinished":
+            self._bytes_transferred += int(params.get("encodedDataLength") or 0)
+        elif event["method"] == "Network.loadingFailed" and params.get("blockedReason"):
+            self._blocked_by_type[params.get("type", "Other")] += 1
+
+    def take_page_stats(self, page: int) -> Dict[str, Any]:
+        """Close the accounting window for a page, log it and return its numbers"""
+        saved = sum(count * ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+                    for resource_type, count in self._blocked_by_type.items())
+        stats = {
+            "page": page,
+            "bytes_transferred": self._bytes_transferred,
+            "requests_blocked": sum(self._blocked_by_type.values()),
+            "blocked_by_type": dict(self._blocked_by_type),
+            "estimated_bytes_saved": saved,
+        }
+        self.totals["bytes_transferred"] += stats["bytes_transferred"]
+        self.totals["requests_blocked"] += stats["requests_blocked"]
+        self.totals["estimated_bytes_saved"] += saved
+        self._reset_page()
+
+        logger.info(f"📦 Page {page}: {format_bytes(stats['bytes_transferred'])} transferred, "
+                    f"{stats['requests_blocked']} requests blocked (~{format_bytes(saved)} saved)")
+        return stats
+
+    def get_totals_summary(self) -> str:
+        return (f"{format_bytes(self.totals['bytes_transferred'])} transferred, "
+                f"{self.totals['requests_blocked']} requests blocked "
+                f"(~{format_bytes(self.totals['estimated_bytes_saved'])} saved)")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Single writer process for streamed scraping results
+Workers put one message per completed page on a shared queue; the writer journals it and appends it
+to the CSV straight away, so memory stays flat and results are on disk as soon as each page finishes.
+With --enrich, pages first pass through a separate enrichment thread with its own concurrency limit,
+so slow detail requests never hold up the channel the scraping workers put pages on. Tenders are deduplicated by ID on the way, since pages that shifted
+during the run (and boundary re-fetches) repeat tenders already written
+"""
+
+import csv
+import time
+import queue
+import logging
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from config import SCRAPING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# ("records", page, tenders) from record modes, ("snapshot", page, page_source) from snapshot mode
+PageMessage = Tuple[str, int, Any]
+
+
+class ResultWriter(multiprocessing.Process):
+    """
+    Consumes PageMessages until it receives None
+    Not a daemon: in snapshot mode it runs its own parser pool, and daemonic processes cannot have children
+    """
+
+    def __init__(self, channel, stats, csv_path: str, journal=None, min_value: float = 0,
+                 max_days_left: Optional[int] = None, enrich: Optional[str] = None,
+                 record_known: bool = False, headless: bool = True, extraction_mode: Optional[str] = None):
+        super().__init__(name="result-writer")
+        self.channel = channel
+        self.stats = stats  # Manager dict the coordinator reads once the writer has finished
+        self.csv_path = csv_path
+        self.journal = journal
+        self.min_value = min_value
+        self.max_days_left = max_days_left
+        self.enrich = enrich
+        self.record_known = record_known
+        self.headless = headless
+        self.extraction_mode = extraction_mode
+
+    def run(self) -> None:
+        from scraper import filter_tenders, result_fields
+
+        self._parser_pool = None
+        if self.extraction_mode == "snapshot":
+            from page_parser import ParserPool
+            self._parser_pool = ParserPool()
+        self._enricher, self._enrich_session = self._create_enricher()
+        # One thread: the enricher fetches up to enrichment_concurrency details at once itself, and a
+        # browser fetcher's driver must only be used from one thread
+        self._enrich_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enrichment") \
+            if self._enricher else None
+        self._enriching: List[Any] = []
+        self._known = None
+        if self.record_known:
+            from known_tenders import KnownTenderIndex
+            self._known = KnownTenderIndex.load()
+        self._filter = filter_tenders
+        self._pending: List[Any] = []
+        self._counts = {"pages": 0, "tenders": 0, "journaled_pages": 0, "duplicates": 0}
+        self._seen_ids = set()
+        self._handled_pages = set()
+
+        fields = result_fields(self.extraction_mode, enriched=self._enricher is not None)
+        try:
+            with open(self.csv_path, "w", newline="", encoding="utf-8") as file:
+                self._writer = csv.DictWriter(file, fieldnames=fields, extrasaction="ignore")
+                self._writer.writeheader()
+                self._file = file
+                self._write_journaled_pages()
+                self._consume()
+                self._drain_parsed(wait=True)
+                self._drain_enriched(wait=True)
+        finally:
+            self._close()
+            self.stats.update(self._counts)
+            logger.info(f"🖊️ Writer finished: {self._counts['pages']} pages, {self._counts['tenders']} tenders "
+                        f"written to {self.csv_path} ({self._counts['duplicates']} duplicates dropped)")
+
+    def _create_enricher(self):
+        if not self.enrich:
+            return None, None
+        from enrichment import DetailEnricher, ApiDetailFetcher, BrowserDetailFetcher
+        if self.enrich == "browser":
+            from session_pool import get_session_pool
+            session = get_session_pool(headless=self.headless, extraction_mode=self.extraction_mode).acquire()
+            return DetailEnricher(BrowserDetailFetcher(session.driver)), session
+        return DetailEnricher(ApiDetailFetcher()), None
+
+    def _write_journaled_pages(self) -> None:
+        """On resume, pages journaled before the crash go out first (they are already filtered and enriched)"""
+        if self.journal is None:
+            return
+        for page, records in self.journal.iter_pages():
+            self._write(self._unseen(records))
+            if page not in self._handled_pages:
+                self._handled_pages.add(page)
+                self._counts["journaled_pages"] += 1
+        if self._counts["journaled_pages"]:
+            logger.info(f"Copied {self._counts['journaled_pages']} journaled pages into {self.csv_path}")
+
+    def _consume(self) -> None:
+        while True:
+            try:
+                message = self.channel.get(timeout=SCRAPING_CONFIG.readiness_poll_interval * 4)
+            except queue.Empty:
+                self._drain_parsed()
+                self._drain_enriched()
+                continue
+            if message is None:
+                return
+            kind, page, payload = message
+            if kind == "snapshot":
+                self._pending.append(self._parser_pool.submit(page, payload))
+            else:
+                self._handle_page(page, payload)
+            self._drain_parsed()
+            self._drain_enriched()
+
+    def _drain_parsed(self, wait: bool = False) -> None:
+        """Hand finished snapshot parses on to _handle_page"""
+        still_pending = []
+        for future in self._pending:
+            if not (wait or future.done()):
+                still_pending.append(future)
+                continue
+            try:
+                page, tenders = future.result()
+            except Exception as e:
+                logger.error(f"❌ Failed to parse page snapshot: {e}")
+                continue
+            self._handle_page(page, self._filter(tenders, self.min_value, self.max_days_left))
+        self._pending = still_pending
+
+    def _drain_enriched(self, wait: bool = False) -> None:
+        """Write pages whose enrichment has finished"""
+        still_enriching = []
+        for future in self._enriching:
+            if not (wait or future.done()):
+                still_enriching.append(future)
+                continue
+            self._finish_page(*future.result())
+        self._enriching = still_enriching
+
+    def _unseen(self, tenders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop tenders already written in this run (records without an ID always pass)"""
+        unseen = []
+        for tender in tenders:
+            tender_id = tender.get("id")
+            if tender_id and tender_id in self._seen_ids:
+                self._counts["duplicates"] += 1
+                continue
+            if tender_id:
+                self._seen_ids.add(tender_id)
+            unseen.append(tender)
+        return unseen
+
+    def _handle_page(self, page: int, tenders: List[Dict[str, Any]]) -> None:
+        tenders = self._unseen(tenders)
+        refetch = page in self._handled_pages
+        self._handled_pages.add(page)
+        if self._known is not None:
+            # Fingerprinted from the list records, before enrichment adds detail fields
+            self._known.update(tenders)
+        if self._enricher:
+            self._enriching.append(self._enrich_executor.submit(self._enrich_page, page, tenders, refetch))
+        else:
+            self._finish_page(page, tenders, refetch)
+
+    def _enrich_page(self, page: int, tenders: List[Dict[str, Any]], refetch: bool):
+        """Runs on the enrichment thread; a failed page is still written, with list fields only"""
+        try:
+            self._enricher.enrich(tenders, save_cache=False)
+        except Exception as e:
+            logger.error(f"❌ Detail enrichment failed for page {page}: {e}")
+        return page, tenders, refetch
+
+    def _finish_page(self, page: int, tenders: List[Dict[str, Any]], refetch: bool) -> None:
+        if self.journal is not None:
+            self.journal.record_page(page, tenders, refetch=refetch)
+        self._write(tenders)
+        self._counts["pages"] += 1
+
+    def _write(self, tenders: List[Dict[str, Any]]) -> None:
+        self._writer.writerows(tenders)
+        self._file.flush()
+        self._counts["tenders"] += len(tenders)
+
+    def _close(self) -> None:
+        if self._parser_pool:
+            self._parser_pool.close()
+        if self._enrich_executor:
+            self._enrich_executor.shutdown(wait=True)
+        if self._enricher:
+            self._enricher.cache.save()
+            self._enricher.fetcher.close()
+        if self._enrich_session:
+            self._enrich_session.close()
+        if self._known is not None:
+            self._known.save()
+        if self.journal is not None:
+            self.journal.close()
+
+
+def start_writer(manager, csv_path: str, **options) -> Tuple[Any, Any, ResultWriter]:
+    """Create the bounded page channel and start the writer; returns (channel, stats, writer)"""
+    channel = manager.Queue(maxsize=SCRAPING_CONFIG.result_queue_size)
+    stats = manager.dict()
+    writer = ResultWriter(channel, stats, csv_path, **options)
+    writer.start()
+    return channel, stats, writer
+
+
+def stop_writer(channel, writer: ResultWriter, timeout: Optional[float] = None) -> None:
+    """Send the end-of-run marker and wait for everything queued to be written"""
+    started = time.monotonic()
+    channel.put(None)
+    writer.join(timeout)
+    if writer.is_alive():
+        logger.error("❌ Result writer did not finish in time, terminating it")
+        writer.terminate()
+    else:
+        logger.debug(f"Writer drained in {time.monotonic() - started:.1f}s")
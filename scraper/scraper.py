@@ -2,19 +2,30 @@
 import math
 import re
 import csv
+import json
 import logging
 from typing import List, Dict, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, WebDriverException, StaleElementReferenceException
 from datetime import datetime
 from contextlib import contextmanager
-from config import TENDER_URL, TENDER_PAGE_URL, TENDERS_PER_PAGE, CSV_FIELDS
+from functools import partial
+from config import (
+    TENDER_URL, TENDER_PAGE_URL, TENDERS_PER_PAGE, CSV_FIELDS, ENRICHED_FIELDS, API_FIELDS, SCRAPING_CONFIG,
+    SEARCH_XHR_PATTERN
+)
 from pagination_handler import PaginationHandler
+from readiness import PageReadiness
+from driver_bootstrap import create_driver
+from browser_lifecycle import BrowserProcessTree
+from browser_profiles import ProfileSlot
+from devtools import DevToolsEventLog, enable_performance_log
+from api_records import tenders_from_payload, TENDER_URL_TEMPLATE
+from resource_blocking import ResourceBlocker
+from supervisor import SessionSupervisor
 import time
 
 logging.basicConfig(
@@ -23,36 +34,150 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Reads every div.m-found-item on the page in a single WebDriver round trip.
+# Mirrors the selectors used by the per-element path in _extract_with_elements.
+EXTRACT_TENDERS_JS = """
+var text = function (root, selector) {
+    var el = root.querySelector(selector);
+    return el ? (el.innerText || el.textContent || '').trim() : null;
+};
+var items = document.querySelectorAll('div.m-found-item');
+var results = [];
+for (var i = 0; i < items.length; i++) {
+    var item = items[i];
+    var status = '';
+    var layouts = item.querySelectorAll('div.m-found-item__layout');
+    for (var j = 0; j < layouts.length; j++) {
+        var layoutText = (layouts[j].innerText || '').trim();
+        if (layoutText && layoutText.indexOf('Осталось') === -1 && layoutText.indexOf('Стоимость') === -1) {
+            status = layoutText;
+            break;
+        }
+    }
+    results.push({
+        id: text(item, 'div.m-found-item__num') || '',
+        title: text(item, 'h3.m-found-item__title') || '',
+        status: status,
+        days_left: text(item, 'span.m-span.m-span--danger, span.m-span.m-span--success') || 'N/A',
+        value: text(item, 'div.m-found-item__col--sum span.m-span--dark')
+    });
+}
+return results;
+"""
+
 class TenderScraper:
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, extraction_mode: Optional[str] = None):
+        self.headless = headless
+        self.extraction_mode = extraction_mode or SCRAPING_CONFIG.extraction_mode
+        self.resource_blocker = ResourceBlocker()
+        # The performance log feeds both network extraction and per-page byte accounting
+        self.performance_log = self.extraction_mode == "network" or self.resource_blocker.enabled
+        self._search_responses: List[Dict[str, str]] = []
+        self.pagination = None
+        self.round_trips = 0
+        self.page_round_trips: Dict[int, int] = {}
+        self.pages_visited = 0  # Pages navigated to since this browser was started
+        self.recycles = 0
+        self._start_browser()
+
+    def _start_browser(self) -> None:
         options = webdriver.ChromeOptions()
-        if headless:
+        if self.headless:
             options.add_argument('--headless=new')
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
+        if not SCRAPING_CONFIG.browser_dev_shm:
+            # Docker's default 64 MB /dev/shm crashes renderers; shared memory goes to the temp directory
+            options.add_argument('--disable-dev-shm-usage')
+        # Tabs loading in the background (multi-tab mode) must not have their timers and renderers throttled
+        options.add_argument('--disable-background-timer-throttling')
+        options.add_argument('--disable-renderer-backgrounding')
+        options.add_argument('--disable-backgrounding-occluded-windows')
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        if self.performance_log:
+            enable_performance_log(options)
+        # A persistent profile keeps the portal's bundle in the HTTP and code caches between sessions
+        # (profile slots are directories on this host, so remote browsers start with a fresh one)
+        local = SCRAPING_CONFIG.driver_backend == "local"
+        self.profile = ProfileSlot.acquire() if SCRAPING_CONFIG.persistent_profiles and local else None
+        if self.profile:
+            for argument in self.profile.chrome_arguments():
+                options.add_argument(argument)
+        try:
+            self.driver, self.cold_start = create_driver(options)
+        except Exception:
+            if self.profile:
+                self.profile.release(clean=False)
+            raise
+        self.process_tree = BrowserProcessTree(self.driver)
+        if self.profile:
+            self.cold_start.profile = self.profile.state
+        self._created_at = time.monotonic()
         self.wait = WebDriverWait(self.driver, 20)
+        self.readiness = PageReadiness(self.driver)
+        self.devtools = DevToolsEventLog(self.driver)
+        self.devtools.add_listener(self._capture_search_response)
+        self.resource_blocker.apply(self.driver, self.devtools)
+        self._count_round_trips()
+
+    def restart_browser(self, url: str, reason: str = "") -> None:
+        """
+        Replace the browser with a fresh one on the search page, keeping pagination info,
+        counters and timings, so the caller carries on with its next page
+        Also used to respawn a browser that died, so the old one may not answer quit()
+        """
+        logging.info(f"♻️ Restarting browser after {self.pages_visited} pages{f' ({reason})' if reason else ''}")
+        old_pagination, old_timings = self.pagination, self.readiness.timings
+        self.close()
+        self._start_browser()
+        self.readiness.timings = old_timings
         self.pagination = None
+        self.pages_visited = 0
+        self.open_site(url)
+        if old_pagination and self.pagination:
+            self.pagination.navigation_timings = old_pagination.navigation_timings
+            if old_pagination.total_pages:
+                self.pagination.apply_info({
+                    'total_pages': old_pagination.total_pages,
+                    'total_items': old_pagination.total_items,
+                    'current_page': 1,
+                    'items_per_page': old_pagination.items_per_page,
+                    'page_size': old_pagination.page_size,
+                })
+
+    def _count_round_trips(self) -> None:
+        """Count every command sent to chromedriver (WebElement calls go through driver.execute too)"""
+        execute = self.driver.execute
+
+        def counting_execute(*args, **kwargs):
+            self.round_trips += 1
+            return execute(*args, **kwargs)
+
+        self.driver.execute = counting_execute
 
     def open_site(self, url: str) -> None:
+        self.readiness.install_request_tracker()
+        
         # First go to main page
         main_url = "https://zakup.sk.kz/#/ext"
         logging.info(f"Opening main page: {main_url}")
         self.driver.get(main_url)
         
         # Wait for main page to load
-        time.sleep(5)
+        self.readiness.wait_until_ready("Main page", require_items=False)
         
         # Now navigate to search/tenders page
         logging.info(f"Navigating to: {url}")
         self.driver.get(url)
         
-        # Wait for Angular app to load
+        # Wait for Angular app to load and render the tender list
         logging.info("Waiting for Angular app to load...")
-        time.sleep(12)  # Give more time for Angular to load
+        self.readiness.wait_until_ready("Search page")
+        
+        if self.cold_start.first_page_seconds is None:
+            self.cold_start.first_page_seconds = time.monotonic() - self._created_at
+            logging.info(f"🚀 Browser cold start: {self.cold_start.summary()}")
         
         # Wait for tender items to appear
         try:
@@ -62,12 +187,12 @@ class TenderScraper:
             logging.info("✅ Tender items found on page")
             
             # Initialize pagination handler
-            self.pagination = PaginationHandler(self.driver, self.wait)
+            self.pagination = PaginationHandler(self.driver, self.wait, self.readiness)
             
         except TimeoutException:
             logging.warning("⚠️ No tender items found initially, continuing anyway...")
             # Still initialize pagination handler for diagnostics
-            self.pagination = PaginationHandler(self.driver, self.wait)
+            self.pagination = PaginationHandler(self.driver, self.wait, self.readiness)
 
     def get_total_pages(self) -> int:
         """Use the enhanced pagination handler to get total pages"""
@@ -86,86 +211,78 @@ class TenderScraper:
             logging.error(f"Failed to get total pages: {e}")
             return 5  # Safe fallback
 
-    def extract_tenders_from_page(self, page: int) -> List[Dict[str, str]]:
-        """Extract tenders from a specific page using enhanced pagination"""
-        if page == 1:
-            # Already on page 1, don't reload
-            logging.info(f"Extracting from current page (page 1)")
+    def go_to_page(self, page: int) -> bool:
+        """Make sure the browser shows the given results page; False if navigation failed"""
+        current_page = self.pagination.current_page if self.pagination else 1
+        self.pages_visited += 1
+        if page == current_page and not (self.pagination and self.pagination.needs_resize()):
+            # Already on this page (a fresh or reused session), don't reload
+            logging.info(f"Extracting from current page (page {page})")
         else:
             # Use pagination handler for reliable navigation
             if self.pagination and hasattr(self.pagination, 'navigate_to_page'):
                 success = self.pagination.navigate_to_page(page)
                 if not success:
                     logging.error(f"Failed to navigate to page {page}")
-                    return []
+                    return False
             else:
                 # Fallback to direct URL navigation
                 url = TENDER_PAGE_URL.format(page=page)
                 logging.info(f"Loading page {page}: {url}")
+                previous_first_item = self.readiness.current_first_item()
                 self.driver.get(url)
-                time.sleep(10)
+                self.readiness.wait_until_ready(f"Page {page}", previous_first_item=previous_first_item)
+        return True
+
+    def capture_page_source(self, page: int) -> Optional[str]:
+        """Navigate to a page and return its HTML for offline parsing; None if the page has no tenders"""
+        round_trips_before = self.round_trips
+        source = None
+        if self.go_to_page(page):
+            try:
+                self.wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.m-found-item")))
+                source = self.driver.page_source
+            except TimeoutException:
+                logging.warning(f"Timeout waiting for tender items on page {page}")
+        self._record_page_stats(page, round_trips_before)
+        return source
+
+    def extract_tenders_from_page(self, page: int) -> List[Dict[str, str]]:
+        """Extract tenders from a specific page using enhanced pagination"""
+        tenders = self.scrape_page(page)
+        return tenders if tenders is not None else []
+
+    def scrape_page(self, page: int) -> Optional[List[Dict[str, str]]]:
+        """Like extract_tenders_from_page, but returns None when the page could not be scraped"""
+        # Navigation round trips count towards the page too
+        round_trips_before = self.round_trips
+        if not self.go_to_page(page):
+            self._record_page_stats(page, round_trips_before)
+            return None
         
         max_retries = 3
+        
+        if self.extraction_mode == "network":
+            # The search XHR has already landed by the time navigation reports ready
+            tenders = self._extract_from_network(page)
+            if tenders is not None:
+                self._record_page_stats(page, round_trips_before)
+                return tenders
+        
         for attempt in range(1, max_retries + 1):
-            tenders = []
             try:
                 # Wait for tender items to be present
                 self.wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.m-found-item")))
-                tender_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.m-found-item")
-                
-                logging.info(f"Found {len(tender_elements)} tender elements on page {page}")
                 
-                for idx, tender in enumerate(tender_elements):
-                    try:
-                        # Extract tender ID
-                        tender_id = self.safe_get_text(tender, "div.m-found-item__num")
-                        tender_id = tender_id.replace("№", "").strip()
-                        
-                        # Extract title
-                        title = self.safe_get_text(tender, "h3.m-found-item__title")
-                        
-                        # Extract status/type (e.g., "Открытый тендер")
-                        # Get all layout divs and find the one with status text
-                        layouts = tender.find_elements(By.CSS_SELECTOR, "div.m-found-item__layout")
-                        status = ""
-                        for layout in layouts:
-                            layout_text = layout.text.strip()
-                            # Skip if it contains "Осталось" or "Стоимость" (these are in cols)
-                            if layout_text and "Осталось" not in layout_text and "Стоимость" not in layout_text:
-                                status = layout_text
-                                break
-                        
-                        # Extract days left
-                        days_left = self.safe_get_text(
-                            tender, "span.m-span.m-span--danger, span.m-span.m-span--success", default="N/A"
-                        )
-                        
-                        # Extract value
-                        value_elem = tender.find_elements(By.CSS_SELECTOR, "div.m-found-item__col--sum span.m-span--dark")
-                        value = value_elem[0].text.strip() if value_elem else "0 ₸"
-                        
-                        # Build tender URL
-                        tender_url = f"https://zakup.sk.kz/#/ext(popup:item/{tender_id}/advert)?tabs=advert&adst=PUBLISHED&lst=PUBLISHED&page={page}"
-                        
-                        tenders.append({
-                            "id": tender_id,
-                            "title": title,
-                            "status": status,
-                            "days_left": days_left,
-                            "value": value,
-                            "url": tender_url
-                        })
-                        
-                        logging.debug(f"Extracted tender {tender_id}: {title[:50]}...")
-                        
-                    except StaleElementReferenceException:
-                        logging.warning(f"Stale element in tender idx {idx} on page {page}, skipping this tender.")
-                        continue
-                    except Exception as e:
-                        logging.warning(f"Could not extract tender data at idx {idx} on page {page}: {e}")
+                tenders = None
+                if self.extraction_mode != "elements":
+                    tenders = self._extract_with_script(page)
+                if tenders is None:
+                    tenders = self._extract_with_elements(page)
                 
                 if tenders:
                     logging.info(f"✅ Successfully extracted {len(tenders)} tenders from page {page}")
+                self._record_page_stats(page, round_trips_before)
                 return tenders  # Success, return results
                 
             except TimeoutException:
@@ -174,7 +291,8 @@ class TenderScraper:
                     time.sleep(3)
                     continue
                 else:
-                    return []
+                    self._record_page_stats(page, round_trips_before)
+                    return None
             except StaleElementReferenceException:
                 logging.warning(f"[Attempt {attempt}/{max_retries}] Stale element encountered on page {page}, retrying...")
                 time.sleep(2)
@@ -184,7 +302,139 @@ class TenderScraper:
                 break
                 
         logging.error(f"Failed to extract tenders from page {page} after {max_retries} attempts.")
-        return []
+        self._record_page_stats(page, round_trips_before)
+        return None
+
+    def _capture_search_response(self, event: Dict) -> None:
+        """DevTools listener: remember JSON responses from the portal's search API"""
+        if event["method"] != "Network.responseReceived":
+            return
+        response = event["params"].get("response", {})
+        if re.search(SEARCH_XHR_PATTERN, response.get("url", "")) and "json" in response.get("mimeType", ""):
+            self._search_responses.append({
+                "request_id": event["params"].get("requestId"),
+                "url": response.get("url")
+            })
+
+    def _extract_from_network(self, page: int) -> Optional[List[Dict[str, str]]]:
+        """Build records from the newest captured search response; None means fall back to the DOM"""
+        self.devtools.poll()
+        responses, self._search_responses = self._search_responses, []
+        
+        # Newest first: earlier responses belong to pages we already left
+        for response in reversed(responses):
+            body = self.devtools.get_response_body(response["request_id"])
+            if not body:
+                continue
+            try:
+                tenders = tenders_from_payload(json.loads(body), page)
+            except ValueError:
+                continue
+            if tenders is not None:
+                logging.info(f"Captured {len(tenders)} tenders for page {page} from {response['url']}")
+                return tenders
+        
+        logging.warning(f"No search response captured for page {page}, falling back to DOM extraction")
+        return None
+
+    def _extract_with_script(self, page: int) -> Optional[List[Dict[str, str]]]:
+        """Extract all tenders with one execute_script call; None means fall back to elements"""
+        try:
+            rows = self.driver.execute_script(EXTRACT_TENDERS_JS)
+        except WebDriverException as e:
+            logging.warning(f"Script extraction failed on page {page}, falling back to element extraction: {e}")
+            return None
+        
+        if not isinstance(rows, list):
+            logging.warning(f"Script extraction returned {type(rows).__name__} on page {page}, falling back to element extraction")
+            return None
+        
+        logging.info(f"Found {len(rows)} tender elements on page {page}")
+        tenders = []
+        for row in rows:
+            tender_id = (row.get("id") or "").replace("№", "").strip()
+            value = row.get("value")
+            tenders.append(self._build_tender(
+                tender_id,
+                row.get("title") or "",
+                row.get("status") or "",
+                row.get("days_left") or "N/A",
+                value if value is not None else "0 ₸",
+                page
+            ))
+            logging.debug(f"Extracted tender {tender_id}: {(row.get('title') or '')[:50]}...")
+        return tenders
+
+    def _extract_with_elements(self, page: int) -> List[Dict[str, str]]:
+        """Extract tenders by walking div.m-found-item with per-element WebDriver calls"""
+        tenders = []
+        tender_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.m-found-item")
+        
+        logging.info(f"Found {len(tender_elements)} tender elements on page {page}")
+        
+        for idx, tender in enumerate(tender_elements):
+            try:
+                # Extract tender ID
+                tender_id = self.safe_get_text(tender, "div.m-found-item__num")
+                tender_id = tender_id.replace("№", "").strip()
+                
+                # Extract title
+                title = self.safe_get_text(tender, "h3.m-found-item__title")
+                
+                # Extract status/type (e.g., "Открытый тендер")
+                # Get all layout divs and find the one with status text
+                layouts = tender.find_elements(By.CSS_SELECTOR, "div.m-found-item__layout")
+                status = ""
+                for layout in layouts:
+                    layout_text = layout.text.strip()
+                    # Skip if it contains "Осталось" or "Стоимость" (these are in cols)
+                    if layout_text and "Осталось" not in layout_text and "Стоимость" not in layout_text:
+                        status = layout_text
+                        break
+                
+                # Extract days left
+                days_left = self.safe_get_text(
+                    tender, "span.m-span.m-span--danger, span.m-span.m-span--success", default="N/A"
+                )
+                
+                # Extract value
+                value_elem = tender.find_elements(By.CSS_SELECTOR, "div.m-found-item__col--sum span.m-span--dark")
+                value = value_elem[0].text.strip() if value_elem else "0 ₸"
+                
+                tenders.append(self._build_tender(tender_id, title, status, days_left, value, page))
+                
+                logging.debug(f"Extracted tender {tender_id}: {title[:50]}...")
+                
+            except StaleElementReferenceException:
+                logging.warning(f"Stale element in tender idx {idx} on page {page}, skipping this tender.")
+                continue
+            except Exception as e:
+                logging.warning(f"Could not extract tender data at idx {idx} on page {page}: {e}")
+        
+        return tenders
+
+    @staticmethod
+    def _build_tender(tender_id: str, title: str, status: str, days_left: str, value: str, page: int) -> Dict[str, str]:
+        # Build tender URL
+        tender_url = TENDER_URL_TEMPLATE.format(tender_id=tender_id, page=page)
+        
+        return {
+            "id": tender_id,
+            "title": title,
+            "status": status,
+            "days_left": days_left,
+            "value": value,
+            "url": tender_url
+        }
+
+    def _record_page_stats(self, page: int, round_trips_before: int) -> None:
+        round_trips = self.round_trips - round_trips_before
+        self.page_round_trips[page] = round_trips
+        logging.info(f"📡 Page {page}: {round_trips} WebDriver round trips ({self.extraction_mode} extraction)")
+        
+        if self.performance_log:
+            self.devtools.poll()
+            self.resource_blocker.take_page_stats(page)
 
     @staticmethod
     def safe_get_text(element, selector: str, default: str = "") -> str:
@@ -198,11 +448,15 @@ class TenderScraper:
             return default
 
     def close(self) -> None:
-        self.driver.quit()
+        """Quit the browser, killing its process tree if quit() hangs or leaves processes behind"""
+        clean = self.process_tree.close()
+        if self.profile:
+            self.profile.release(clean)
+            self.profile = None
 
 @contextmanager
-def get_scraper(headless: bool = True):
-    scraper = TenderScraper(headless)
+def get_scraper(headless: bool = True, extraction_mode: Optional[str] = None):
+    scraper = TenderScraper(headless, extraction_mode)
     try:
         yield scraper
     finally:
@@ -222,33 +476,173 @@ def parse_days_left(days_str: str) -> Optional[int]:
         return int(match.group(1))
     return None
 
-def scrape_page_range_worker(args):
-    start_page, end_page, headless, min_value, max_days_left = args
-    scraper = TenderScraper(headless=headless)
-    all_tenders = []
+def filter_tenders(tenders: List[Dict[str, str]], min_value: float, max_days_left: Optional[int]) -> List[Dict[str, str]]:
+    """Apply the CLI value / days-left filters"""
+    kept = []
+    for tender in tenders:
+        value = parse_value(tender.get("value", "0"))
+        days_left = parse_days_left(tender.get("days_left", "N/A"))
+        if value < min_value:
+            continue
+        if max_days_left is not None and (days_left is None or days_left > max_days_left):
+            continue
+        kept.append(tender)
+    return kept
+
+def adopt_pagination_info(scraper: TenderScraper, pagination_info: Optional[Dict]) -> None:
+    """Use pagination info probed once for the whole run instead of detecting it per worker"""
+    if pagination_info and scraper.pagination:
+        current_page = scraper.pagination.current_page
+        scraper.pagination.apply_info(pagination_info)
+        # The session may already be past page 1 from an earlier range
+        scraper.pagination.current_page = current_page
+
+def probe_pagination_worker(args):
+    """
+    Detect pagination in a pool worker whose browser is already warm on page 1,
+    so the coordinator never launches a browser of its own just to count pages
+    """
+    from session_pool import get_session_pool
+    
+    headless, extraction_mode = args
+    with get_session_pool(headless=headless, extraction_mode=extraction_mode).session() as scraper:
+        page_size = scraper.pagination.probe_page_size() if SCRAPING_CONFIG.probe_page_size else None
+        info = scraper.pagination.detect_pagination_info()
+        info['page_size'] = page_size
+        return info
+
+def throttled(throttle, fetch, page: int):
+    """Run one page fetch inside the shared throttle (if any), reporting its latency and outcome"""
+    if throttle is None:
+        return fetch(page)
+    throttle.acquire()
+    started = time.monotonic()
+    ok = False
     try:
-        # Open site once
-        scraper.open_site(TENDER_URL)
-        
+        result = fetch(page)
+        ok = result is not None
+        return result
+    finally:
+        throttle.release(time.monotonic() - started, ok)
+
+def record_boundary(boundaries, scraper: TenderScraper, page: int) -> None:
+    """Note the page's tender IDs and the portal's current total for shift detection (if tracked)"""
+    if boundaries is not None and scraper.pagination:
+        boundaries.record(page, *scraper.pagination.page_boundary())
+
+def scrape_page_range_worker(args):
+    """Scrape a contiguous page range, streaming each page's tenders to the result writer"""
+    # Imported here to avoid a circular import (session_pool builds TenderScraper)
+    from session_pool import get_session_pool
+    
+    (start_page, end_page, headless, min_value, max_days_left, extraction_mode, channel, pagination_info, throttle,
+     boundaries) = args
+    pool = get_session_pool(headless=headless, extraction_mode=extraction_mode)
+    pages_sent = 0
+    # Borrow a warm session already sitting on the search page
+    with pool.session() as scraper:
+        supervisor = SessionSupervisor(pool, scraper)
+        adopt_pagination_info(scraper, pagination_info)
         for page in range(start_page, end_page + 1):
-            tenders = scraper.extract_tenders_from_page(page)
-            for tender in tenders:
-                value = parse_value(tender.get("value", "0"))
-                days_left = parse_days_left(tender.get("days_left", "N/A"))
-                if value < min_value:
-                    continue
-                if max_days_left is not None and (days_left is None or days_left > max_days_left):
+            pool.recycle_if_due(scraper)
+            tenders = supervisor.fetch(partial(throttled, throttle, scraper.scrape_page), page)
+            if tenders is None:
+                continue
+            record_boundary(boundaries, scraper, page)
+            channel.put(("records", page, filter_tenders(tenders, min_value, max_days_left)))
+            pages_sent += 1
+        logging.info(f"⏱️ Readiness waits after pages {start_page}-{end_page} (session total): {scraper.readiness.get_timing_summary()}")
+        if scraper.pagination:
+            logging.info(f"🧭 Navigation after pages {start_page}-{end_page} (session total): {scraper.pagination.get_navigation_summary()}")
+        if scraper.performance_log:
+            logging.info(f"📦 Bandwidth after pages {start_page}-{end_page} (session total): {scraper.resource_blocker.get_totals_summary()}")
+        logging.info(f"♻️ Browser recycled {scraper.recycles} times (session total)")
+    return dict(supervisor.as_dict(), pages=pages_sent)
+
+def snapshot_page_range_worker(args):
+    """Like scrape_page_range_worker, but streams (page, page_source) snapshots for the writer's parser pool"""
+    from session_pool import get_session_pool
+    
+    start_page, end_page, headless, _, _, extraction_mode, channel, pagination_info, throttle, boundaries = args
+    pool = get_session_pool(headless=headless, extraction_mode=extraction_mode)
+    pages_sent = 0
+    with pool.session() as scraper:
+        supervisor = SessionSupervisor(pool, scraper)
+        adopt_pagination_info(scraper, pagination_info)
+        for page in range(start_page, end_page + 1):
+            pool.recycle_if_due(scraper)
+            page_source = supervisor.fetch(partial(throttled, throttle, scraper.capture_page_source), page)
+            if page_source:
+                record_boundary(boundaries, scraper, page)
+                channel.put(("snapshot", page, page_source))
+                pages_sent += 1
+    return dict(supervisor.as_dict(), pages=pages_sent)
+
+def page_queue_worker(args):
+    """
+    Pull pages from a shared PageWorkQueue until it is drained, streaming each completed page
+    (tenders, or a snapshot in snapshot mode) to the result writer
+    Returns the worker's throughput report
+    """
+    from session_pool import get_session_pool
+    from work_queue import WorkerThroughput
+    
+    (worker_id, work_queue, headless, min_value, max_days_left, extraction_mode, channel, pagination_info, throttle,
+     boundaries) = args
+    pool = get_session_pool(headless=headless, extraction_mode=extraction_mode)
+    throughput = WorkerThroughput(worker_id)
+    with pool.session() as scraper:
+        supervisor = SessionSupervisor(pool, scraper)
+        adopt_pagination_info(scraper, pagination_info)
+        while True:
+            batch = work_queue.get_batch()
+            if batch is None:
+                break
+            for page in batch:
+                try:
+                    if pool.recycle_if_due(scraper):
+                        throughput.recycles += 1
+                    if extraction_mode == "snapshot":
+                        page_source = supervisor.fetch(partial(throttled, throttle, scraper.capture_page_source), page)
+                        scraped = ("snapshot", page, page_source) if page_source else None
+                    else:
+                        tenders = supervisor.fetch(partial(throttled, throttle, scraper.scrape_page), page)
+                        scraped = ("records", page, filter_tenders(tenders, min_value, max_days_left)) if tenders is not None else None
+                        throughput.tenders += len(tenders or [])
+                    if scraped is not None:
+                        record_boundary(boundaries, scraper, page)
+                except Exception as e:
+                    # Never drop a page: the queue only drains once every page is completed or given up
+                    logging.error(f"❌ Worker {worker_id} failed on page {page}: {e}")
+                    scraped = None
+                
+                if scraped is None:
+                    throughput.failures += 1
+                    work_queue.retry(page)
                     continue
-                all_tenders.append(tender)
-    finally:
-        scraper.close()
-    return all_tenders
+                channel.put(scraped)
+                throughput.pages += 1
+                work_queue.complete(page)
+        throughput.restarts, throughput.restart_seconds = supervisor.restarts, supervisor.restart_seconds
+    return {'throughput': throughput.as_dict()}
 
-def save_results(results: List[Dict[str, str]]) -> str:
+def results_filename() -> str:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"tender_data_{timestamp}.csv"
+    return f"tender_data_{timestamp}.csv"
+
+def result_fields(extraction_mode: Optional[str] = None, backend: str = "browser", enriched: bool = False) -> List[str]:
+    """CSV columns for a run: the list fields plus whatever else its records carry"""
+    if enriched:
+        return CSV_FIELDS + ENRICHED_FIELDS
+    if backend == "http" or extraction_mode == "network":
+        return CSV_FIELDS + API_FIELDS
+    return CSV_FIELDS
+
+def save_results(results: List[Dict[str, str]], fields: Optional[List[str]] = None) -> str:
+    filename = results_filename()
     with open(filename, "w", newline="", encoding="utf-8") as file:
-        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        # Fields outside the chosen columns (page-parser internals and the like) are dropped
+        writer = csv.DictWriter(file, fieldnames=fields or CSV_FIELDS, extrasaction="ignore")
         writer.writeheader()
         writer.writerows(results)
     return filename
\ No newline at end of file
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Warm WebDriver session pool for the zakup.sk.kz scraper
+Keeps TenderScraper sessions parked on the search page so page ranges and repeated runs
+in the same process skip Chrome cold-start and the Angular bootstrap
+"""
+
+import os
+import logging
+import threading
+from contextlib import contextmanager
+from multiprocessing.util import Finalize
+from typing import Dict, List, Optional, Tuple
+from selenium.common.exceptions import WebDriverException
+from config import TENDER_URL, SCRAPING_CONFIG
+from scraper import TenderScraper
+from driver_bootstrap import launch_in_parallel
+from recycling import RecyclePolicy
+
+logger = logging.getLogger(__name__)
+
+
+class ScraperSessionPool:
+    """Process-local pool of warmed TenderScraper sessions"""
+
+    def __init__(self, headless: bool = True, extraction_mode: Optional[str] = None,
+                 search_url: str = TENDER_URL, max_idle: Optional[int] = None,
+                 recycle_policy: Optional[RecyclePolicy] = None):
+        self.headless = headless
+        self.extraction_mode = extraction_mode
+        self.search_url = search_url
+        self.max_idle = max_idle if max_idle is not None else SCRAPING_CONFIG.session_pool_max_idle
+        self.recycle_policy = recycle_policy or RecyclePolicy()
+        self._idle: List[TenderScraper] = []
+        self._lock = threading.Lock()
+        self.stats = {'created': 0, 'reused': 0, 'discarded': 0, 'recycled': 0}
+        self._stats_lock = threading.Lock()
+
+    def acquire(self) -> TenderScraper:
+        """Lend a healthy session sitting on the search page, creating one if none is idle"""
+        while True:
+            with self._lock:
+                scraper = self._idle.pop() if self._idle else None
+            if scraper is None:
+                break
+            if self._prepare(scraper):
+                self._count('reused')
+                logger.info(f"♻️ Reusing warm browser session ({self.stats['reused']} reuses so far)")
+                return scraper
+            self.discard(scraper)
+
+        return self._create()
+
+    def _create(self) -> TenderScraper:
+        scraper = TenderScraper(headless=self.headless, extraction_mode=self.extraction_mode)
+        try:
+            scraper.open_site(self.search_url)
+        except Exception:
+            scraper.close()
+            raise
+        self._count('created')
+        return scraper
+
+    def prewarm(self, count: int = 1) -> int:
+        """Launch up to `count` sessions in parallel and park them idle; returns how many were added"""
+        with self._lock:
+            count = min(count, self.max_idle - len(self._idle))
+        sessions = launch_in_parallel(self._create, count)
+        for scraper in sessions:
+            self.release(scraper)
+        return len(sessions)
+
+    def recycle_if_due(self, scraper: TenderScraper) -> bool:
+        """Between pages: restart the session's browser if the recycle policy says so"""
+        reason = self.recycle_policy.reason_to_recycle(scraper)
+        if reason is None:
+            return False
+        scraper.restart_browser(self.search_url, reason)
+        scraper.recycles += 1
+        self._count('recycled')
+        return True
+
+    def _count(self, stat: str) -> None:
+        with self._stats_lock:
+            self.stats[stat] += 1
+
+    def release(self, scraper: TenderScraper) -> None:
+        """Take a session back; it is closed if the pool is already full"""
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(scraper)
+                return
+        scraper.close()
+
+    def discard(self, scraper: TenderScraper) -> None:
+        """Close a session that must not be lent out again"""
+        self._count('discarded')
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.debug(f"Error closing discarded session: {e}")
+
+    @contextmanager
+    def session(self):
+        """Borrow a session; sessions whose browser died are discarded instead of returned"""
+        scraper = self.acquire()
+        try:
+            yield scraper
+        except WebDriverException:
+            self.discard(scraper)
+            raise
+        except BaseException:
+            self._return_checked(scraper)
+            raise
+        else:
+            self._return_checked(scraper)
+
+    def _return_checked(self, scraper: TenderScraper) -> None:
+        if self.is_healthy(scraper):
+            self.release(scraper)
+        else:
+            self.discard(scraper)
+
+    @staticmethod
+    def is_healthy(scraper: TenderScraper) -> bool:
+        """Check the browser still answers and the Angular app is loaded"""
+        try:
+            state = scraper.driver.execute_script(
+                "return {ready: document.readyState, app: !!document.querySelector('sk-app')};"
+            )
+            return bool(state and state.get('ready') == 'complete' and state.get('app'))
+        except WebDriverException as e:
+            logger.warning(f"Browser session failed health check: {e}")
+            return False
+
+    def _prepare(self, scraper: TenderScraper) -> bool:
+        """Make sure an idle session is healthy and back on the search route before lending it"""
+        if not self.is_healthy(scraper):
+            return False
+        try:
+            if 'popup:search' not in scraper.driver.current_url:
+                logger.info("Returning warm session to the search page")
+                scraper.driver.get(self.search_url)
+                if not scraper.readiness.wait_until_ready("Search page"):
+                    return False
+                if scraper.pagination:
+                    scraper.pagination.current_page = 1
+            return True
+        except WebDriverException as e:
+            logger.warning(f"Could not return session to search page: {e}")
+            return False
+
+    def close_all(self) -> None:
+        """Close every idle session"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for scraper in idle:
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.debug(f"Error closing idle session: {e}")
+        if idle:
+            logger.info(f"Closed {len(idle)} idle browser sessions (stats: {self.stats})")
+
+
+_POOLS: Dict[Tuple[bool, Optional[str], str], ScraperSessionPool] = {}  # (headless, extraction_mode, search_url)
+_POOLS_LOCK = threading.Lock()
+# A forked worker must not inherit (and later close) its parent's browser sessions
+os.register_at_fork(after_in_child=_POOLS.clear)
+
+
+def get_session_pool(headless: bool = True, extraction_mode: Optional[str] = None,
+                     search_url: str = TENDER_URL) -> ScraperSessionPool:
+    """
+    Return this process's pool for the given browser settings and search URL, creating it on first use
+    Thread workers (--engine threads) all share it
+    """
+    key = (headless, extraction_mode, search_url)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = ScraperSessionPool(headless=headless, extraction_mode=extraction_mode, search_url=search_url)
+            _POOLS[key] = pool
+            # multiprocessing.Pool workers skip atexit handlers but run Finalize callbacks on clean exit
+            Finalize(pool, pool.close_all, exitpriority=10)
+    return pool
+
+
+def prewarm_session_pool(headless: bool = True, extraction_mode: Optional[str] = None) -> None:
+    """multiprocessing.Pool initializer: start this worker's browser while the others start theirs"""
+    try:
+        get_session_pool(headless, extraction_mode).prewarm()
+    except Exception as e:
+        logger.error(f"❌ Could not prewarm browser session: {e}")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+In-run supervision of a worker's browser session
+A page that fails because chromedriver or Chrome died would otherwise take the rest of the worker's
+pages with it: every later page fails on the same dead session. The supervisor notices the dead
+session, starts a fresh browser on the search page and retries the page that failed
+"""
+
+import time
+import logging
+from typing import Any, Callable, Dict, Optional
+from config import SCRAPING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class SessionSupervisor:
+    """Wraps page fetches for one borrowed session and respawns its browser when the session dies"""
+
+    def __init__(self, pool, scraper, max_restarts: Optional[int] = None):
+        self.pool = pool
+        self.scraper = scraper
+        self.max_restarts = SCRAPING_CONFIG.worker_max_restarts if max_restarts is None else max_restarts
+        self.restarts = 0
+        self.restart_seconds = 0.0
+
+    def fetch(self, fetch: Callable[[int], Any], page: int) -> Any:
+        """
+        fetch(page), retried on a fresh browser while the failure came from a dead session
+        Returns None when the page failed on a live session (an ordinary failure) or restarts ran out
+        """
+        while True:
+            try:
+                result = fetch(page)
+            except Exception as e:
+                logger.error(f"❌ Page {page} raised {type(e).__name__}: {e}")
+                result = None
+            if result is not None or self.session_alive():
+                return result
+            if self.restarts >= self.max_restarts:
+                logger.error(f"❌ Browser session died on page {page}; "
+                             f"no restarts left ({self.restarts}/{self.max_restarts})")
+                return None
+            if not self.respawn(f"session died on page {page}"):
+                return None
+            logger.info(f"🔁 Resuming at page {page} on a fresh browser")
+
+    def session_alive(self) -> bool:
+        """Any answer from the browser counts; dead sessions raise (WebDriverException or a connection error)"""
+        try:
+            self.scraper.driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def respawn(self, reason: str) -> bool:
+        """Start a fresh browser and run open_site again; returns False if that failed too"""
+        started = time.monotonic()
+        self.restarts += 1
+        try:
+            self.scraper.restart_browser(self.pool.search_url, reason)
+            return True
+        except Exception as e:
+            logger.error(f"❌ Could not restart browser ({reason}): {e}")
+            return False
+        finally:
+            self.restart_seconds += time.monotonic() - started
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'restarts': self.restarts, 'restart_seconds': round(self.restart_seconds, 1)}
+
+
+def summarize_restarts(reports) -> Dict[str, Any]:
+    """Run totals from worker reports carrying 'restarts' and 'restart_seconds'"""
+    reports = list(reports)
+    return {
+        'restarts': sum(report.get('restarts', 0) for report in reports),
+        'restart_seconds': round(sum(report.get('restart_seconds', 0.0) for report in reports), 1),
+    }
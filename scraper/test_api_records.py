@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test building tender records from search API / captured XHR payloads
+"""
+
+import logging
+from datetime import date
+from api_records import (
+    tenders_from_payload, tender_from_api_item, find_total_items, format_value, days_phrase
+)
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+ROW = {
+    "advertNumber": "№ 1234567",
+    "nameRu": "  Поставка   оборудования ",
+    "purchaseMethod": {"nameRu": "Открытый тендер"},
+    "sumTruNoNds": 5000000,
+    "customer": {"nameRu": "АО  Заказчик"},
+    "publishDate": "2025-09-01T09:30:00.000+0600",
+    "acceptanceEndDateTime": "2025-09-04T18:00:00",
+    "deliveryPlaceRu": "Алматы",
+}
+
+def test_format_value_and_days():
+    assert format_value(5000000) == "5 000 000,00 ₸"
+    assert format_value("1 234,5") == "1 234,50 ₸"
+    assert format_value(None) == "0 ₸"
+    assert [days_phrase(days) for days in (1, 3, 6, 11, 21, 22, 112)] == \
+        ["1 день", "3 дня", "6 дней", "11 дней", "21 день", "22 дня", "112 дней"]
+    print("✅ Values and day counts are formatted like the portal")
+
+def test_tender_from_api_item():
+    record = tender_from_api_item(ROW, page=3, today=date(2025, 9, 1))
+    assert record == {
+        "id": "1234567",
+        "title": "Поставка   оборудования",
+        "status": "Открытый тендер",
+        "days_left": "3 дня",
+        "value": "5 000 000,00 ₸",
+        "url": "https://zakup.sk.kz/#/ext(popup:item/1234567/advert)?tabs=advert&adst=PUBLISHED&lst=PUBLISHED&page=3",
+        "buyer_name": "АО Заказчик",
+        "publication_date": "2025-09-01T09:30:00+06:00",
+        "deadline_date": "2025-09-04T18:00:00",
+        "location": "Алматы",
+        "category": None,
+    }
+    # Past deadlines count as 0 days, rows without an ID are skipped
+    assert tender_from_api_item(ROW, page=3, today=date(2025, 10, 1))["days_left"] == "0 дней"
+    assert tender_from_api_item({"nameRu": "Без номера"}, page=1) is None
+    print("✅ API rows become tender records")
+
+def test_tenders_from_payload():
+    """Rows are found under the usual list keys, nested or as a bare list; other payloads are not searches"""
+    for payload in ({"content": [ROW]}, {"data": {"items": [ROW, "noise"]}}, [ROW]):
+        tenders = tenders_from_payload(payload, page=1)
+        assert [tender["id"] for tender in tenders] == ["1234567"], payload
+    assert tenders_from_payload({"content": [{"nameRu": "Без номера"}]}, page=1) == []
+    assert tenders_from_payload({"message": "Unauthorized"}, page=1) is None
+    print("✅ Tender lists are found in search payloads")
+
+def test_find_total_items():
+    assert find_total_items({"content": []}, {"X-Total-Count": "1815"}) == 1815
+    assert find_total_items({"content": []}, {"x-total-count": "oops"}) is None
+    assert find_total_items({"totalElements": 1815, "content": []}) == 1815
+    assert find_total_items({"total": "1815"}) is None  # Only integer totals are trusted
+    assert find_total_items([ROW]) is None
+    print("✅ Totals come from X-Total-Count or the body")
+
+if __name__ == "__main__":
+    test_format_value_and_days()
+    test_tender_from_api_item()
+    test_tenders_from_payload()
+    test_find_total_items()
+    print("🎉 API record tests passed")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test browser process-tree cleanup and orphan reaping with stand-in processes instead of Chrome
+"""
+
+import os
+import json
+import time
+import shutil
+import signal
+import logging
+import tempfile
+import subprocess
+import multiprocessing
+from pathlib import Path
+from types import SimpleNamespace
+import psutil
+from config import SCRAPING_CONFIG
+from browser_lifecycle import BrowserRegistry, BrowserProcessTree, ShmMonitor, SHM_PATH, chrome_shm_dir, shm_usage
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+def spawn_tree():
+    """A 'chromedriver' in its own session with a child that survives it, like a Chrome renderer"""
+    return subprocess.Popen(["sh", "-c", "sleep 60 & sleep 60"], start_new_session=True)
+
+def group_members(pgid):
+    members = []
+    for process in psutil.process_iter():
+        try:
+            if os.getpgid(process.pid) == pgid and process.status() != psutil.STATUS_ZOMBIE:
+                members.append(process.pid)
+        except (psutil.Error, OSError):
+            continue
+    return members
+
+def own_browser_then_die(registry_dir, ready):
+    """A pool worker that registers a browser and is then hard-killed"""
+    process = spawn_tree()
+    BrowserProcessTree(SimpleNamespace(service=SimpleNamespace(process=process)), BrowserRegistry(registry_dir))
+    ready.put(process.pid)
+    time.sleep(60)
+
+def test_hung_quit_kills_the_tree():
+    with tempfile.TemporaryDirectory() as tmp:
+        process = spawn_tree()
+        time.sleep(0.2)
+        driver = SimpleNamespace(service=SimpleNamespace(process=process), quit=lambda: time.sleep(30))
+        tree = BrowserProcessTree(driver, BrowserRegistry(tmp))
+        assert len(BrowserRegistry(tmp).entries()) == 1
+
+        started = time.monotonic()
+        tree.close(timeout=0.5)
+        process.wait(timeout=5)
+        print(f"✅ Hung quit handled in {time.monotonic() - started:.1f}s")
+        assert group_members(tree.pgid) == []
+        assert BrowserRegistry(tmp).entries() == []
+
+def test_orphans_of_dead_owners_are_reaped():
+    with tempfile.TemporaryDirectory() as tmp:
+        ready = multiprocessing.Queue()
+        owner = multiprocessing.Process(target=own_browser_then_die, args=(tmp, ready))
+        owner.start()
+        driver_pid = ready.get(timeout=10)
+        pgid = os.getpgid(driver_pid)
+        time.sleep(0.2)
+
+        registry = BrowserRegistry(tmp)
+        assert registry.reap_orphans() == 0  # Owner still alive
+        os.kill(owner.pid, signal.SIGKILL)
+        owner.join()
+        assert group_members(pgid)
+
+        reaped = registry.reap_orphans()
+        print(f"✅ Reaped {reaped} orphaned browser trees")
+        assert reaped == 1
+        assert group_members(pgid) == []
+        assert registry.entries() == []
+
+def spawn_named(directory, name):
+    """A sleeping process in its own session whose process name is `name` (via a symlink to sleep)"""
+    path = os.path.join(directory, name)
+    if not os.path.exists(path):
+        os.symlink(shutil.which("sleep"), path)
+    return subprocess.Popen([path, "60"], start_new_session=True)
+
+def write_stale_entry(registry_dir, pgid, create_time):
+    """A registry entry whose chromedriver and owner are long gone, e.g. from before a reboot"""
+    dead = subprocess.Popen(["true"])
+    dead.wait()
+    entry = {"pid": dead.pid, "pgid": pgid, "create_time": create_time, "owner_pid": dead.pid,
+             "owner_create_time": create_time, "started_at": create_time}
+    with open(os.path.join(registry_dir, f"{dead.pid}.json"), "w", encoding="utf-8") as file:
+        json.dump(entry, file)
+
+def test_stale_entries_spare_reused_process_groups():
+    """A reused group id is only killed for browser processes started after the recorded chromedriver"""
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as bin_dir:
+        registry = BrowserRegistry(tmp)
+        unrelated = spawn_named(bin_dir, "postgres")
+        older_chrome = spawn_named(bin_dir, "chrome")
+        time.sleep(1.5)
+        write_stale_entry(tmp, unrelated.pid, time.time() - 60)  # Not a browser process
+        write_stale_entry(tmp, older_chrome.pid, time.time())  # A browser, but older than the entry
+        time.sleep(1.5)
+        renderer = spawn_named(bin_dir, "chrome")
+        write_stale_entry(tmp, renderer.pid, time.time() - 5)  # A renderer left by that chromedriver
+        try:
+            reaped = registry.reap_orphans()
+            print(f"✅ Reaped {reaped} of 3 stale entries")
+            assert reaped == 1
+            assert renderer.wait(timeout=5) is not None
+            assert unrelated.poll() is None and older_chrome.poll() is None
+            assert registry.entries() == []
+        finally:
+            for process in (unrelated, older_chrome, renderer):
+                process.kill()
+                process.wait()
+
+def test_shm_monitor_reports_peaks():
+    report = ShmMonitor(interval=0.05).start().stop()
+    print(f"✅ /dev/shm report {report}")
+    assert report["peak_used_mb"] >= report["baseline_used_mb"] >= 0
+
+def test_chrome_segments_are_counted_where_chrome_puts_them():
+    """Under --disable-dev-shm-usage Chrome's segments live in the temp directory, not /dev/shm"""
+    with tempfile.TemporaryDirectory() as directory:
+        Path(directory, ".org.chromium.Chromium.abc123").write_bytes(b"x" * 64 * 1024)
+        Path(directory, "unrelated.tmp").write_bytes(b"x" * 64 * 1024)
+        usage = shm_usage(directory)
+        print(f"✅ Chrome segments in {directory}: {usage['chrome']} bytes")
+        assert 64 * 1024 <= usage["chrome"] < 128 * 1024
+    assert chrome_shm_dir() == (SHM_PATH if SCRAPING_CONFIG.browser_dev_shm else tempfile.gettempdir())
+
+if __name__ == "__main__":
+    test_hung_quit_kills_the_tree()
+    test_orphans_of_dead_owners_are_reaped()
+    test_stale_entries_spare_reused_process_groups()
+    test_shm_monitor_reports_peaks()
+    test_chrome_segments_are_counted_where_chrome_puts_them()
+    print("🎉 Browser lifecycle tests passed")
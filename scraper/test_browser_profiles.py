@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test persistent profile slots and template cloning without launching a browser
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+from config import SCRAPING_CONFIG
+from browser_profiles import ProfileSlot
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+def test_slots_are_exclusive_and_cloned_from_template():
+    with tempfile.TemporaryDirectory() as tmp:
+        first = ProfileSlot.acquire(tmp, max_slots=3)
+        second = ProfileSlot.acquire(tmp, max_slots=3)
+        assert (first.index, second.index) == (0, 1)
+        assert first.state == "new"
+        assert f"--user-data-dir={first.path}" in first.chrome_arguments()
+
+        # What a browser leaves behind: cached bundle plus a stale lock
+        (first.cache_path / "Cache_Data").mkdir(parents=True)
+        (first.cache_path / "Cache_Data" / "main.js").write_text("bundle", encoding="utf-8")
+        (first.path / "SingletonLock").write_text("", encoding="utf-8")
+        first.release(clean=True)
+        assert (Path(tmp) / "template" / "cache" / "Cache_Data" / "main.js").exists()
+        assert not (Path(tmp) / "template" / "SingletonLock").exists()
+
+        reused = ProfileSlot.acquire(tmp, max_slots=3)
+        third = ProfileSlot.acquire(tmp, max_slots=3)
+        print(f"✅ Slots {reused.index} ({reused.state}) and {third.index} ({third.state})")
+        assert (reused.index, reused.state) == (0, "warm")
+        assert not (reused.path / "SingletonLock").exists()
+        assert (third.index, third.state) == (2, "cloned")
+        assert (third.cache_path / "Cache_Data" / "main.js").read_text(encoding="utf-8") == "bundle"
+        assert ProfileSlot.acquire(tmp, max_slots=3) is None  # All slots taken
+        for slot in (second, reused, third):
+            slot.release()
+
+def test_oversized_slot_is_reset():
+    limit = SCRAPING_CONFIG.profile_max_mb
+    SCRAPING_CONFIG.profile_max_mb = 1
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            slot = ProfileSlot.acquire(tmp, max_slots=1)
+            (slot.path / "big.bin").write_bytes(b"\0" * (2 * 1024 * 1024))
+            slot.release(clean=False)
+
+            slot = ProfileSlot.acquire(tmp, max_slots=1)
+            assert slot.state == "reset, new"
+            assert not (slot.path / "big.bin").exists()
+            slot.release(clean=False)
+    finally:
+        SCRAPING_CONFIG.profile_max_mb = limit
+
+if __name__ == "__main__":
+    test_slots_are_exclusive_and_cloned_from_template()
+    test_oversized_slot_is_reset()
+    print("🎉 Browser profile tests passed")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test the detail enrichment stage against the local search/detail API stub
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+from enrichment import DetailEnricher, DetailCache, ApiDetailFetcher
+from test_http_client import StubSearchHandler, start_stub_server
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+def list_records():
+    return [{"id": str(1000 + i), "title": f"Поставка оборудования {i}", "status": "Открытый тендер",
+             "days_left": "3 дня", "value": "1 000 ₸", "url": ""} for i in range(3)]
+
+def test_enrichment_follows_churn():
+    """Details are fetched once; unchanged listings come from the cache, stale entries use If-None-Match"""
+    server = start_stub_server()
+    StubSearchHandler.detail_requests = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = Path(tmp) / "details.json"
+            fetcher = ApiDetailFetcher(detail_url=f"http://127.0.0.1:{server.server_port}/api/tenders/{{tender_id}}")
+            try:
+                tenders = DetailEnricher(fetcher, DetailCache(cache_path)).enrich(list_records())
+                assert tenders[0]["buyer_name"] == "АО Заказчик"
+                assert tenders[0]["description"] == "Поставка и монтаж"
+                assert tenders[0]["requirements"] == "Опыт работы 3 года"
+                assert tenders[0]["deadline_date"] == "2099-01-01T18:00:00"
+                assert len(StubSearchHandler.detail_requests) == 3
+
+                # Second run: nothing changed in the listing, no detail requests at all
+                enricher = DetailEnricher(fetcher, DetailCache(cache_path))
+                tenders = enricher.enrich(list_records())
+                assert len(StubSearchHandler.detail_requests) == 3
+                assert enricher.stats['cached'] == 3
+                assert tenders[2]["location"] == "Алматы"
+
+                # One listing changed: only that tender is re-checked, and the server says 304
+                changed = list_records()
+                changed[1]["status"] = "Изменён"
+                enricher = DetailEnricher(fetcher, DetailCache(cache_path))
+                tenders = enricher.enrich(changed)
+                print(f"✅ Enrichment stats after one change: {enricher.stats}")
+                assert StubSearchHandler.detail_requests[3:] == ["1001"]
+                assert enricher.stats['not_modified'] == 1
+                assert tenders[1]["description"] == "Поставка и монтаж"
+            finally:
+                fetcher.close()
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    test_enrichment_follows_churn()
+    print("🎉 Enrichment tests passed")
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test the browserless HTTP backend against a local stub of the search API
+"""
+
+import json
+import requests
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from http_client import TenderApiClient
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+TOTAL_ITEMS = 45
+
+def make_row(index):
+    return {
+        "advertNumber": f"№ {1000 + index}",
+        "nameRu": f"Поставка оборудования {index}",
+        "tenderTypeNameRu": "Открытый тендер",
+        "sumTruNoNds": 1000000 + index,
+        "customer": {"nameRu": "АО Заказчик"},
+        "acceptanceEndDateTime": "2099-01-01T18:00:00",
+        "deliveryPlaceRu": "Алматы",
+    }
+
+class StubSearchHandler(BaseHTTPRequestHandler):
+    """Serves paginated search results the way the portal's JHipster API does"""
+    failures_left = 0
+    max_size = None  # Larger requested sizes are silently capped, like a server with a page size limit
+
+    detail_requests = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.startswith("/api/tenders/"):
+            self.send_detail(url.path.rsplit("/", 1)[-1])
+            return
+        if url.path != "/api/search":
+            self.send_error(404)
+            return
+        if StubSearchHandler.failures_left > 0:
+            StubSearchHandler.failures_left -= 1
+            self.send_error(503)
+            return
+
+        query = parse_qs(url.query)
+        page, size = int(query["page"][0]), int(query["size"][0])
+        if StubSearchHandler.max_size:
+            size = min(size, StubSearchHandler.max_size)
+        rows = [make_row(i) for i in range(page * size, min((page + 1) * size, TOTAL_ITEMS))]
+        body = json.dumps({"content": rows}).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-Total-Count", str(TOTAL_ITEMS))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_detail(self, tender_id):
+        """Detail view with an ETag; answers 304 when the client already has it"""
+        StubSearchHandler.detail_requests.append(tender_id)
+        etag = f'"detail-{tender_id}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"advert": dict(make_row(int(tender_id) - 1000),
+                                          descriptionRu="Поставка и монтаж",
+                                          qualificationRequirementsRu="Опыт работы 3 года")}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSearchHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def test_scrape_all_pages():
+    """All pages are fetched and mapped onto the DOM record shape"""
+    server = start_stub_server()
+    try:
+        client = TenderApiClient(search_url=f"http://127.0.0.1:{server.server_port}/api/search", page_size=10)
+        tenders = client.scrape_pages()
+        client.close()
+
+        print(f"✅ Fetched {len(tenders)} tenders across {client.get_total_pages()} pages")
+        assert len(tenders) == TOTAL_ITEMS
+        assert client.get_total_pages() == 5
+        assert len({t["id"] for t in tenders}) == TOTAL_ITEMS
+
+        first = next(t for t in tenders if t["id"] == "1000")
+        for field in ["id", "title", "status", "days_left", "value", "url"]:
+            assert field in first, f"missing {field}"
+        assert first["status"] == "Открытый тендер"
+        assert first["value"] == "1 000 000,00 ₸"
+        assert first["buyer_name"] == "АО Заказчик"
+        assert "popup:item/1000/advert" in first["url"] and first["url"].endswith("page=1")
+    finally:
+        server.shutdown()
+
+def test_retries_transient_errors():
+    """503s from the portal are retried on the pooled session"""
+    server = start_stub_server()
+    StubSearchHandler.failures_left = 2
+    try:
+        client = TenderApiClient(search_url=f"http://127.0.0.1:{server.server_port}/api/search", page_size=20)
+        client.session.adapters["http://"].max_retries.backoff_factor = 0
+        tenders, total = client.fetch_page(1)
+        client.close()
+
+        print(f"✅ Page 1 fetched after retries: {len(tenders)} tenders of {total}")
+        assert len(tenders) == 20
+        assert total == TOTAL_ITEMS
+    finally:
+        StubSearchHandler.failures_left = 0
+        server.shutdown()
+
+def test_first_page_failure_fails_the_run():
+    """Without page 1 there is no total and no tenders; raising keeps run_http_scrape from writing an empty CSV"""
+    server = start_stub_server()
+    StubSearchHandler.failures_left = 100
+    try:
+        client = TenderApiClient(search_url=f"http://127.0.0.1:{server.server_port}/api/search", page_size=20)
+        client.session.adapters["http://"].max_retries.backoff_factor = 0
+        try:
+            client.scrape_pages()
+            raise AssertionError("expected page 1 to fail the scrape")
+        except requests.RequestException as e:
+            print(f"✅ Page 1 failure raised {type(e).__name__}")
+        finally:
+            client.close()
+    finally:
+        StubSearchHandler.failures_left = 0
+        server.shutdown()
+
+def test_probe_page_size():
+    """The largest size the server honours is kept; a capped size is detected and skipped"""
+    server = start_stub_server()
+    StubSearchHandler.max_size = 30
+    try:
+        client = TenderApiClient(search_url=f"http://127.0.0.1:{server.server_port}/api/search", page_size=10)
+        size = client.probe_page_size([100, 50, 25, 20])
+        tenders = client.scrape_pages()
+        client.close()
+
+        print(f"✅ Probed page size {size}: {len(tenders)} tenders across {client.get_total_pages()} pages")
+        assert size == 25
+        assert client.get_total_pages() == 2
+        assert len({t["id"] for t in tenders}) == TOTAL_ITEMS
+
+        StubSearchHandler.max_size = None
+        client = TenderApiClient(search_url=f"http://127.0.0.1:{server.server_port}/api/search", page_size=10)
+        assert client.probe_page_size([100]) == 100  # Fewer items than the size, but all of them
+        client.close()
+    finally:
+        StubSearchHandler.max_size = None
+        server.shutdown()
+
+if __name__ == "__main__":
+    test_scrape_all_pages()
+    test_retries_transient_errors()
+    test_first_page_failure_fails_the_run()
+    test_probe_page_size()
+    print("🎉 HTTP backend tests passed")
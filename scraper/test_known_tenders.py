@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test incremental early-stop scanning against a known-tender index
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+from known_tenders import KnownTenderIndex, scrape_incremental
+from scraper import filter_tenders
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+def make_tender(index, title=None):
+    return {"id": str(1000 + index), "title": title or f"Тендер {index}", "status": "Открытый тендер",
+            "days_left": "3 дня", "value": "1 000 ₸"}
+
+# 10 newest-first pages of 5 tenders; tender 0 is the newest
+LISTING = [make_tender(i) for i in range(50)]
+
+def test_stops_after_quiet_pages():
+    """Only pages up to the last new tender plus stop_after quiet pages are fetched"""
+    index = KnownTenderIndex()
+    index.update(LISTING[7:])
+    changed = dict(LISTING[12], title="Тендер 12 (изменён)")
+    listing = LISTING[:12] + [changed] + LISTING[13:]
+
+    fetched = []
+    def fetch_page(page):
+        fetched.append(page)
+        return listing[(page - 1) * 5:page * 5]
+
+    fresh = scrape_incremental(fetch_page, index, stop_after=2, max_pages=10)
+    print(f"✅ Fetched pages {fetched}, {len(fresh)} new or changed tenders")
+    assert [t["id"] for t in fresh] == [str(1000 + i) for i in range(7)] + ["1012"]
+    assert fetched == [1, 2, 3, 4, 5]
+
+def test_filters_apply_after_the_scan():
+    """A page the filters would empty neither ends the scan nor counts as quiet"""
+    index = KnownTenderIndex()
+    index.update(LISTING[10:])
+    cheap = [dict(tender, value="100 ₸") for tender in LISTING[:5]]
+    listing = cheap + LISTING[5:]
+
+    def fetch_page(page):
+        return listing[(page - 1) * 5:page * 5]
+
+    fresh = scrape_incremental(fetch_page, index, stop_after=1, max_pages=10)
+    kept = filter_tenders(fresh, min_value=500, max_days_left=None)
+    print(f"✅ {len(fresh)} new tenders, {len(kept)} pass the filters")
+    assert len(fresh) == 10
+    assert [t["id"] for t in kept] == [str(1000 + i) for i in range(5, 10)]
+
+def test_days_left_does_not_count_as_change():
+    index = KnownTenderIndex()
+    index.update(LISTING[:5])
+    assert index.classify(dict(LISTING[0], days_left="2 дня")) == "unchanged"
+    assert index.classify(dict(LISTING[0], status="Завершён")) == "changed"
+    assert index.classify(make_tender(99)) == "new"
+
+def test_list_paths_share_fingerprints():
+    """An index written from API or enriched records still matches the same tenders scraped from the DOM"""
+    dom = dict(LISTING[0], title="Тендер\n0", value="1\xa0000 ₸")
+    index = KnownTenderIndex()
+    index.update([dict(LISTING[0], buyer_name="АО Заказчик", description="Поставка")])
+    assert index.classify(dom) == "unchanged"
+    assert index.classify(dict(dom, value="2 000 ₸")) == "changed"
+    print("✅ Fingerprints ignore detail fields and whitespace differences")
+
+def test_index_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "known.json"
+        index = KnownTenderIndex.load(path)
+        assert len(index) == 0
+        index.update(LISTING[:3])
+        index.save()
+        assert len(KnownTenderIndex.load(path)) == 3
+
+if __name__ == "__main__":
+    test_stops_after_quiet_pages()
+    test_filters_apply_after_the_scan()
+    test_days_left_does_not_count_as_change()
+    test_list_paths_share_fingerprints()
+    test_index_round_trip()
+    print("🎉 Incremental scraping tests passed")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test multi-tab rounds and the multi-tab queue worker without launching a browser
+"""
+
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from multiprocessing import Manager
+from types import SimpleNamespace
+import session_pool
+from multi_tab import MultiTabSession, multi_tab_queue_worker
+from work_queue import PageWorkQueue
+from pagination_handler import PaginationHandler
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+class FakeDriver:
+    """Window handles plus a log of which tab each command ran in"""
+
+    def __init__(self, events):
+        self.events = events
+        self.window_handles = ["tab-0"]
+        self.current_window_handle = "tab-0"
+        self.current_url = "https://zakup.sk.kz/#/ext(popup:search)?tabs=tenders&page=1"
+        self.switch_to = SimpleNamespace(window=self._switch)
+
+    def _switch(self, handle):
+        self.current_window_handle = handle
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+    def execute_cdp_cmd(self, command, params):
+        self.events.append(("cdp", self.current_window_handle, command))
+
+    def execute_script(self, script, *args):
+        if "window.open" in script:
+            self.window_handles.append(f"tab-{len(self.window_handles)}")
+        elif "location.href" in script:
+            self.events.append(("load", self.current_window_handle, args[0]))
+        else:
+            self.events.append(("navigate", self.current_window_handle, args[0]))
+        return "click"
+
+class FakeReadiness:
+    def __init__(self, driver, events):
+        self.driver, self.events = driver, events
+
+    def install_request_tracker(self, new_tab=False):
+        self.events.append(("tracker", self.driver.current_window_handle, new_tab))
+
+    def current_first_item(self):
+        return f"first-{self.driver.current_window_handle}"
+
+    def wait_until_ready(self, label, previous_first_item=None, **kwargs):
+        self.events.append(("ready", self.driver.current_window_handle, label))
+        return True
+
+def make_scraper():
+    events = []
+    driver = FakeDriver(events)
+    readiness = FakeReadiness(driver, events)
+    resource_blocker = SimpleNamespace(
+        block_urls=lambda driver: events.append(("blocked", driver.current_window_handle, None)))
+    scraper = SimpleNamespace(driver=driver, wait=None, readiness=readiness, resource_blocker=resource_blocker)
+    scraper.pagination = PaginationHandler(driver, None, readiness)
+    scraper.pagination.apply_info({'total_pages': 50, 'total_items': 500, 'current_page': 1, 'items_per_page': 10})
+
+    def scrape_page(page):
+        events.append(("extract", driver.current_window_handle, page))
+        assert scraper.pagination.current_page == page
+        return [{"id": str(page)}]
+    scraper.scrape_page = scrape_page
+    return scraper, events
+
+def test_round_interleaves_tabs():
+    scraper, events = make_scraper()
+    session = MultiTabSession(scraper, tab_count=3, search_url="https://zakup.sk.kz/#/ext(popup:search)")
+    done = []
+    results = session.scrape_round([4, 5, 6], scraper.scrape_page, lambda page, result, seconds: done.append(page))
+    round_events = [event for event in events if event[0] in ("navigate", "extract")]
+    print(f"✅ Round events: {round_events}")
+
+    assert results == [(4, [{"id": "4"}]), (5, [{"id": "5"}]), (6, [{"id": "6"}])]
+    assert done == [4, 5, 6]
+    kinds = [kind for kind, _, _ in round_events]
+    assert kinds[:3] == ["navigate"] * 3  # Every tab is loading before the first wait
+    assert {tab for kind, tab, _ in round_events if kind == "extract"} == {"tab-0", "tab-1", "tab-2"}
+    assert [tab.pagination.current_page for tab in session.tabs] == [4, 5, 6]
+
+    # Every new tab blocks resources and tracks requests before it loads the search page
+    for tab in ("tab-1", "tab-2"):
+        setup = [kind for kind, handle, _ in events if handle == tab and kind in ("blocked", "tracker", "load")]
+        assert setup == ["blocked", "tracker", "load"], setup
+
+    # Tabs are kept for the next round
+    events.clear()
+    session.scrape_round([7, 8, 9], scraper.scrape_page)
+    assert not [event for event in events if event[2] == "Search page (new tab)"]
+
+class FakeSessionPool:
+    """Lends one fake scraper, like ScraperSessionPool.session()"""
+    search_url = "https://zakup.sk.kz/#/ext(popup:search)"
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+        self.released_handles = None
+
+    @contextmanager
+    def session(self):
+        yield self.scraper
+        self.released_handles = list(self.scraper.driver.window_handles)
+
+    def recycle_if_due(self, scraper):
+        return False
+
+def run_worker(pool, pages, tab_count):
+    """multi_tab_queue_worker over a real PageWorkQueue, with the session pool swapped for the fake one"""
+    original = session_pool.get_session_pool
+    session_pool.get_session_pool = lambda **kwargs: pool
+    try:
+        with Manager() as manager:
+            work_queue = PageWorkQueue(manager, pages)
+            channel = queue.Queue()
+            outcome = {}
+            worker = threading.Thread(target=lambda: outcome.update(multi_tab_queue_worker(
+                (0, work_queue, True, 0, None, "script", channel, None, None, None, tab_count))), daemon=True)
+            worker.start()
+            worker.join(timeout=15)
+            assert not worker.is_alive(), f"worker hung with {work_queue.remaining()} pages remaining"
+            assert work_queue.remaining() == 0
+            sent = []
+            while not channel.empty():
+                sent.append(channel.get()[1])
+            return outcome, sent
+    finally:
+        session_pool.get_session_pool = original
+
+def test_worker_finishes_partial_rounds():
+    """5 pages on 4 tabs: the last round has one page, and the worker must not wait for a full round"""
+    scraper, _ = make_scraper()
+    outcome, sent = run_worker(FakeSessionPool(scraper), range(1, 6), tab_count=4)
+    print(f"✅ Worker sent pages {sorted(sent)}: {outcome['throughput']}")
+    assert sorted(sent) == [1, 2, 3, 4, 5]
+    assert outcome['throughput']['pages'] == 5
+
+def test_worker_closes_extra_tabs():
+    """The session goes back to the pool with only its first tab, so the next task does not stack more"""
+    scraper, _ = make_scraper()
+    pool = FakeSessionPool(scraper)
+    for _ in range(2):
+        run_worker(pool, range(1, 4), tab_count=3)
+        print(f"✅ Released the session with tabs {pool.released_handles}")
+        assert pool.released_handles == ["tab-0"]
+    assert scraper.driver.current_window_handle == "tab-0"
+
+if __name__ == "__main__":
+    test_round_interleaves_tabs()
+    test_worker_finishes_partial_rounds()
+    test_worker_closes_extra_tabs()
+    print("🎉 Multi-tab tests passed")
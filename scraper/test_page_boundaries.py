@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test shift detection across page boundaries and the targeted re-fetch
+"""
+
+import logging
+from multiprocessing import Manager
+from page_boundaries import PageBoundaryTracker, refetch_boundaries
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+PAGE_SIZE = 5
+
+class Listing:
+    """Newest-first listing that grows while it is being paged through"""
+
+    def __init__(self, total):
+        self.ids = [str(1000 - i) for i in range(total)]
+
+    def publish(self, count):
+        newest = int(self.ids[0])
+        self.ids = [str(newest + count - i) for i in range(count)] + self.ids
+
+    def page(self, page):
+        return self.ids[(page - 1) * PAGE_SIZE:page * PAGE_SIZE], len(self.ids)
+
+def test_gap_and_overlap_detection():
+    listing = Listing(20)
+    with Manager() as manager:
+        tracker = PageBoundaryTracker(manager, PAGE_SIZE)
+        # Pages 1-2 before two tenders are published, page 4 in between, page 3 after
+        tracker.record(1, *listing.page(1))
+        tracker.record(2, *listing.page(2))
+        listing.publish(2)
+        tracker.record(4, *listing.page(4))
+        listing.publish(1)
+        tracker.record(3, *listing.page(3))
+
+        report = tracker.check(total_pages=4)
+        print(f"✅ Boundary report: {report}")
+        assert report["overlaps"] == [2]  # Page 3 was fetched later and repeats page 2's tail
+        assert report["gaps"] == [3]  # Page 4 was fetched earlier: tenders slipped past it
+        assert report["refetch"] == [3, 4, 5]  # The listing grew into a fifth page
+        assert report["total_drift"] == 3
+
+def test_refetch_until_settled():
+    listing = Listing(20)
+    with Manager() as manager:
+        tracker = PageBoundaryTracker(manager, PAGE_SIZE)
+        seen = set()
+        def run_pages(pages, last_page):
+            for page in pages:
+                ids, total = listing.page(page)
+                seen.update(ids)
+                tracker.record(page, ids, total)
+
+        run_pages([3, 4], 4)
+        listing.publish(3)
+        run_pages([1, 2], 4)
+
+        report = refetch_boundaries(run_pages, tracker, total_pages=4, rounds=2)
+        print(f"✅ Re-fetched {report['refetched']}, {len(seen)} of {len(listing.ids)} tenders seen")
+        assert report["refetch"] == []
+        assert seen == set(listing.ids)
+        assert len(report["refetched"]) < 8  # Only boundary pages, not the whole crawl
+
+if __name__ == "__main__":
+    test_gap_and_overlap_detection()
+    test_refetch_until_settled()
+    print("🎉 Page boundary tests passed")
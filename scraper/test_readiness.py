@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test the readiness signals and wait loop against scripted probe results
+"""
+
+import logging
+from readiness import PageReadiness
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+READY = {"readyState": "complete", "angularStable": True, "pending": 0, "count": 10, "first": "№ 200"}
+
+class ScriptedDriver:
+    """Returns the next readiness probe state on each execute_script call (the last one repeats)"""
+
+    def __init__(self, states):
+        self.states = list(states)
+
+    def execute_script(self, script, *args):
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+def test_signals():
+    signals_met = PageReadiness._signals_met
+    assert signals_met(READY, True, None)
+    assert not signals_met(dict(READY, readyState="interactive"), True, None)
+    assert not signals_met(dict(READY, angularStable=False), True, None)
+    assert not signals_met(dict(READY, pending=2), True, None)
+    assert not signals_met(dict(READY, count=0), True, None)
+    assert signals_met(dict(READY, count=0), False, None)
+    # Missing signals (no Angular testability, no tracker) do not block readiness
+    assert signals_met(dict(READY, angularStable=None, pending=None), True, None)
+    # After pagination the first item must have changed
+    assert not signals_met(READY, True, "№ 200")
+    assert signals_met(READY, True, "№ 100")
+    print("✅ Readiness signals work")
+
+def test_wait_until_ready():
+    """Waits through loading states and records the timing"""
+    loading = [{"readyState": "loading"}, dict(READY, pending=1, count=0), dict(READY, count=4)]
+    readiness = PageReadiness(ScriptedDriver(loading + [READY]), timeout=5, poll_interval=0, settle_time=0)
+    assert readiness.wait_until_ready("Page 2", previous_first_item="№ 100")
+    assert readiness.timings[0]["label"] == "Page 2" and readiness.timings[0]["ready"]
+    print("✅ Wait loop returns once the page is ready")
+
+def test_wait_hits_ceiling():
+    readiness = PageReadiness(ScriptedDriver([dict(READY, pending=1)]), timeout=0.05, poll_interval=0.01,
+                              settle_time=0)
+    assert not readiness.wait_until_ready("Stuck page")
+    summary = readiness.get_timing_summary()
+    assert summary["waits"] == 1 and summary["timeouts"] == 1 and summary["max_seconds"] >= 0.05
+    print("✅ Wait loop gives up at the ceiling")
+
+if __name__ == "__main__":
+    test_signals()
+    test_wait_until_ready()
+    test_wait_hits_ceiling()
+    print("🎉 Readiness tests passed")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Test the browser recycling policy without launching a browser
+"""
+
+import os
+import logging
+from types import SimpleNamespace
+from recycling import RecyclePolicy, process_tree_rss_mb
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+def fake_scraper(pages_visited, pid=None):
+    """Just enough of TenderScraper for the policy: a page counter and driver.service.process.pid"""
+    process = SimpleNamespace(pid=pid or os.getpid())
+    return SimpleNamespace(pages_visited=pages_visited, driver=SimpleNamespace(service=SimpleNamespace(process=process)))
+
+def test_recycles_after_page_budget():
+    policy = RecyclePolicy(max_pages=50, max_rss_mb=0)
+    assert policy.reason_to_recycle(fake_scraper(49)) is None
+    assert policy.reason_to_recycle(fake_scraper(50)) == "50 pages"
+
+def test_recycles_on_rss_threshold():
+    """This test process stands in for the chromedriver tree"""
+    rss = process_tree_rss_mb(os.getpid())
+    print(f"✅ Test process tree RSS: {rss:.1f} MB")
+    assert rss and rss > 1
+
+    policy = RecyclePolicy(max_pages=0, max_rss_mb=1, rss_check_every=5)
+    assert policy.reason_to_recycle(fake_scraper(4)) is None  # Not an RSS check page
+    assert policy.reason_to_recycle(fake_scraper(5)).startswith("browser RSS")
+    assert RecyclePolicy(max_pages=0, max_rss_mb=1e6, rss_check_every=5).reason_to_recycle(fake_scraper(5)) is None
+
+if __name__ == "__main__":
+    test_recycles_after_page_budget()
+    test_recycles_on_rss_threshold()
+    print("🎉 Recycling policy tests passed")
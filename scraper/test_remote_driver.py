@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test the remote WebDriver backend against local stubs of Selenium Grid endpoints
+Set SELENIUM_REMOTE_URL (e.g. a standalone server from `docker run -p 4444:4444 selenium/standalone-chrome`)
+to also open a real Chrome session through it
+"""
+
+import os
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from remote_driver import parse_status, query_capacity, RemoteEndpointPool, create_remote_driver
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+def grid_status(free, busy=0, max_sessions=None, availability="UP"):
+    """A Grid 4 /status body with one node holding `free` idle and `busy` running Chrome slots"""
+    slots = [{"stereotype": {"browserName": "chrome"}, "session": None} for _ in range(free)]
+    slots += [{"stereotype": {"browserName": "chrome"}, "session": {"sessionId": f"s{i}"}} for i in range(busy)]
+    return {"value": {"ready": True, "message": "Selenium Grid ready.", "nodes": [
+        {"availability": availability, "maxSessions": max_sessions or free + busy, "slots": slots}
+    ]}}
+
+def make_handler(status, accept_sessions=True):
+    class StubGridHandler(BaseHTTPRequestHandler):
+        """Answers /status with a fixed body and opens fake sessions, like a grid hub"""
+        sessions = []
+        cdp_commands = []
+
+        def log_message(self, *args):
+            pass
+
+        def send_json(self, code, body):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def read_json(self):
+            length = int(self.headers.get("Content-Length", 0))
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def do_GET(self):
+            if self.path == "/status":
+                self.send_json(200, status)
+            else:
+                self.send_json(404, {"value": {"error": "unknown command", "message": self.path}})
+
+        def do_POST(self):
+            body = self.read_json()
+            if self.path == "/session":
+                if not accept_sessions:
+                    self.send_json(500, {"value": {"error": "session not created",
+                                                   "message": "Could not start a new session"}})
+                    return
+                session_id = f"session-{len(StubGridHandler.sessions) + 1}"
+                StubGridHandler.sessions.append(session_id)
+                self.send_json(200, {"value": {"sessionId": session_id,
+                                               "capabilities": {"browserName": "chrome"}}})
+            elif self.path.endswith("/goog/cdp/execute"):
+                StubGridHandler.cdp_commands.append(body["cmd"])
+                self.send_json(200, {"value": {}})
+            else:
+                self.send_json(404, {"value": {"error": "unknown command", "message": self.path}})
+
+        def do_DELETE(self):
+            self.send_json(200, {"value": None})
+
+    return StubGridHandler
+
+def start_stub(status, accept_sessions=True):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(status, accept_sessions))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def test_parse_status():
+    """Free Chrome slots on nodes that are up, capped by maxSessions; a bare chromedriver counts as one"""
+    status = {"value": {"ready": True, "nodes": [
+        grid_status(free=3, busy=1)["value"]["nodes"][0],
+        grid_status(free=4, availability="DOWN")["value"]["nodes"][0],
+        # Chrome and Firefox slots, but only one session at a time, already taken
+        {"availability": "UP", "maxSessions": 1, "slots": [
+            {"stereotype": {"browserName": "firefox"}, "session": {"sessionId": "f1"}},
+            {"stereotype": {"browserName": "chrome"}, "session": None},
+        ]},
+    ]}}
+    capacity = parse_status("http://grid:4444", status)
+    assert capacity.ready and capacity.free_slots == 3 and capacity.nodes == 2, capacity
+    assert capacity.max_sessions == 5, capacity
+
+    assert parse_status("http://node:9515", {"value": {"ready": True, "message": "ChromeDriver ready"}}).free_slots == 1
+    assert parse_status("http://node:9515", {"value": {"ready": False}}).free_slots == 0
+    print("✅ /status parsing works")
+
+def test_choose_by_capacity():
+    """Sessions go to the endpoint with the most free slots; unreachable and full endpoints are skipped"""
+    busy_server, busy_url = start_stub(grid_status(free=1, busy=3))
+    idle_server, idle_url = start_stub(grid_status(free=4))
+    full_server, full_url = start_stub(grid_status(free=0, busy=2))
+    try:
+        assert query_capacity("http://127.0.0.1:9", timeout=1) is None
+        pool = RemoteEndpointPool([busy_url, idle_url, full_url, "http://127.0.0.1:9"], capacity_wait=0)
+        for _ in range(5):
+            assert pool.choose().url == idle_url
+        assert pool.choose(exclude=[idle_url]).url == busy_url
+
+        try:
+            RemoteEndpointPool([full_url], capacity_wait=0).choose()
+            raise AssertionError("expected RuntimeError with every endpoint full")
+        except RuntimeError:
+            pass
+        print("✅ Endpoint selection by free capacity works")
+    finally:
+        for server in (busy_server, idle_server, full_server):
+            server.shutdown()
+
+def test_create_remote_driver():
+    """A refused session moves on to the next endpoint; CDP commands travel over the remote connection"""
+    refusing_server, refusing_url = start_stub(grid_status(free=8), accept_sessions=False)
+    accepting_server, accepting_url = start_stub(grid_status(free=2))
+    try:
+        driver, timings = create_remote_driver(webdriver.ChromeOptions(),
+                                               RemoteEndpointPool([refusing_url, accepting_url], capacity_wait=0))
+        assert driver.session_id == "session-1"
+        assert timings.endpoint == accepting_url and accepting_url in timings.summary()
+        driver.execute_cdp_cmd("Network.enable", {})
+        assert accepting_server.RequestHandlerClass.cdp_commands == ["Network.enable"]
+        driver.quit()
+
+        try:
+            create_remote_driver(webdriver.ChromeOptions(), RemoteEndpointPool([refusing_url], capacity_wait=0))
+            raise AssertionError("expected the refused session to raise")
+        except WebDriverException:
+            pass
+        print("✅ Remote session creation works")
+    finally:
+        refusing_server.shutdown()
+        accepting_server.shutdown()
+
+def test_standalone_server():
+    """Open a real Chrome session on the server in SELENIUM_REMOTE_URL, if one is given"""
+    url = os.getenv("SELENIUM_REMOTE_URL")
+    if not url:
+        print("⏭️ SELENIUM_REMOTE_URL not set, skipping the standalone server test")
+        return
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')
+    driver, timings = create_remote_driver(options, RemoteEndpointPool([url]))
+    try:
+        driver.get("data:text/html,<title>tenderflow</title>")
+        assert driver.title == "tenderflow"
+        driver.execute_cdp_cmd("Network.enable", {})
+        print(f"✅ Standalone server session works ({timings.summary()})")
+    finally:
+        driver.quit()
+
+if __name__ == "__main__":
+    test_parse_status()
+    test_choose_by_capacity()
+    test_create_remote_driver()
+    test_standalone_server()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test DevTools block-list patterns and per-page bandwidth accounting without a browser
+"""
+
+import logging
+from config import SCRAPING_CONFIG
+from resource_blocking import ResourceBlocker, RESOURCE_TYPE_PATTERNS, ESTIMATED_BYTES, format_bytes
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+def test_url_patterns():
+    """Types map to extension patterns, domains to their own and subdomain patterns; allowed domains stay open"""
+    blocker = ResourceBlocker(blocked_types=["Font", "Image", "Font"],
+                              blocked_domains=["mc.yandex.ru", "zakup.sk.kz"], allowed_domains=["zakup.sk.kz"])
+    assert blocker.blocked_types == ["Font", "Image"]
+    assert blocker.blocked_domains == ["mc.yandex.ru"]
+    assert blocker.url_patterns() == (RESOURCE_TYPE_PATTERNS["Font"] + RESOURCE_TYPE_PATTERNS["Image"]
+                                      + ["*://mc.yandex.ru/*", "*://*.mc.yandex.ru/*"])
+    assert blocker.enabled
+    assert not ResourceBlocker(blocked_types=[], blocked_domains=[]).enabled
+    assert ResourceBlocker(blocked_types=["Unknown"], blocked_domains=[]).url_patterns() == []
+    print("✅ Block-list patterns are built from types and domains")
+
+def test_page_stats():
+    """Transferred bytes and blocked requests are counted per page, then rolled into the totals"""
+    blocker = ResourceBlocker(blocked_types=["Image"], blocked_domains=[])
+    events = [
+        {"method": "Network.loadingFinished", "params": {"encodedDataLength": 1500}},
+        {"method": "Network.loadingFinished", "params": {"encodedDataLength": 500}},
+        {"method": "Network.loadingFailed", "params": {"type": "Image", "blockedReason": "inspector"}},
+        {"method": "Network.loadingFailed", "params": {"type": "Image", "blockedReason": "inspector"}},
+        {"method": "Network.loadingFailed", "params": {"type": "XHR", "errorText": "net::ERR_ABORTED"}},
+    ]
+    for event in events:
+        blocker.on_event(event)
+    stats = blocker.take_page_stats(page=1)
+    assert stats == {"page": 1, "bytes_transferred": 2000, "requests_blocked": 2, "blocked_by_type": {"Image": 2},
+                     "estimated_bytes_saved": 2 * ESTIMATED_BYTES["Image"]}
+
+    blocker.on_event({"method": "Network.loadingFinished", "params": {"encodedDataLength": 1000}})
+    assert blocker.take_page_stats(page=2)["requests_blocked"] == 0
+    assert blocker.totals == {"bytes_transferred": 3000, "requests_blocked": 2,
+                              "estimated_bytes_saved": 2 * ESTIMATED_BYTES["Image"]}
+    print(f"✅ Bandwidth accounting: {blocker.get_totals_summary()}")
+
+def test_format_bytes():
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(2048) == "2.0 KB"
+    assert format_bytes(5 * 1024 * 1024) == "5.0 MB"
+
+def test_disable_images_blocks_by_url():
+    """Images are refused by the URL block list, so Chrome still requests them and they are counted"""
+    blocker = ResourceBlocker()
+    assert ("Image" in blocker.blocked_types) == SCRAPING_CONFIG.disable_images
+    if SCRAPING_CONFIG.disable_images:
+        assert set(RESOURCE_TYPE_PATTERNS["Image"]) <= set(blocker.url_patterns())
+    print(f"✅ Default block list: {blocker.blocked_types}")
+
+if __name__ == "__main__":
+    test_url_patterns()
+    test_page_stats()
+    test_format_bytes()
+    test_disable_images_blocks_by_url()
+    print("🎉 Resource blocking tests passed")
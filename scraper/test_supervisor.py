@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test in-run supervision of crashed browser sessions without launching a browser
+"""
+
+import logging
+from types import SimpleNamespace
+from selenium.common.exceptions import InvalidSessionIdException
+from supervisor import SessionSupervisor, summarize_restarts
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise InvalidSessionIdException("invalid session id")
+        return 1
+
+class FakeScraper:
+    """Just enough of TenderScraper: a driver, restart_browser and scrape_page"""
+
+    def __init__(self, crash_on):
+        self.driver = FakeDriver()
+        self.crash_on = set(crash_on)
+        self.opened = []
+
+    def restart_browser(self, url, reason=""):
+        self.driver = FakeDriver()
+        self.opened.append(url)
+
+    def scrape_page(self, page):
+        if page in self.crash_on:
+            self.crash_on.discard(page)
+            self.driver.alive = False
+            return None  # What scrape_page returns after a WebDriverException
+        if not self.driver.alive:
+            return None
+        return [{"id": f"{page}-0"}]
+
+def test_dead_session_is_respawned_and_page_retried():
+    scraper = FakeScraper(crash_on=[2, 4])
+    supervisor = SessionSupervisor(SimpleNamespace(search_url="https://search"), scraper, max_restarts=5)
+    results = {page: supervisor.fetch(scraper.scrape_page, page) for page in range(1, 6)}
+    print(f"✅ Supervisor report {supervisor.as_dict()}")
+    assert all(results[page] == [{"id": f"{page}-0"}] for page in range(1, 6))
+    assert supervisor.restarts == 2
+    assert scraper.opened == ["https://search", "https://search"]
+
+def test_live_session_failures_are_not_restarts():
+    scraper = FakeScraper(crash_on=[])
+    supervisor = SessionSupervisor(SimpleNamespace(search_url="https://search"), scraper)
+    assert supervisor.fetch(lambda page: None, 1) is None
+    assert supervisor.restarts == 0
+
+def test_restart_budget():
+    scraper = FakeScraper(crash_on=[1, 2])
+    scraper.restart_browser = lambda url, reason="": None  # Restarts that never bring the session back
+    supervisor = SessionSupervisor(SimpleNamespace(search_url="https://search"), scraper, max_restarts=2)
+    assert supervisor.fetch(scraper.scrape_page, 1) is None
+    assert supervisor.restarts == 2
+    assert summarize_restarts([supervisor.as_dict(), {"restarts": 1, "restart_seconds": 2.5}])["restarts"] == 3
+
+if __name__ == "__main__":
+    test_dead_session_is_respawned_and_page_retried()
+    test_live_session_failures_are_not_restarts()
+    test_restart_budget()
+    print("🎉 Supervisor tests passed")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test the shared AIMD throttle used by scraper workers
+"""
+
+import time
+import logging
+from contextlib import contextmanager
+from multiprocessing import Manager
+from config import SCRAPING_CONFIG
+from throttle import AdaptiveThrottle
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+@contextmanager
+def without_request_delay():
+    """Per-request jitter off for the duration of a test, restored afterwards"""
+    saved = SCRAPING_CONFIG.request_delay_min, SCRAPING_CONFIG.request_delay_max
+    SCRAPING_CONFIG.request_delay_min = SCRAPING_CONFIG.request_delay_max = 0.0
+    try:
+        yield
+    finally:
+        SCRAPING_CONFIG.request_delay_min, SCRAPING_CONFIG.request_delay_max = saved
+
+def test_additive_increase_multiplicative_decrease():
+    with without_request_delay(), Manager() as manager:
+        throttle = AdaptiveThrottle(manager, max_concurrency=4, initial_concurrency=1, requests_per_minute=60000)
+        for _ in range(6):
+            throttle.acquire()
+            throttle.release(latency=0.5, ok=True)
+        grown = int(throttle._state['limit'])
+        assert grown == 3, grown
+
+        throttle.acquire()
+        throttle.release(latency=30.0, ok=True)  # Slow page
+        assert int(throttle._state['limit']) == 1
+
+        # A second failure inside the cooldown does not halve again
+        throttle.acquire()
+        throttle.release(latency=1.0, ok=False)
+        print(f"✅ Throttle after growth and back-off: {throttle.summary()}")
+        assert throttle._state['decreases'] == 1
+        assert throttle._state['active'] == 0
+
+def test_shared_request_budget():
+    """Requests are spaced by 60 / requests_per_minute no matter how many slots are free"""
+    with without_request_delay(), Manager() as manager:
+        throttle = AdaptiveThrottle(manager, max_concurrency=4, initial_concurrency=4, requests_per_minute=600)
+        started = time.monotonic()
+        for _ in range(4):
+            throttle.acquire()
+        elapsed = time.monotonic() - started
+        print(f"✅ 4 requests at 600/min took {elapsed:.2f}s")
+        assert elapsed >= 0.3
+
+if __name__ == "__main__":
+    test_additive_increase_multiplicative_decrease()
+    test_shared_request_budget()
+    print("🎉 Throttle tests passed")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test the shared page queue used by the work-stealing scheduler
+"""
+
+import logging
+from multiprocessing import Manager
+from work_queue import PageWorkQueue
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s | %(levelname)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+def test_batches_and_retries():
+    """Failed pages go back on the queue until max_attempts, then are reported as failed"""
+    with Manager() as manager:
+        work_queue = PageWorkQueue(manager, range(1, 6), batch_size=2, max_attempts=2)
+        done = []
+        while True:
+            batch = work_queue.get_batch(timeout=0.1)
+            if batch is None:
+                break
+            for page in batch:
+                if page == 3:
+                    work_queue.retry(page)
+                else:
+                    work_queue.complete(page)
+                    done.append(page)
+
+        print(f"✅ Completed pages {done}, failed {work_queue.failed_pages()}")
+        assert sorted(done) == [1, 2, 4, 5]
+        assert work_queue.failed_pages() == [3]
+        assert work_queue.remaining() == 0
+
+if __name__ == "__main__":
+    test_batches_and_retries()
+    print("🎉 Work queue tests passed")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Adaptive concurrency controller shared by all scraper workers
+Enforces ScrapingConfig.requests_per_minute and the request delay range across processes, and
+adjusts how many workers may load pages at once AIMD-style: one more slot per healthy window,
+half the slots on timeouts, errors or slow pages
+"""
+
+import time
+import random
+import logging
+from typing import Any, Dict, Optional
+from config import SCRAPING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveThrottle:
+    """
+    Request budget and concurrency limit kept in multiprocessing.Manager proxies
+    Like PageWorkQueue it pickles cleanly, so pool tasks receive it as an argument
+    """
+
+    def __init__(self, manager, max_concurrency: int, initial_concurrency: Optional[int] = None,
+                 requests_per_minute: Optional[int] = None):
+        self.max_concurrency = max(1, max_concurrency)
+        initial = initial_concurrency or SCRAPING_CONFIG.throttle_initial_concurrency
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else (
+            60.0 / SCRAPING_CONFIG.requests_per_minute if SCRAPING_CONFIG.requests_per_minute else 0.0)
+        self._lock = manager.Lock()
+        self._state = manager.dict(
+            limit=float(min(max(1, initial), self.max_concurrency)), active=0, next_request_at=0.0,
+            last_decrease_at=0.0, peak=min(max(1, initial), self.max_concurrency),
+            pages=0, failures=0, slow_pages=0, decreases=0,
+        )
+
+    def acquire(self) -> None:
+        """Block until a concurrency slot and the next request in the shared budget are free"""
+        while not self.try_acquire():
+            time.sleep(SCRAPING_CONFIG.readiness_poll_interval)
+
+    def try_acquire(self) -> bool:
+        """
+        Take a concurrency slot if one is free right now (then wait for the request budget as acquire does)
+        Used when one worker already holds a slot and must not block on a second one
+        """
+        with self._lock:
+            state = self._state.copy()
+            if state['active'] >= int(state['limit']):
+                return False
+            start_at = max(time.time(), state['next_request_at'])
+            self._state.update(active=state['active'] + 1, next_request_at=start_at + self.interval)
+        delay = random.uniform(SCRAPING_CONFIG.request_delay_min, SCRAPING_CONFIG.request_delay_max)
+        time.sleep(max(0.0, start_at - time.time()) + delay)
+        return True
+
+    def release(self, latency: float, ok: bool) -> None:
+        """Give the slot back and adapt the limit to how the page went"""
+        slow = ok and latency > SCRAPING_CONFIG.throttle_slow_page_seconds
+        with self._lock:
+            state = self._state.copy()
+            update: Dict[str, Any] = {'active': max(0, state['active'] - 1), 'pages': state['pages'] + 1}
+            now = time.time()
+            if not ok or slow:
+                update['failures'] = state['failures'] + (not ok)
+                update['slow_pages'] = state['slow_pages'] + slow
+                # Pages already in flight when trouble starts report it too; back off once per cooldown
+                if now - state['last_decrease_at'] >= SCRAPING_CONFIG.throttle_cooldown_seconds:
+                    limit = max(1.0, state['limit'] * SCRAPING_CONFIG.throttle_decrease_factor)
+                    update.update(limit=limit, last_decrease_at=now, decreases=state['decreases'] + 1)
+                    logger.warning(f"🐢 {'Slow page' if ok else 'Failed page'} ({latency:.1f}s), "
+                                   f"concurrency limit down to {int(limit)}")
+            else:
+                # +1 slot after a full limit's worth of healthy pages
+                limit = min(float(self.max_concurrency), state['limit'] + 1.0 / state['limit'])
+                if int(limit) > int(state['limit']):
+                    logger.info(f"🚀 Concurrency limit up to {int(limit)}")
+                update.update(limit=limit, peak=max(state['peak'], int(limit)))
+            self._state.update(update)
+
+    def summary(self) -> str:
+        state = self._state.copy()
+        return (f"limit {int(state['limit'])}/{self.max_concurrency} (peak {state['peak']}), "
+                f"{state['pages']} pages, {state['failures']} failures, {state['slow_pages']} slow, "
+                f"{state['decreases']} back-offs, budget {60.0 / self.interval if self.interval else 0:.0f} req/min")
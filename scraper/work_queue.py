@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Work-stealing page scheduler for the zakup.sk.kz scraper
+Workers pull single pages (or small batches) from a shared queue instead of owning a fixed range,
+failed pages are re-queued, and per-worker throughput is reported
+"""
+
+import time
+import queue
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+from config import SCRAPING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class PageWorkQueue:
+    """
+    Shared page queue built on multiprocessing.Manager proxies
+    The object pickles cleanly, so it can be passed to Pool tasks (or threads) as an argument
+    """
+
+    def __init__(self, manager, pages: Iterable[int], batch_size: Optional[int] = None,
+                 max_attempts: Optional[int] = None):
+        self.batch_size = max(1, batch_size or SCRAPING_CONFIG.page_batch_size)
+        self.max_attempts = max(1, max_attempts or SCRAPING_CONFIG.page_max_attempts)
+        self._tasks = manager.Queue()
+        self._lock = manager.Lock()
+        self._attempts = manager.dict()
+        self._failed = manager.list()
+        self._state = manager.dict(remaining=0)
+        self.add_pages(pages)
+
+    def add_pages(self, pages: Iterable[int]) -> None:
+        """Queue more pages, in batches of batch_size"""
+        pages = list(pages)
+        with self._lock:
+            self._state['remaining'] = self._state['remaining'] + len(pages)
+        for i in range(0, len(pages), self.batch_size):
+            self._tasks.put(pages[i:i + self.batch_size])
+
+    def remaining(self) -> int:
+        """Pages that are queued or in progress"""
+        return self._state['remaining']
+
+    def get_batch(self, timeout: float = 1.0) -> Optional[List[int]]:
+        """
+        Next batch of pages, or None once every page is done
+        An empty queue is not the end while other workers may still re-queue failed pages
+        """
+        while True:
+            try:
+                return self._tasks.get(timeout=timeout)
+            except queue.Empty:
+                if self.remaining() <= 0:
+                    return None
+
+    def poll_batch(self, timeout: float = 0.1) -> Optional[List[int]]:
+        """
+        Next batch if one is queued within the timeout, else None
+        For workers that already hold pages: those keep remaining() above zero, so get_batch would wait for
+        them forever
+        """
+        try:
+            return self._tasks.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def complete(self, page: int) -> None:
+        with self._lock:
+            self._state['remaining'] = self._state['remaining'] - 1
+
+    def retry(self, page: int) -> bool:
+        """Re-queue a failed page for any worker; returns False when it has used up its attempts"""
+        with self._lock:
+            attempts = self._attempts.get(page, 0) + 1
+            self._attempts[page] = attempts
+            if attempts >= self.max_attempts:
+                self._failed.append(page)
+                self._state['remaining'] = self._state['remaining'] - 1
+                logger.error(f"❌ Giving up on page {page} after {attempts} attempts")
+                return False
+        self._tasks.put([page])
+        logger.warning(f"Re-queued page {page} (attempt {attempts + 1}/{self.max_attempts})")
+        return True
+
+    def failed_pages(self) -> List[int]:
+        return sorted(self._failed)
+
+
+class WorkerThroughput:
+    """Per-worker counters, returned to the coordinator when the worker finishes"""
+
+    def __init__(self, worker_id: int):
+        self.worker_id = worker_id
+        self.pages = 0
+        self.failures = 0
+        self.tenders = 0
+        self.recycles = 0
+        self.restarts = 0  # Browsers respawned after the session died
+        self.restart_seconds = 0.0
+        self._started = time.monotonic()
+
+    def as_dict(self) -> Dict[str, Any]:
+        seconds = time.monotonic() - self._started
+        return {
+            'worker_id': self.worker_id,
+            'pages': self.pages,
+            'failures': self.failures,
+            'tenders': self.tenders,
+            'recycles': self.recycles,
+            'restarts': self.restarts,
+            'restart_seconds': round(self.restart_seconds, 1),
+            'seconds': round(seconds, 1),
+            'pages_per_minute': round(self.pages / seconds * 60, 2) if seconds > 0 else 0.0,
+        }
+
+
+def log_throughput(reports: List[Dict[str, Any]]) -> None:
+    """Log one line per worker plus the spread between fastest and slowest"""
+    for report in sorted(reports, key=lambda r: r['worker_id']):
+        logger.info(f"👷 Worker {report['worker_id']}: {report['pages']} pages, {report['tenders']} tenders, "
+                    f"{report['failures']} failures, {report['recycles']} browser recycles, "
+                    f"{report['restarts']} restarts in {report['seconds']}s "
+                    f"({report['pages_per_minute']} pages/min)")
+    logger.info(f"♻️ Browser recycles this run: {sum(r['recycles'] for r in reports)}")
+    rates = [r['pages_per_minute'] for r in reports if r['pages']]
+    if rates:
+        logger.info(f"📈 Throughput: avg {sum(rates) / len(rates):.2f}, "
+                    f"min {min(rates):.2f}, max {max(rates):.2f} pages/min per worker")